@@ -0,0 +1,201 @@
+"""Headless engine benchmarks: cycles/sec, organisms/sec and memory versus population size.
+
+Run with ``python -m benchmarks.suite``. Every case runs in a fresh worker
+process so that peak RSS belongs to that case alone. Results are written as
+JSON; pass ``--compare`` with an earlier file to print speedups.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from constants.enums import CasteType, ThreatLevel
+from constants.settings import INITIAL_POPULATION
+from simulation import HiveSimulation, shard_caste_phases
+from simulation.core import STORES
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SIZES = (10 ** 2, 10 ** 4, 10 ** 5, 10 ** 6)
+# Default cycles per size, so that every case takes seconds rather than minutes
+CYCLES = {10 ** 2: 500, 10 ** 4: 50, 10 ** 5: 10, 10 ** 6: 3}
+
+
+def _steady(simulation: HiveSimulation) -> None:
+    pass
+
+
+def _threat_storm(simulation: HiveSimulation) -> None:
+    simulation.hive_state.threat_level = ThreatLevel.EXISTENTIAL
+
+
+def _queenless(simulation: HiveSimulation) -> None:
+    for queen in simulation._get_organisms_by_caste(CasteType.QUEEN):
+        simulation._remove_organism(queen)
+    simulation.hive_state.population[CasteType.QUEEN] = 0
+
+
+# Applied before every cycle and excluded from the timings
+SCENARIOS: Dict[str, Callable[[HiveSimulation], None]] = {
+    'steady': _steady,
+    'threat_storm': _threat_storm,
+    'queenless': _queenless,
+}
+
+
+def scaled_population(organisms: int) -> Dict[CasteType, int]:
+    """One queen plus the other castes in INITIAL_POPULATION proportions, ``organisms`` in total."""
+    others = {caste: count for caste, count in INITIAL_POPULATION.items() if caste != CasteType.QUEEN}
+    total = sum(others.values())
+    population = {caste: (organisms - 1) * count // total for caste, count in others.items()}
+    population[CasteType.WORKER] += organisms - 1 - sum(population.values())
+    population[CasteType.QUEEN] = 1
+    return population
+
+
+def peak_rss() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_case(organisms: int, scenario: str, store: str, cycles: int, seed: int,
+             profile: bool = False, shard_workers: int = 0) -> Dict[str, Any]:
+    perturb = SCENARIOS[scenario]
+    # Bytes per organism come from tracing allocations while the hive is built; RSS is too coarse for small hives
+    tracemalloc.start()
+    simulation = HiveSimulation(verbose=False, store=store, seed=seed, population=scaled_population(organisms),
+                                profile=profile)
+    hive_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Caste phases sharded across a pool of this many processes; 0 runs them in this process
+    pool = ProcessPoolExecutor(max_workers=shard_workers) if shard_workers else None
+    if pool is not None:
+        shard_caste_phases(simulation.pipeline, pool)
+
+    elapsed = 0.0
+    processed = 0
+    cycles_run = 0
+    population = simulation.hive_state.population
+    for _ in range(cycles):
+        perturb(simulation)
+        processed += sum(population.values())
+        started = time.perf_counter()
+        alive = simulation.simulate_cycle()
+        elapsed += time.perf_counter() - started
+        if not alive:
+            break
+        cycles_run += 1
+    if pool is not None:
+        pool.shutdown()
+
+    rss_peak = peak_rss()
+    result = {
+        'organisms': organisms,
+        'scenario': scenario,
+        'store': store,
+        'shard_workers': shard_workers,
+        'seed': seed,
+        'cycles': cycles_run,
+        'cycle_seconds': elapsed,
+        'cycles_per_second': cycles_run / elapsed if elapsed > 0 else None,
+        'organisms_per_second': processed / elapsed if elapsed > 0 else None,
+        'peak_rss_bytes': rss_peak,
+        'bytes_per_organism': hive_bytes / organisms,
+        'final_population': sum(population.values()),
+        'decision_cache': simulation.decisions.stats(),
+    }
+    if profile:
+        result['phases'] = simulation.profiler.percentiles()
+    return result
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(sizes: Tuple[int, ...] = SIZES, scenarios: Tuple[str, ...] = tuple(SCENARIOS),
+              stores: Tuple[str, ...] = ('object',), cycles: Optional[int] = None,
+              seed: int = 0, report: Callable[[Dict[str, Any]], None] = None,
+              profile: bool = False, shard_workers: int = 0) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = []
+    for store in stores:
+        for scenario in scenarios:
+            for organisms in sizes:
+                case_cycles = cycles if cycles is not None else CYCLES.get(organisms, 10)
+                # A fresh process per case keeps peak RSS from leaking between cases
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    result = pool.submit(run_case, organisms, scenario, store, case_cycles, seed,
+                                         profile, shard_workers).result()
+                results.append(result)
+                if report is not None:
+                    report(result)
+    return {
+        'commit': _commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': results,
+    }
+
+
+def _key(result: Dict[str, Any]) -> Tuple[int, str, str]:
+    return result['organisms'], result['scenario'], result['store']
+
+
+def _format(result: Dict[str, Any]) -> str:
+    line = (f"{result['store']:>6} {result['scenario']:>12} {result['organisms']:>8}: "
+            f"{result['cycles_per_second'] or 0:10.1f} cycles/s "
+            f"{result['organisms_per_second'] or 0:12.0f} organisms/s "
+            f"{result['bytes_per_organism']:7.0f} B/organism")
+    if result['peak_rss_bytes'] is not None:
+        line += f" {result['peak_rss_bytes'] / 2 ** 20:8.1f} MiB peak RSS"
+    return line
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark the hive engine headless at fixed seeds.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help="organisms per hive")
+    parser.add_argument('--scenarios', nargs='+', choices=tuple(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--stores', nargs='+', choices=STORES, default=['object'])
+    parser.add_argument('--cycles', type=int, default=None, help="cycles per case (default: by size)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--shard-workers', type=int, default=0,
+                        help="shard caste phases across a pool of this many processes")
+    parser.add_argument('--profile', action='store_true', help="record per-phase timing percentiles")
+    parser.add_argument('--output', default='benchmark-results.json', help="JSON results file")
+    parser.add_argument('--compare', default=None, help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    suite = run_suite(tuple(args.sizes), tuple(args.scenarios), tuple(args.stores),
+                      args.cycles, args.seed, report=lambda result: print(_format(result)),
+                      profile=args.profile, shard_workers=args.shard_workers)
+    with open(args.output, 'w') as f:
+        json.dump(suite, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {_key(result): result for result in json.load(f)['results']}
+        print(f"\nSpeedup versus {args.compare}:")
+        for result in suite['results']:
+            before = baseline.get(_key(result))
+            if before and before['cycles_per_second'] and result['cycles_per_second']:
+                print(f"{result['store']:>6} {result['scenario']:>12} {result['organisms']:>8}: "
+                      f"{result['cycles_per_second'] / before['cycles_per_second']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
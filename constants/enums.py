@@ -14,4 +14,16 @@ class CasteType(Enum):
     CLEANER = "Cleaner"
     BREEDER = "Breeder"
     BIO_ARCHITECT = "Bio-Architect"
-    CEREBRAL = "Cerebral"
\ No newline at end of file
+    CEREBRAL = "Cerebral"
+
+class Priority(Enum):
+    INCREASE_WORKERS = "increase_workers"
+    REDUCE_WORKERS = "reduce_workers"
+    INCREASE_CLEANERS = "increase_cleaners"
+    INCREASE_SOLDIERS = "increase_soldiers"
+    INCREASE_BIO_ARCHITECTS = "increase_bio_architects"
+    INCREASE_BREEDERS = "increase_breeders"
+    INCREASE_QUEENS = "increase_queens"
+    EMERGENCY_WORKERS = "emergency_workers"
+    EMERGENCY_ALL = "emergency_all"
+    EMERGENCY_SOLDIERS = "emergency_soldiers"
\ No newline at end of file
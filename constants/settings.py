@@ -28,4 +28,18 @@ INITIAL_HIVE_STATE = {
     'waste_level': 0,
     'threat_level': ThreatLevel.NONE,
     'structural_integrity': 100
+}
+
+# Queen decision thresholds, compiled into entities.policy.QueenPolicy
+QUEEN_POLICY = {
+    'low_food': 30,
+    'high_food': 80,
+    'high_waste': 70,
+    'soldier_threat': ThreatLevel.MEDIUM.value,
+    'low_integrity': 50,
+    'small_population': 20,
+    'critical_population': 5,
+    'min_workers': 2,
+    'min_soldiers': 3,
+    'succession_age': 0.9  # Fraction of the queen's lifespan
 }
\ No newline at end of file
@@ -7,9 +7,10 @@ from .castes.cleaner import Cleaner
 from .castes.breeder import Breeder
 from .castes.bio_architect import BioArchitect
 from .castes.cerebral import CerebralCaste
+from .registry import CasteSpec, CASTE_REGISTRY, register_caste
 
 __all__ = [
     'Organism', 'HiveState', 'Queen', 'Worker', 
     'Soldier', 'Cleaner', 'Breeder', 'BioArchitect', 
-    'CerebralCaste'
+    'CerebralCaste', 'CasteSpec', 'CASTE_REGISTRY', 'register_caste'
 ]
\ No newline at end of file
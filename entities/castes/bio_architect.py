@@ -1,15 +1,62 @@
+from typing import Dict, Iterable, Tuple
 from ..base import Organism
 from constants.enums import CasteType
 import random
+from ..hive_state import HiveState
+from ..sampling import uniform_counts
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class BioArchitect(Organism):
+    __slots__ = ()
+    
     def __init__(self, organism_id: int, age: int = 0):
         super().__init__(CasteType.BIO_ARCHITECT, organism_id, age)
         
-    def maintain_structure(self, current_integrity: int) -> int:
+    def maintain_structure(self, current_integrity: int, rng: random.Random = random) -> int:
         if not self.active:
             return current_integrity
+        return self.repair_at(self.get_effectiveness(), current_integrity, rng)
+    
+    @staticmethod
+    def repair_at(effectiveness: float, current_integrity: int, rng: random.Random = random) -> int:
+        repair_amount = int(rng.randint(5, 12) * effectiveness)
+        return min(100, current_integrity + repair_amount)
+    
+    @classmethod
+    def maintain_structure_batch(cls, members: Iterable['BioArchitect'], hive_state: 'HiveState',
+                                 rng: random.Random = random) -> Dict[str, int]:
+        return cls.repair_batch_at([m.get_effectiveness() for m in members if m.active], hive_state, rng)
+    
+    @staticmethod
+    def repair_batch_at(effectiveness_values: Iterable[float], hive_state: 'HiveState',
+                        rng: random.Random = random) -> Dict[str, int]:
+        """Summed ``repair_at``. Capping the total at 100 matches capping after each repair."""
+        randint = rng.randint
+        repair_amount = 0
+        for effectiveness in effectiveness_values:
+            repair_amount += int(randint(5, 12) * effectiveness)
             
-        effectiveness = self.get_effectiveness()
-        repair_amount = int(random.randint(5, 12) * effectiveness)
-        return min(100, current_integrity + repair_amount)
\ No newline at end of file
+        repair_applied = min(100, hive_state.structural_integrity + repair_amount) - hive_state.structural_integrity
+        return {'repair_applied': max(0, repair_applied)}
+    
+    @staticmethod
+    def repair_array_at(effectiveness: 'np.ndarray', hive_state: 'HiveState',
+                        rng: 'np.random.Generator') -> Dict[str, int]:
+        repair_amount = int((rng.integers(5, 13, len(effectiveness)) * effectiveness).astype(np.int64).sum())
+        repair_applied = min(100, hive_state.structural_integrity + repair_amount) - hive_state.structural_integrity
+        return {'repair_applied': max(0, repair_applied)}
+    
+    @staticmethod
+    def repair_cohorts_at(cohorts: Iterable[Tuple[float, int]], hive_state: 'HiveState',
+                          rng: random.Random = random) -> Dict[str, int]:
+        repair_amount = 0
+        for effectiveness, count in cohorts:
+            for roll, drawn in enumerate(uniform_counts(rng, count, 5, 12), 5):
+                repair_amount += drawn * int(roll * effectiveness)
+                
+        repair_applied = min(100, hive_state.structural_integrity + repair_amount) - hive_state.structural_integrity
+        return {'repair_applied': max(0, repair_applied)}
\ No newline at end of file
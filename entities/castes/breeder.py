@@ -1,67 +1,78 @@
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 from ..base import Organism
 from constants.enums import CasteType
-from ..castes.worker import Worker
-from ..castes.soldier import Soldier
-from ..castes.cleaner import Cleaner
-from ..castes.bio_architect import BioArchitect
-from ..castes.queen import Queen
 import random
 
 class Breeder(Organism):
+    __slots__ = ('breeding_cooldown',)
+    
     def __init__(self, organism_id: int, age: int = 0):
         super().__init__(CasteType.BREEDER, organism_id, age)
         self.breeding_cooldown = 0
         
-    def spawn_organisms(self, genetic_instructions: Dict[CasteType, int], current_cycle: int, living_queens_count: int = 1) -> List[Organism]:
+    @classmethod
+    def restore_cohort(cls, *args, **kwargs) -> Dict[int, Organism]:
+        cohort = super().restore_cohort(*args, **kwargs)
+        for organism in cohort.values():
+            organism.breeding_cooldown = 0
+        return cohort
+        
+    def spawn_organisms(self, genetic_instructions: Dict[CasteType, int], current_cycle: int, living_queens_count: int = 1,
+                        rng: random.Random = random,
+                        spawn: Optional[Callable[[CasteType, int], Organism]] = None) -> List[Organism]:
+        """Breed up to this breeder's capacity. ``spawn(caste_type, birth_cycle)`` creates each
+        organism with its final id; without one, organisms get id 0 for the caller to assign."""
+        if spawn is None:
+            spawn = self._new_organism
+        offspring = self.breed(genetic_instructions, living_queens_count, rng)
+        return [spawn(caste_type, current_cycle) for caste_type, count in offspring.items() for _ in range(count)]
+    
+    def breed(self, genetic_instructions: Dict[CasteType, int], living_queens_count: int = 1,
+              rng: random.Random = random) -> Dict[CasteType, int]:
+        """One breeding turn as counts per caste, for callers that create the organisms in bulk."""
         if not self.active or self.breeding_cooldown > 0:
             if self.breeding_cooldown > 0:
                 self.breeding_cooldown -= 1
-            return []
+            return {}
             
-        new_organisms = []
-        organism_counter = 1000 + random.randint(1, 999)
-        effectiveness = self.get_effectiveness()
+        offspring = self.offspring_at(self.get_effectiveness(), genetic_instructions, living_queens_count)
+        if offspring:
+            self.breeding_cooldown = rng.randint(1, 3)
+        return offspring
+    
+    @staticmethod
+    def offspring_at(effectiveness: float, genetic_instructions: Dict[CasteType, int],
+                     living_queens_count: int = 1) -> Dict[CasteType, int]:
+        """How many of each caste a ready breeder at ``effectiveness`` produces, in spawn order."""
         breeding_capacity = max(1, int(3 * effectiveness))
         total_to_spawn = min(breeding_capacity, sum(genetic_instructions.values()))
         
+        offspring = {}
         spawned_count = 0
         for caste_type, count in genetic_instructions.items():
             if spawned_count >= total_to_spawn:
                 break
             
-            if caste_type == CasteType.QUEEN:
-                if living_queens_count > 0:
-                    print(f"👑 BLOCKED: Cannot spawn new queen while {living_queens_count} queen(s) still alive")
-                    continue
-                else:
-                    print("👑 EMERGENCY SUCCESSION: Spawning new queen as hive is queenless!")
+            # Queens are only bred into a queenless hive
+            if caste_type == CasteType.QUEEN and living_queens_count > 0:
+                continue
                 
             actual_count = min(count, total_to_spawn - spawned_count)
             actual_count = max(0, int(actual_count * effectiveness))
             
-            for _ in range(actual_count):
-                new_org = None
-                if caste_type == CasteType.WORKER:
-                    new_org = Worker(organism_counter)
-                elif caste_type == CasteType.SOLDIER:
-                    new_org = Soldier(organism_counter)
-                elif caste_type == CasteType.CLEANER:
-                    new_org = Cleaner(organism_counter)
-                elif caste_type == CasteType.BIO_ARCHITECT:
-                    new_org = BioArchitect(organism_counter)
-                elif caste_type == CasteType.QUEEN:
-                    new_org = Queen(organism_counter)
-                elif caste_type == CasteType.BREEDER:
-                    new_org = Breeder(organism_counter)
-                    
-                if new_org:
-                    new_org.birth_cycle = current_cycle
-                    new_organisms.append(new_org)
-                    organism_counter += 1
-                    spawned_count += 1
-        
-        if new_organisms:
-            self.breeding_cooldown = random.randint(1, 3)
-                
-        return new_organisms
\ No newline at end of file
+            # Breeders never produce cerebral organisms
+            if caste_type == CasteType.CEREBRAL or actual_count == 0:
+                continue
+            
+            offspring[caste_type] = actual_count
+            spawned_count += actual_count
+            
+        return offspring
+    
+    @staticmethod
+    def _new_organism(caste_type: CasteType, birth_cycle: int) -> Organism:
+        # Imported here: the registry imports this module
+        from ..registry import CASTE_REGISTRY
+        new_org = CASTE_REGISTRY[caste_type].create(0)
+        new_org.birth_cycle = birth_cycle
+        return new_org
\ No newline at end of file
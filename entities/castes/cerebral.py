@@ -4,6 +4,8 @@ from constants.enums import CasteType, ThreatLevel
 from ..hive_state import HiveState
 
 class CerebralCaste(Organism):
+    __slots__ = ()
+    
     def __init__(self, organism_id: int, age: int = 0):
         super().__init__(CasteType.CEREBRAL, organism_id, age)
         
@@ -1,21 +1,84 @@
-from typing import Dict
+from typing import Dict, Iterable, Tuple
 from ..base import Organism
 from constants.enums import CasteType
 import random
+from ..hive_state import HiveState
+from ..sampling import uniform_counts
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class Cleaner(Organism):
+    __slots__ = ()
+    
     def __init__(self, organism_id: int, age: int = 0):
         super().__init__(CasteType.CLEANER, organism_id, age)
         
-    def process_waste(self, waste_amount: int) -> Dict[str, int]:
+    def process_waste(self, waste_amount: int, rng: random.Random = random) -> Dict[str, int]:
         if not self.active:
             return {'waste_processed': 0, 'biomass_recycled': 0}
-            
-        effectiveness = self.get_effectiveness()
-        processed = int(min(waste_amount, random.randint(8, 15)) * effectiveness)
+        return self.processing_at(self.get_effectiveness(), waste_amount, rng)
+    
+    @staticmethod
+    def processing_at(effectiveness: float, waste_amount: int, rng: random.Random = random) -> Dict[str, int]:
+        processed = int(min(waste_amount, rng.randint(8, 15)) * effectiveness)
         biomass_recycled = processed // 2
         
         return {
             'waste_processed': processed,
             'biomass_recycled': biomass_recycled
+        }
+    
+    @classmethod
+    def process_waste_batch(cls, members: Iterable['Cleaner'], hive_state: 'HiveState',
+                            rng: random.Random = random) -> Dict[str, int]:
+        return cls.processing_batch_at([m.get_effectiveness() for m in members if m.active], hive_state, rng)
+    
+    @staticmethod
+    def processing_batch_at(effectiveness_values: Iterable[float], hive_state: 'HiveState',
+                            rng: random.Random = random) -> Dict[str, int]:
+        """Summed ``processing_at``; every cleaner sees the waste level at the start of the phase."""
+        randint = rng.randint
+        waste_amount = hive_state.waste_level
+        waste_processed = 0
+        biomass_recycled = 0
+        
+        for effectiveness in effectiveness_values:
+            processed = int(min(waste_amount, randint(8, 15)) * effectiveness)
+            waste_processed += processed
+            biomass_recycled += processed // 2
+            
+        return {
+            'waste_processed': waste_processed,
+            'biomass_recycled': biomass_recycled
+        }
+    
+    @staticmethod
+    def processing_array_at(effectiveness: 'np.ndarray', hive_state: 'HiveState',
+                            rng: 'np.random.Generator') -> Dict[str, int]:
+        rolls = np.minimum(hive_state.waste_level, rng.integers(8, 16, len(effectiveness)))
+        processed = (rolls * effectiveness).astype(np.int64)
+        return {
+            'waste_processed': int(processed.sum()),
+            'biomass_recycled': int((processed // 2).sum())
+        }
+    
+    @staticmethod
+    def processing_cohorts_at(cohorts: Iterable[Tuple[float, int]], hive_state: 'HiveState',
+                              rng: random.Random = random) -> Dict[str, int]:
+        waste_amount = hive_state.waste_level
+        waste_processed = 0
+        biomass_recycled = 0
+        
+        for effectiveness, count in cohorts:
+            for capacity, drawn in enumerate(uniform_counts(rng, count, 8, 15), 8):
+                processed = int(min(waste_amount, capacity) * effectiveness)
+                waste_processed += drawn * processed
+                biomass_recycled += drawn * (processed // 2)
+                
+        return {
+            'waste_processed': waste_processed,
+            'biomass_recycled': biomass_recycled
         }
\ No newline at end of file
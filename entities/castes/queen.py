@@ -1,101 +1,46 @@
-from typing import Dict, Any
+from typing import Dict, Mapping, Optional, Tuple, Union
 from ..base import Organism
-from constants.enums import CasteType
+from constants.enums import CasteType, Priority
 from ..hive_state import HiveState
-from constants.enums import ThreatLevel
+from ..policy import QueenPolicy, DecisionCache
+
+# Compiled from the settings at import; pass a freshly compiled policy to use edited thresholds
+DEFAULT_POLICY = QueenPolicy()
 
 class Queen(Organism):
+    __slots__ = ('genetic_blueprints',)
+    
     def __init__(self, organism_id: int, age: int = 0):
         super().__init__(CasteType.QUEEN, organism_id, age)
         self.genetic_blueprints = {}
         
-    def process_stimuli(self, hive_state: 'HiveState', living_queens_count: int = 1) -> Dict[str, Any]:
+    @classmethod
+    def restore_cohort(cls, *args, **kwargs) -> Dict[int, Organism]:
+        cohort = super().restore_cohort(*args, **kwargs)
+        for organism in cohort.values():
+            organism.genetic_blueprints = {}
+        return cohort
+        
+    def process_stimuli(self, hive_state: 'HiveState', living_queens_count: int = 1,
+                        policy: Optional[QueenPolicy] = None) -> Dict[Priority, int]:
         if not self.active:
             return {}
-            
-        priorities = {}
-        effectiveness = self.get_effectiveness()
-        
-        if hive_state.food_level < 30:
-            priorities['increase_workers'] = int(3 * effectiveness)
-        elif hive_state.food_level > 80:
-            priorities['reduce_workers'] = 1
-            
-        if hive_state.waste_level > 70:
-            priorities['increase_cleaners'] = int(2 * effectiveness)
-            
-        if hive_state.threat_level.value >= 2:
-            priorities['increase_soldiers'] = int(hive_state.threat_level.value * effectiveness)
-            
-        if hive_state.structural_integrity < 50:
-            priorities['increase_bio_architects'] = int(2 * effectiveness)
-            
-        total_population = sum(hive_state.population.values())
-        if total_population < 20:
-            priorities['increase_workers'] = priorities.get('increase_workers', 0) + 2
-            priorities['increase_breeders'] = 1
-            
-        if living_queens_count == 0:
-            priorities['increase_queens'] = 1
-            print("👑 SUCCESSION TRIGGERED: No living queens, spawning successor!")
-        elif self.age > self.max_lifespan * 0.9 and living_queens_count == 1:
-            priorities['increase_queens'] = 1
-            print(f"👑 SUCCESSION PREPARATION: Queen {self.id} preparing successor (age {self.age}/{self.max_lifespan})")
-
-        # EMERGENCY POPULATION FIXES:
-    # Critical worker shortage (below 20% of initial population)
-        if hive_state.population[CasteType.WORKER] < 2:  # Absolute minimum
-            priorities['emergency_workers'] = 3  # Max priority spawning
-            print("🚨 EMERGENCY: Critical worker shortage detected!")
+        if policy is None:
+            policy = DEFAULT_POLICY
+        return policy.priorities(hive_state, self.get_effectiveness(), self.age, self.max_lifespan,
+                                 living_queens_count)
     
-    # If total population is dangerously low (below 5 organisms)
-        total_pop = sum(hive_state.population.values())
-        if total_pop < 5:
-            priorities['emergency_all'] = 1
-            print("🚨 EMERGENCY: Population collapse imminent!")
-
-        current_soldiers = hive_state.population.get(CasteType.SOLDIER, 0)
-
-        if hive_state.threat_level.value >= ThreatLevel.MEDIUM.value:
-            current_soldiers = hive_state.population[CasteType.SOLDIER]
-        if current_soldiers == 0:
-            priorities['emergency_soldiers'] = 3  # Immediate soldier spawn
-            print("🚨 EMERGENCY: No soldiers during threat!")
-        elif current_soldiers < 3:  # Minimum soldier threshold
-            priorities['increase_soldiers'] = 3 - current_soldiers
-    
-        return priorities
+    def decide(self, hive_state: 'HiveState', living_queens_count: int = 1,
+               policy: Union[QueenPolicy, DecisionCache, None] = None
+               ) -> Tuple[Mapping[Priority, int], Mapping[CasteType, int]]:
+        """``process_stimuli`` and ``generate_genetic_instructions`` in one call."""
+        if not self.active:
+            return {}, {}
+        if policy is None:
+            policy = DEFAULT_POLICY
+        return policy.decide(hive_state, self.get_effectiveness(), self.age, self.max_lifespan, living_queens_count)
     
-    def generate_genetic_instructions(self, priorities: Dict[str, Any]) -> Dict[CasteType, int]:
+    def generate_genetic_instructions(self, priorities: Dict[Priority, int]) -> Dict[CasteType, int]:
         if not self.active:
             return {}
-            
-        spawn_orders = {}
-        
-        for priority, urgency in priorities.items():
-            if urgency <= 0:
-                continue
-                
-            if 'increase_workers' in priority:
-                spawn_orders[CasteType.WORKER] = urgency
-            elif 'increase_cleaners' in priority:
-                spawn_orders[CasteType.CLEANER] = urgency
-            elif 'increase_soldiers' in priority:
-                spawn_orders[CasteType.SOLDIER] = urgency
-            elif 'increase_bio_architects' in priority:
-                spawn_orders[CasteType.BIO_ARCHITECT] = urgency
-            elif 'increase_queens' in priority:
-                spawn_orders[CasteType.QUEEN] = urgency
-            elif 'increase_breeders' in priority:
-                spawn_orders[CasteType.BREEDER] = urgency
-            elif 'emergency_workers' in priority:
-                spawn_orders[CasteType.WORKER] = max(3, urgency)  # Minimum 3 workers
-            elif 'emergency_all' in priority:
-            # Emergency baseline population
-                spawn_orders.update({
-                    CasteType.WORKER: 2,
-                    CasteType.CLEANER: 1,
-                    CasteType.SOLDIER: 1
-                })
-
-        return spawn_orders
\ No newline at end of file
+        return QueenPolicy.instructions(priorities)
\ No newline at end of file
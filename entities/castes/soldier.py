@@ -1,15 +1,71 @@
+from typing import Dict, Iterable, Tuple
 from ..base import Organism
 from constants.enums import CasteType, ThreatLevel
 import random
+from ..hive_state import HiveState
+from ..sampling import uniform_counts
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class Soldier(Organism):
+    __slots__ = ()
+    
     def __init__(self, organism_id: int, age: int = 0):
         super().__init__(CasteType.SOLDIER, organism_id, age)
         
-    def defend_hive(self, threat_level: ThreatLevel) -> int:
-        if not self.active or threat_level == ThreatLevel.NONE:
+    def defend_hive(self, threat_level: ThreatLevel, rng: random.Random = random) -> int:
+        if not self.active:
+            return 0
+        return self.defense_at(self.get_effectiveness(), threat_level, rng)
+    
+    @staticmethod
+    def defense_at(effectiveness: float, threat_level: ThreatLevel, rng: random.Random = random) -> int:
+        if threat_level == ThreatLevel.NONE:
             return 0
             
-        effectiveness = self.get_effectiveness()
-        defense_power = int(random.randint(5, 15) * threat_level.value * effectiveness)
-        return defense_power
\ No newline at end of file
+        defense_power = int(rng.randint(5, 15) * threat_level.value * effectiveness)
+        return defense_power
+    
+    @classmethod
+    def defend_hive_batch(cls, members: Iterable['Soldier'], hive_state: 'HiveState',
+                          rng: random.Random = random) -> Dict[str, int]:
+        return cls.defense_batch_at([m.get_effectiveness() for m in members if m.active], hive_state, rng)
+    
+    @staticmethod
+    def defense_batch_at(effectiveness_values: Iterable[float], hive_state: 'HiveState',
+                         rng: random.Random = random) -> Dict[str, int]:
+        threat_value = hive_state.threat_level.value
+        if threat_value == 0:
+            return {'defense_power': 0}
+            
+        randint = rng.randint
+        defense_power = 0
+        for effectiveness in effectiveness_values:
+            defense_power += int(randint(5, 15) * threat_value * effectiveness)
+        return {'defense_power': defense_power}
+    
+    @staticmethod
+    def defense_array_at(effectiveness: 'np.ndarray', hive_state: 'HiveState',
+                         rng: 'np.random.Generator') -> Dict[str, int]:
+        threat_value = hive_state.threat_level.value
+        if threat_value == 0:
+            return {'defense_power': 0}
+            
+        rolls = rng.integers(5, 16, len(effectiveness))
+        return {'defense_power': int((rolls * threat_value * effectiveness).astype(np.int64).sum())}
+    
+    @staticmethod
+    def defense_cohorts_at(cohorts: Iterable[Tuple[float, int]], hive_state: 'HiveState',
+                           rng: random.Random = random) -> Dict[str, int]:
+        threat_value = hive_state.threat_level.value
+        if threat_value == 0:
+            return {'defense_power': 0}
+            
+        defense_power = 0
+        for effectiveness, count in cohorts:
+            for roll, drawn in enumerate(uniform_counts(rng, count, 5, 15), 5):
+                defense_power += drawn * int(roll * threat_value * effectiveness)
+        return {'defense_power': defense_power}
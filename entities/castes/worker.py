@@ -1,26 +1,103 @@
-from typing import Dict
+from typing import Dict, Any, Iterable, Tuple
 from ..base import Organism
 from constants.enums import CasteType, ThreatLevel
 import random
 from ..hive_state import HiveState
+from ..sampling import binomial, uniform_counts
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class Worker(Organism):
+    __slots__ = ()
+    
     def __init__(self, organism_id: int, age: int = 0):
         super().__init__(CasteType.WORKER, organism_id, age)
         
-    def execute_tasks(self, hive_state: 'HiveState') -> Dict[str, int]:
+    def execute_tasks(self, hive_state: 'HiveState', rng: random.Random = random) -> Dict[str, int]:
         if not self.active:
             return {}
-            
+        return self.tasks_at(self.get_effectiveness(), hive_state, rng)
+    
+    @staticmethod
+    def tasks_at(effectiveness: float, hive_state: 'HiveState', rng: random.Random = random) -> Dict[str, int]:
         results = {}
-        effectiveness = self.get_effectiveness()
-        food_gathered = int(random.randint(3, 8) * effectiveness)
+        food_gathered = int(rng.randint(3, 8) * effectiveness)
         results['food_gathered'] = food_gathered
         
         detection_skill = 0.1 * effectiveness
-        threat_detected = random.random() < detection_skill
+        threat_detected = rng.random() < detection_skill
         if threat_detected:
-            results['threat_detected'] = random.choice([ThreatLevel.LOW, ThreatLevel.MEDIUM])
+            results['threat_detected'] = rng.choice([ThreatLevel.LOW, ThreatLevel.MEDIUM])
+            
+        results['waste_generated'] = rng.randint(1, 3)
+        return results
+    
+    @classmethod
+    def execute_tasks_batch(cls, members: Iterable['Worker'], hive_state: 'HiveState',
+                            rng: random.Random = random) -> Dict[str, Any]:
+        return cls.tasks_batch_at([m.get_effectiveness() for m in members if m.active], hive_state, rng)
+    
+    @staticmethod
+    def tasks_batch_at(effectiveness_values: Iterable[float], hive_state: 'HiveState',
+                       rng: random.Random = random) -> Dict[str, Any]:
+        """Summed ``tasks_at`` over a whole caste; ``threat_detected`` is the highest level seen."""
+        randint = rng.randint
+        rand = rng.random
+        food_gathered = 0
+        waste_generated = 0
+        threat_detected = None
+        
+        for effectiveness in effectiveness_values:
+            food_gathered += int(randint(3, 8) * effectiveness)
+            if rand() < 0.1 * effectiveness:
+                detected = rng.choice([ThreatLevel.LOW, ThreatLevel.MEDIUM])
+                if threat_detected is None or detected.value > threat_detected.value:
+                    threat_detected = detected
+            waste_generated += randint(1, 3)
             
-        results['waste_generated'] = random.randint(1, 3)
+        results = {'food_gathered': food_gathered, 'waste_generated': waste_generated}
+        if threat_detected is not None:
+            results['threat_detected'] = threat_detected
+        return results
+    
+    @staticmethod
+    def tasks_array_at(effectiveness: 'np.ndarray', hive_state: 'HiveState',
+                       rng: 'np.random.Generator') -> Dict[str, Any]:
+        """``tasks_batch_at`` over an array of effectiveness values, drawing with a numpy generator."""
+        n = len(effectiveness)
+        food_gathered = (rng.integers(3, 9, n) * effectiveness).astype(np.int64).sum()
+        detections = np.count_nonzero(rng.random(n) < 0.1 * effectiveness)
+        waste_generated = rng.integers(1, 4, n).sum()
+        
+        results = {'food_gathered': int(food_gathered), 'waste_generated': int(waste_generated)}
+        if detections:
+            # Each detection is LOW or MEDIUM with equal odds; only the highest is reported
+            medium = rng.random() >= 0.5 ** int(detections)
+            results['threat_detected'] = ThreatLevel.MEDIUM if medium else ThreatLevel.LOW
+        return results
+    
+    @staticmethod
+    def tasks_cohorts_at(cohorts: Iterable[Tuple[float, int]], hive_state: 'HiveState',
+                         rng: random.Random = random) -> Dict[str, Any]:
+        """``tasks_batch_at`` for ``(effectiveness, count)`` cohorts, drawing per-value counts
+        instead of per-organism values."""
+        food_gathered = 0
+        waste_generated = 0
+        detections = 0
+        
+        for effectiveness, count in cohorts:
+            for amount, drawn in enumerate(uniform_counts(rng, count, 3, 8), 3):
+                food_gathered += drawn * int(amount * effectiveness)
+            detections += binomial(rng, count, 0.1 * effectiveness)
+            for amount, drawn in enumerate(uniform_counts(rng, count, 1, 3), 1):
+                waste_generated += drawn * amount
+                
+        results = {'food_gathered': food_gathered, 'waste_generated': waste_generated}
+        if detections:
+            # Each detection is LOW or MEDIUM with equal odds; only the highest is reported
+            medium = rng.random() >= 0.5 ** detections
+            results['threat_detected'] = ThreatLevel.MEDIUM if medium else ThreatLevel.LOW
         return results
\ No newline at end of file
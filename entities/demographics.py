@@ -0,0 +1,67 @@
+from typing import Dict
+from constants.enums import CasteType
+from constants.settings import LIFESPANS
+
+
+def effectiveness_at(aging_factor: float) -> float:
+    if aging_factor <= 0.3:
+        return 0.7 + (aging_factor / 0.3) * 0.3
+    elif aging_factor <= 0.7:
+        return 1.0
+    else:
+        decline = (aging_factor - 0.7) / 0.3
+        return 1.0 - (decline * 0.4)
+
+
+def energy_at(aging_factor: float) -> float:
+    if aging_factor > 0.7:
+        decline = (aging_factor - 0.7) * 100
+        return max(20, 100 - decline)
+    return 100
+
+
+def death_chance_at(age: int, lifespan: int) -> float:
+    """Chance that an organism which has just reached ``age`` dies this cycle."""
+    if age >= lifespan:
+        return 1.0
+    return 0.001 + (age / lifespan) * 0.01
+
+
+class AgeCurves:
+    """Precomputed per-age curves for one lifespan, indexed by age 0..lifespan."""
+
+    def __init__(self, lifespan: int):
+        self.lifespan = lifespan
+        ages = range(lifespan + 1)
+        self.effectiveness = [effectiveness_at(age / lifespan) for age in ages]
+        self.energy = [energy_at(age / lifespan) for age in ages]
+        self.death_chance = [death_chance_at(age, lifespan) for age in ages]
+
+
+_curves: Dict[int, AgeCurves] = {}
+
+
+def curves_for(lifespan: int) -> AgeCurves:
+    """Curves for a lifespan, built on first use.
+
+    Tables are keyed by lifespan rather than caste, so editing ``LIFESPANS``
+    simply routes newly created organisms to a different table.
+    """
+    curves = _curves.get(lifespan)
+    if curves is None:
+        curves = _curves[lifespan] = AgeCurves(lifespan)
+    return curves
+
+
+def caste_curves(caste_type: CasteType) -> AgeCurves:
+    return curves_for(LIFESPANS[caste_type])
+
+
+def rebuild_tables() -> None:
+    """Drop every cached table and precompute the ones the current settings use."""
+    _curves.clear()
+    for lifespan in LIFESPANS.values():
+        curves_for(lifespan)
+
+
+rebuild_tables()
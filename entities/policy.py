@@ -0,0 +1,262 @@
+from collections import OrderedDict
+from itertools import count
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+from constants.enums import CasteType, Priority
+from constants.settings import QUEEN_POLICY
+from .hive_state import HiveState
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Spawn orders each priority turns into, as (caste, urgency multiplier, minimum order)
+SPAWN_RULES: Dict[Priority, Tuple[Tuple[CasteType, int, int], ...]] = {
+    Priority.INCREASE_WORKERS: ((CasteType.WORKER, 1, 0),),
+    Priority.REDUCE_WORKERS: (),
+    Priority.INCREASE_CLEANERS: ((CasteType.CLEANER, 1, 0),),
+    Priority.INCREASE_SOLDIERS: ((CasteType.SOLDIER, 1, 0),),
+    Priority.INCREASE_BIO_ARCHITECTS: ((CasteType.BIO_ARCHITECT, 1, 0),),
+    Priority.INCREASE_BREEDERS: ((CasteType.BREEDER, 1, 0),),
+    Priority.INCREASE_QUEENS: ((CasteType.QUEEN, 1, 0),),
+    Priority.EMERGENCY_WORKERS: ((CasteType.WORKER, 1, 3),),
+    # A fixed baseline population, whatever the urgency
+    Priority.EMERGENCY_ALL: ((CasteType.WORKER, 0, 2), (CasteType.CLEANER, 0, 1), (CasteType.SOLDIER, 0, 1)),
+    # Only an alert; the minimum-soldier rule raises INCREASE_SOLDIERS when some soldiers remain
+    Priority.EMERGENCY_SOLDIERS: (),
+}
+
+EMERGENCY_PRIORITIES = frozenset({Priority.EMERGENCY_WORKERS, Priority.EMERGENCY_ALL, Priority.EMERGENCY_SOLDIERS})
+
+# Priorities announced as QueenAlert events
+ALERT_PRIORITIES = (Priority.INCREASE_QUEENS, Priority.EMERGENCY_WORKERS, Priority.EMERGENCY_ALL,
+                    Priority.EMERGENCY_SOLDIERS)
+
+
+class QueenPolicy:
+    """Queen decision rules with the thresholds from ``QUEEN_POLICY`` compiled in.
+
+    ``priorities`` and ``instructions`` decide for one queen; the ``*_batch``
+    forms apply the same rules to numpy arrays holding one entry per hive.
+    Compile a new policy to pick up edited settings.
+    """
+    __slots__ = ('low_food', 'high_food', 'high_waste', 'soldier_threat', 'low_integrity',
+                 'small_population', 'critical_population', 'min_workers', 'min_soldiers', 'succession_age')
+
+    def __init__(self, settings: Mapping[str, float] = QUEEN_POLICY):
+        for name in self.__slots__:
+            setattr(self, name, settings[name])
+
+    def priorities(self, hive_state: HiveState, effectiveness: float, age: int, lifespan: int,
+                   living_queens_count: int = 1) -> Dict[Priority, int]:
+        """Urgency per raised priority, in the order the rules raised them."""
+        priorities = {}
+        food_level = hive_state.food_level
+        if food_level < self.low_food:
+            priorities[Priority.INCREASE_WORKERS] = int(3 * effectiveness)
+        elif food_level > self.high_food:
+            priorities[Priority.REDUCE_WORKERS] = 1
+
+        if hive_state.waste_level > self.high_waste:
+            priorities[Priority.INCREASE_CLEANERS] = int(2 * effectiveness)
+
+        threat = hive_state.threat_level.value
+        if threat >= self.soldier_threat:
+            priorities[Priority.INCREASE_SOLDIERS] = int(threat * effectiveness)
+
+        if hive_state.structural_integrity < self.low_integrity:
+            priorities[Priority.INCREASE_BIO_ARCHITECTS] = int(2 * effectiveness)
+
+        population = hive_state.population
+        total_population = sum(population.values())
+        if total_population < self.small_population:
+            priorities[Priority.INCREASE_WORKERS] = priorities.get(Priority.INCREASE_WORKERS, 0) + 2
+            priorities[Priority.INCREASE_BREEDERS] = 1
+
+        if living_queens_count == 0:
+            priorities[Priority.INCREASE_QUEENS] = 1
+        elif living_queens_count == 1 and age > lifespan * self.succession_age:
+            priorities[Priority.INCREASE_QUEENS] = 1
+
+        if population[CasteType.WORKER] < self.min_workers:
+            priorities[Priority.EMERGENCY_WORKERS] = 3
+        if total_population < self.critical_population:
+            priorities[Priority.EMERGENCY_ALL] = 1
+
+        soldiers = population.get(CasteType.SOLDIER, 0)
+        if soldiers == 0:
+            priorities[Priority.EMERGENCY_SOLDIERS] = 3
+        elif soldiers < self.min_soldiers:
+            priorities[Priority.INCREASE_SOLDIERS] = self.min_soldiers - soldiers
+        return priorities
+
+    @staticmethod
+    def instructions(priorities: Mapping[Priority, int]) -> Dict[CasteType, int]:
+        """Spawn orders for ``priorities``; a later priority overrides an earlier one's order for a caste."""
+        spawn_orders = {}
+        for priority, urgency in priorities.items():
+            if urgency <= 0:
+                continue
+            for caste_type, scale, minimum in SPAWN_RULES[priority]:
+                spawn_orders[caste_type] = max(minimum, urgency * scale)
+        return spawn_orders
+
+    def decide(self, hive_state: HiveState, effectiveness: float, age: int, lifespan: int,
+               living_queens_count: int = 1) -> Tuple[Mapping[Priority, int], Mapping[CasteType, int]]:
+        """Priorities and the spawn orders they produce."""
+        priorities = self.priorities(hive_state, effectiveness, age, lifespan, living_queens_count)
+        return priorities, self.instructions(priorities)
+
+    def priorities_batch(self, food_level, waste_level, threat, structural_integrity, total_population,
+                         workers, soldiers, effectiveness, age, lifespan, living_queens_count):
+        """``priorities`` over arrays with one entry per hive.
+
+        Returns ``(urgency, rank)`` dicts of arrays per priority. ``rank`` is the
+        position at which a hive raised the priority, or -1 if it did not, and
+        stands in for the insertion order of the scalar dict.
+        """
+        if np is None:
+            raise ImportError("QueenPolicy.priorities_batch requires numpy")
+        effectiveness = np.asarray(effectiveness, dtype=np.float64)
+        threat = np.asarray(threat)
+        soldiers = np.asarray(soldiers)
+        urgency: Dict[Priority, 'np.ndarray'] = {}
+        rank: Dict[Priority, 'np.ndarray'] = {}
+        steps = count()
+
+        def set_where(priority: Priority, mask, value):
+            step = next(steps)
+            value = np.broadcast_to(np.asarray(value, dtype=np.int64), mask.shape)
+            if priority in urgency:
+                urgency[priority] = np.where(mask, value, urgency[priority])
+                rank[priority] = np.where(mask & (rank[priority] < 0), step, rank[priority])
+            else:
+                urgency[priority] = np.where(mask, value, 0)
+                rank[priority] = np.where(mask, step, -1)
+
+        food_level = np.asarray(food_level)
+        total_population = np.asarray(total_population)
+        living_queens_count = np.asarray(living_queens_count)
+        set_where(Priority.INCREASE_WORKERS, food_level < self.low_food, (3 * effectiveness).astype(np.int64))
+        set_where(Priority.REDUCE_WORKERS, (food_level >= self.low_food) & (food_level > self.high_food), 1)
+        set_where(Priority.INCREASE_CLEANERS, np.asarray(waste_level) > self.high_waste,
+                  (2 * effectiveness).astype(np.int64))
+        set_where(Priority.INCREASE_SOLDIERS, threat >= self.soldier_threat,
+                  (threat * effectiveness).astype(np.int64))
+        set_where(Priority.INCREASE_BIO_ARCHITECTS, np.asarray(structural_integrity) < self.low_integrity,
+                  (2 * effectiveness).astype(np.int64))
+        small = total_population < self.small_population
+        set_where(Priority.INCREASE_WORKERS, small, urgency[Priority.INCREASE_WORKERS] + 2)
+        set_where(Priority.INCREASE_BREEDERS, small, 1)
+        succession = (living_queens_count == 0) | (
+            (living_queens_count == 1) & (np.asarray(age) > np.asarray(lifespan) * self.succession_age))
+        set_where(Priority.INCREASE_QUEENS, succession, 1)
+        set_where(Priority.EMERGENCY_WORKERS, np.asarray(workers) < self.min_workers, 3)
+        set_where(Priority.EMERGENCY_ALL, total_population < self.critical_population, 1)
+        set_where(Priority.EMERGENCY_SOLDIERS, soldiers == 0, 3)
+        set_where(Priority.INCREASE_SOLDIERS, (soldiers > 0) & (soldiers < self.min_soldiers),
+                  self.min_soldiers - soldiers)
+        return urgency, rank
+
+    @staticmethod
+    def instructions_batch(urgency: Mapping[Priority, 'np.ndarray'],
+                           rank: Mapping[Priority, 'np.ndarray']) -> Dict[CasteType, 'np.ndarray']:
+        """``instructions`` over ``priorities_batch`` output; 0 means no order for that caste."""
+        orders: Dict[CasteType, 'np.ndarray'] = {}
+        latest: Dict[CasteType, 'np.ndarray'] = {}
+        for priority, values in urgency.items():
+            raised = (rank[priority] >= 0) & (values > 0)
+            for caste_type, scale, minimum in SPAWN_RULES[priority]:
+                if caste_type not in orders:
+                    orders[caste_type] = np.zeros_like(values)
+                    latest[caste_type] = np.full_like(values, -1)
+                # Where several priorities order the same caste, the one raised last wins
+                newer = raised & (rank[priority] > latest[caste_type])
+                orders[caste_type] = np.where(newer, np.maximum(minimum, values * scale), orders[caste_type])
+                latest[caste_type] = np.where(newer, rank[priority], latest[caste_type])
+        return orders
+
+
+class DecisionCache:
+    """Bounded LRU memo of ``QueenPolicy.decide``, keyed on the regime the inputs fall in.
+
+    The key keeps exactly what the rules can tell apart: which side of each
+    threshold, the threat level, the soldier count up to the minimum, the
+    queen's effectiveness and whether she is due a successor. A hit returns
+    the decision the policy would have computed. Cached decisions are
+    read-only mappings, so one cache can serve many queens and hives.
+    """
+
+    def __init__(self, policy: Optional[QueenPolicy] = None, maxsize: int = 4096):
+        self.policy = policy if policy is not None else QueenPolicy()
+        self.maxsize = maxsize
+        self._decisions: 'OrderedDict[Hashable, Tuple[Mapping[Priority, int], Mapping[CasteType, int]]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, hive_state: HiveState, effectiveness: float, age: int, lifespan: int,
+            living_queens_count: int = 1) -> Hashable:
+        policy = self.policy
+        food_level = hive_state.food_level
+        population = hive_state.population
+        total_population = sum(population.values())
+        return (
+            -1 if food_level < policy.low_food else (1 if food_level > policy.high_food else 0),
+            hive_state.waste_level > policy.high_waste,
+            hive_state.threat_level,
+            hive_state.structural_integrity < policy.low_integrity,
+            total_population < policy.small_population,
+            total_population < policy.critical_population,
+            population[CasteType.WORKER] < policy.min_workers,
+            min(population.get(CasteType.SOLDIER, 0), policy.min_soldiers),
+            effectiveness,
+            min(living_queens_count, 2),
+            living_queens_count == 1 and age > lifespan * policy.succession_age,
+        )
+
+    def decide(self, hive_state: HiveState, effectiveness: float, age: int, lifespan: int,
+               living_queens_count: int = 1) -> Tuple[Mapping[Priority, int], Mapping[CasteType, int]]:
+        key = self.key(hive_state, effectiveness, age, lifespan, living_queens_count)
+        decisions = self._decisions
+        decision = decisions.get(key)
+        if decision is not None:
+            decisions.move_to_end(key)
+            self.hits += 1
+            return decision
+
+        self.misses += 1
+        priorities, instructions = self.policy.decide(hive_state, effectiveness, age, lifespan, living_queens_count)
+        decision = decisions[key] = (MappingProxyType(priorities), MappingProxyType(instructions))
+        if len(decisions) > self.maxsize:
+            decisions.popitem(last=False)
+            self.evictions += 1
+        return decision
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Read-only mappings cannot be pickled or deep-copied; store plain dicts instead
+        state = self.__dict__.copy()
+        state['_decisions'] = [(key, dict(priorities), dict(instructions))
+                               for key, (priorities, instructions) in self._decisions.items()]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        decisions = state['_decisions']
+        self.__dict__.update(state)
+        self._decisions = OrderedDict((key, (MappingProxyType(priorities), MappingProxyType(instructions)))
+                                      for key, priorities, instructions in decisions)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._decisions),
+            'hit_rate': self.hit_rate,
+        }
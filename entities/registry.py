@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple, Type
+from constants.enums import CasteType
+from constants.settings import LIFESPANS, INITIAL_POPULATION
+from .base import Organism
+from .castes.queen import Queen
+from .castes.worker import Worker
+from .castes.soldier import Soldier
+from .castes.cleaner import Cleaner
+from .castes.breeder import Breeder
+from .castes.bio_architect import BioArchitect
+from .castes.cerebral import CerebralCaste
+
+
+@dataclass(frozen=True)
+class CasteSpec:
+    """Everything the simulation needs to create and store organisms of one caste.
+
+    ``initial_ages`` is the age range of a hive's starting population (None
+    for castes that only appear later). ``storable`` castes carry no state
+    beyond their age, so the array and cohort stores may hold them as rows
+    or counts instead of objects.
+    """
+    caste_type: CasteType
+    cls: Type[Organism]
+    initial_ages: Optional[Tuple[int, int]] = None
+    storable: bool = False
+    factory: Optional[Callable[[int, int], Organism]] = None
+
+    @property
+    def lifespan(self) -> int:
+        return LIFESPANS[self.caste_type]
+
+    def create(self, organism_id: int, age: int = 0) -> Organism:
+        return (self.factory or self.cls)(organism_id, age)
+
+
+CASTE_REGISTRY: Dict[CasteType, CasteSpec] = {}
+
+
+def register_caste(caste_type: CasteType, cls: Type[Organism], lifespan: Optional[int] = None,
+                   initial_ages: Optional[Tuple[int, int]] = None, storable: bool = False,
+                   factory: Optional[Callable[[int, int], Organism]] = None) -> CasteSpec:
+    """Add or replace a caste. A new caste needs only its enum member and this call."""
+    if lifespan is not None:
+        LIFESPANS[caste_type] = lifespan
+    elif caste_type not in LIFESPANS:
+        raise ValueError(f"No lifespan configured for {caste_type.value}")
+    INITIAL_POPULATION.setdefault(caste_type, 0)
+    spec = CASTE_REGISTRY[caste_type] = CasteSpec(caste_type, cls, initial_ages, storable, factory)
+    return spec
+
+
+def storable_castes() -> Tuple[CasteType, ...]:
+    return tuple(caste for caste, spec in CASTE_REGISTRY.items() if spec.storable)
+
+
+# Registration order is the order the starting population is drawn in
+register_caste(CasteType.QUEEN, Queen, initial_ages=(20, 40))
+register_caste(CasteType.WORKER, Worker, initial_ages=(0, 15), storable=True)
+register_caste(CasteType.SOLDIER, Soldier, initial_ages=(0, 12), storable=True)
+register_caste(CasteType.CLEANER, Cleaner, initial_ages=(0, 18), storable=True)
+register_caste(CasteType.BREEDER, Breeder, initial_ages=(5, 20))
+register_caste(CasteType.BIO_ARCHITECT, BioArchitect, initial_ages=(0, 25), storable=True)
+register_caste(CasteType.CEREBRAL, CerebralCaste)
@@ -0,0 +1,40 @@
+import math
+import random
+from typing import List
+
+
+def binomial(rng: random.Random, n: int, p: float) -> int:
+    """Number of successes in ``n`` trials of probability ``p``.
+
+    Exact for small expected counts (geometric gaps between successes, one
+    draw per success); above 30 expected successes either way it uses the
+    normal approximation, rounded and clamped to ``0..n``.
+    """
+    if n <= 0 or p <= 0.0:
+        return 0
+    if p >= 1.0:
+        return n
+    if p > 0.5:
+        return n - binomial(rng, n, 1.0 - p)
+    mean = n * p
+    if mean < 30:
+        log_failure = math.log(1.0 - p)
+        successes = 0
+        i = int(math.log(1.0 - rng.random()) / log_failure)
+        while i < n:
+            successes += 1
+            i += 1 + int(math.log(1.0 - rng.random()) / log_failure)
+        return successes
+    return min(n, max(0, round(rng.gauss(mean, math.sqrt(mean * (1.0 - p))))))
+
+
+def uniform_counts(rng: random.Random, n: int, low: int, high: int) -> List[int]:
+    """How many of ``n`` draws of ``randint(low, high)`` land on each value, lowest first."""
+    counts = []
+    remaining = n
+    for value in range(low, high):
+        drawn = binomial(rng, remaining, 1.0 / (high - value + 1))
+        counts.append(drawn)
+        remaining -= drawn
+    counts.append(remaining)
+    return counts
@@ -1,38 +1,103 @@
+import asyncio
+import sys
 import threading
-from simulation import HiveSimulation
+from simulation import HiveSimulation, AsyncDriver, StatusRenderer
 
-def main():
-    simulation = HiveSimulation()
+HELP = "s: stats, p: pause, r: resume, n: step, v <cycles/sec>: speed, q: quit"
+
+def print_statistics(stats):
+    print("\nCurrent Statistics:")
+    for key, value in stats.items():
+        if hasattr(value, 'items'):
+            print(f"{key}:")
+            for k, v in value.items():
+                print(f"  {k}: {v}")
+        else:
+            print(f"{key}: {value}")
+
+def stdin_lines() -> asyncio.Queue:
+    # input() blocks, so one daemon thread feeds stdin into the loop; the hives themselves need no threads
+    loop = asyncio.get_running_loop()
+    lines = asyncio.Queue()
     
-    def run_sim():
-        simulation.run_simulation(max_cycles=100)
+    def read():
+        for line in sys.stdin:
+            loop.call_soon_threadsafe(lines.put_nowait, line)
+        loop.call_soon_threadsafe(lines.put_nowait, None)
     
-    sim_thread = threading.Thread(target=run_sim)
-    sim_thread.start()
+    threading.Thread(target=read, daemon=True).start()
+    return lines
+
+async def handle_command(driver: AsyncDriver, cmd: str) -> bool:
+    """Apply one console command; returns False when the console should exit"""
+    if cmd == 's':
+        print_statistics(driver.statistics())
+    elif cmd == 'p':
+        driver.pause()
+        print("Simulation paused.")
+    elif cmd == 'r':
+        driver.resume()
+        print("Simulation resumed.")
+    elif cmd == 'n':
+        if not driver.paused:
+            print("Pause the simulation before stepping.")
+        elif not await driver.step():
+            driver.stop()
+    elif cmd.startswith('v'):
+        try:
+            speed = float(cmd[1:])
+        except ValueError:
+            print("Usage: v <cycles per second> (0 for unthrottled)")
+        else:
+            driver.set_speed(speed if speed > 0 else None)
+    elif cmd == 'q':
+        print("Stopping simulation...")
+        driver.stop()
+        return False
+    elif cmd:
+        print(HELP)
+    return True
+
+async def console(driver: AsyncDriver, run: asyncio.Task):
+    lines = stdin_lines()
+    while not run.done():
+        print(f"\nEnter command ({HELP}): ")
+        next_line = asyncio.ensure_future(lines.get())
+        await asyncio.wait({next_line, run}, return_when=asyncio.FIRST_COMPLETED)
+        if not next_line.done():
+            next_line.cancel()
+            break
+        line = next_line.result()
+        if line is None or not await handle_command(driver, line.strip().lower()):
+            driver.stop()
+            break
+
+async def main_async(log_events: bool = False):
+    # The full event log prints every cycle; by default a status line is drawn once a second instead
+    simulation = HiveSimulation(verbose=log_events)
+    driver = AsyncDriver(simulation)
+    run = asyncio.ensure_future(driver.run_simulation(max_cycles=100))
+    status = None
+    if not log_events:
+        renderer = StatusRenderer(simulation)
+        renderer.attach()
+        status = asyncio.ensure_future(renderer.run(until=run))
     
     try:
-        while sim_thread.is_alive():
-            cmd = input("\nEnter command (s: stats, q: quit): ").strip().lower()
-            if cmd == 's':
-                stats = simulation.get_statistics()
-                print("\nCurrent Statistics:")
-                for key, value in stats.items():
-                    if isinstance(value, dict):
-                        print(f"{key}:")
-                        for k, v in value.items():
-                            print(f"  {k}: {v}")
-                    else:
-                        print(f"{key}: {value}")
-            elif cmd == 'q':
-                print("Stopping simulation...")
-                simulation.running = False
-                break
+        await console(driver, run)
+    finally:
+        driver.stop()
+        await run
+        if status is not None:
+            await status
+    print("Simulation ended.")
+
+def main():
+    try:
+        asyncio.run(main_async(log_events='--log' in sys.argv[1:]))
     except KeyboardInterrupt:
         print("\nStopping simulation...")
-        simulation.running = False
-    
-    sim_thread.join()
-    print("Simulation ended.")
+        print("Simulation ended.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
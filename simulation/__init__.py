@@ -1,5 +1,23 @@
 from .core import HiveSimulation
-from .events import *
+from .clock import Clock, UnthrottledClock, FixedRateClock, RealTimeClock
+from .bus import EventBus
+from .console import ConsoleSink
+from .array_store import ArrayPopulation
+from .rng import RandomStreams
+from .checkpoint import CheckpointWriter, save_checkpoint, load_checkpoint
+from .recorder import MetricsRecorder
+from .driver import AsyncDriver
+from .renderer import StatusRenderer
+from .world import HiveWorld, FoodPool
+from .profiler import PhaseProfiler
+from .phases import Phase, Pipeline
+from .sharding import ShardedCastePhase, shard_caste_phases
 from .statistics import *
 
-__all__ = ['HiveSimulation']
\ No newline at end of file
+__all__ = [
+    'HiveSimulation', 'Clock', 'UnthrottledClock', 'FixedRateClock', 'RealTimeClock',
+    'EventBus', 'ConsoleSink', 'ArrayPopulation', 'RandomStreams',
+    'CheckpointWriter', 'save_checkpoint', 'load_checkpoint', 'MetricsRecorder',
+    'AsyncDriver', 'StatusRenderer', 'HiveWorld', 'FoodPool', 'PhaseProfiler',
+    'Phase', 'Pipeline', 'ShardedCastePhase', 'shard_caste_phases'
+]
@@ -0,0 +1,50 @@
+from typing import Dict, List
+from entities import Organism, CASTE_REGISTRY
+from constants.enums import CasteType
+
+
+class IdAllocator:
+    """The only source of organism ids in a simulation; ids are never reused."""
+
+    def __init__(self, next_id: int = 1):
+        self.next_id = next_id
+
+    def allocate(self) -> int:
+        organism_id = self.next_id
+        self.next_id += 1
+        return organism_id
+
+    def allocate_block(self, count: int) -> range:
+        block = range(self.next_id, self.next_id + count)
+        self.next_id += count
+        return block
+
+
+class OrganismPool:
+    """Per-caste free lists of dead organisms, reinitialized in place on the next spawn.
+
+    A released organism must no longer be referenced by the simulation; it
+    comes back with a new id, age and state. Each free list keeps at most
+    ``max_free`` organisms so a population crash does not pin memory.
+    """
+
+    def __init__(self, max_free: int = 4096):
+        self.max_free = max_free
+        self._free: Dict[CasteType, List[Organism]] = {caste: [] for caste in CasteType}
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, caste_type: CasteType, organism_id: int, age: int = 0) -> Organism:
+        free = self._free[caste_type]
+        if free:
+            organism = free.pop()
+            organism.__init__(organism_id, age)
+            self.reused += 1
+            return organism
+        self.created += 1
+        return CASTE_REGISTRY[caste_type].create(organism_id, age)
+
+    def release(self, organism: Organism) -> None:
+        free = self._free[organism.caste_type]
+        if len(free) < self.max_free:
+            free.append(organism)
@@ -0,0 +1,140 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from constants.enums import CasteType
+from constants.settings import LIFESPANS
+from entities.demographics import caste_curves
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CASTE_CODES = {caste: code for code, caste in enumerate(CasteType)}
+CASTES_BY_CODE = list(CasteType)
+
+
+class ArrayPopulation:
+    """Structure-of-arrays organism store.
+
+    Each organism is one row across the ``ids``, ``caste``, ``age``,
+    ``max_lifespan``, ``energy`` and ``active`` columns. Aging, old-age death
+    and the stochastic death roll follow ``Organism.age_organism`` but run as
+    one vectorized pass over every row. Dead rows keep their slot with
+    ``active`` cleared and are compacted away once they make up an eighth of
+    the store.
+    """
+
+    def __init__(self, capacity: int = 1024, seed: Optional[int] = None):
+        if np is None:
+            raise ImportError("ArrayPopulation requires numpy; install it or use store='object'")
+        self.size = 0
+        self.dead = 0
+        self.rng = np.random.default_rng(seed)
+        self.lifespans = np.array([LIFESPANS[caste] for caste in CasteType], dtype=np.int32)
+        self._build_tables()
+        self._allocate(max(1, capacity))
+
+    def _build_tables(self):
+        # Flattened (caste code, age) lookups copied from entities.demographics
+        self.stride = int(self.lifespans.max()) + 1
+        shape = (len(CASTES_BY_CODE), self.stride)
+        self._effectiveness = np.zeros(shape, dtype=np.float64)
+        self._energy = np.zeros(shape, dtype=np.float32)
+        self._death_chance = np.ones(shape, dtype=np.float32)
+        for code, caste in enumerate(CASTES_BY_CODE):
+            curves = caste_curves(caste)
+            ages = slice(0, curves.lifespan + 1)
+            self._effectiveness[code, ages] = curves.effectiveness
+            self._energy[code, ages] = curves.energy
+            self._death_chance[code, ages] = curves.death_chance
+        self._energy = self._energy.ravel()
+        self._death_chance = self._death_chance.ravel()
+
+    def _allocate(self, capacity: int):
+        old = getattr(self, 'ids', None)
+        columns = {
+            'ids': np.int64, 'caste': np.int8, 'age': np.int32,
+            'max_lifespan': np.int32, 'energy': np.float32, 'active': np.bool_
+        }
+        for name, dtype in columns.items():
+            column = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                column[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def add(self, caste_type: CasteType, ids: Iterable[int], ages: Iterable[int]):
+        ids = np.asarray(ids, dtype=np.int64)
+        count = len(ids)
+        if count == 0:
+            return
+        if self.size + count > self.capacity:
+            self._allocate(max(self.capacity * 2, self.size + count))
+
+        rows = slice(self.size, self.size + count)
+        code = CASTE_CODES[caste_type]
+        self.ids[rows] = ids
+        self.caste[rows] = code
+        self.age[rows] = np.asarray(ages, dtype=np.int32)
+        self.max_lifespan[rows] = self.lifespans[code]
+        self.energy[rows] = 100
+        self.active[rows] = True
+        self.size += count
+
+    def age_all(self) -> Dict[CasteType, int]:
+        """Age every row by one cycle and return the death count per caste."""
+        n = self.size
+        if n == 0:
+            return {}
+        age = self.age[:n]
+        active = self.active[:n]
+        # Dead rows awaiting compaction stop aging so they stay inside the tables
+        age += active
+
+        lookup = self.caste[:n].astype(np.intp)
+        lookup *= self.stride
+        lookup += age
+        self.energy[:n] = self._energy[lookup]
+
+        # The table holds 1.0 from max lifespan onward, which covers old-age death
+        died = self.rng.random(n, dtype=np.float32) < self._death_chance[lookup]
+        died &= active
+        if not died.any():
+            return {}
+
+        active &= ~died
+        self.dead += int(np.count_nonzero(died))
+        counts = np.bincount(self.caste[:n][died], minlength=len(CASTES_BY_CODE))
+        # Compacting is a full copy, so let dead rows accumulate until they are worth reclaiming
+        if self.dead * 8 > n:
+            self.compact()
+        return {CASTES_BY_CODE[code]: int(count) for code, count in enumerate(counts) if count}
+
+    def compact(self):
+        n = self.size
+        live = self.active[:n]
+        kept = int(np.count_nonzero(live))
+        if kept == n:
+            return
+        for name in ('ids', 'caste', 'age', 'max_lifespan', 'energy', 'active'):
+            column = getattr(self, name)
+            column[:kept] = column[:n][live]
+        self.size = kept
+        self.dead = 0
+
+    def _rows(self, caste_type: CasteType):
+        n = self.size
+        return (self.caste[:n] == CASTE_CODES[caste_type]) & self.active[:n]
+
+    def count(self, caste_type: CasteType) -> int:
+        return int(np.count_nonzero(self._rows(caste_type)))
+
+    def effectiveness(self, caste_type: CasteType):
+        """Vectorized ``Organism.get_effectiveness`` for the live rows of a caste."""
+        code = CASTE_CODES[caste_type]
+        rows = self._rows(caste_type)
+        return self._effectiveness[code][self.age[:self.size][rows]]
+
+    def effectiveness_groups(self, caste_type: CasteType) -> List[Tuple[float, int]]:
+        """``(effectiveness, count)`` pairs for a caste, as ``CohortPopulation.effectiveness_groups``."""
+        values, counts = np.unique(self.effectiveness(caste_type), return_counts=True)
+        return list(zip(values.tolist(), counts.tolist()))
@@ -0,0 +1,140 @@
+from concurrent.futures import Executor
+from itertools import chain, repeat
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+from constants.enums import CasteType, ThreatLevel
+from entities import HiveState, Worker, Soldier, Cleaner, BioArchitect
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from .core import HiveSimulation
+
+Group = Tuple[float, int]
+
+# Organisms per block. Blocks fix which random stream each organism draws from,
+# so the size is a constant rather than anything taken from the host
+BLOCK_SIZE = 50_000
+
+# Per acting caste and store: the batched action. The object form takes per-organism effectiveness values,
+# the array form the same values as an ndarray and the cohort form (effectiveness, count) cohorts
+CASTE_PHASES: Dict[CasteType, Dict[str, Callable]] = {
+    CasteType.WORKER: {
+        'object': Worker.tasks_batch_at, 'array': Worker.tasks_array_at, 'cohort': Worker.tasks_cohorts_at},
+    CasteType.SOLDIER: {
+        'object': Soldier.defense_batch_at, 'array': Soldier.defense_array_at, 'cohort': Soldier.defense_cohorts_at},
+    CasteType.CLEANER: {
+        'object': Cleaner.processing_batch_at, 'array': Cleaner.processing_array_at,
+        'cohort': Cleaner.processing_cohorts_at},
+    CasteType.BIO_ARCHITECT: {
+        'object': BioArchitect.repair_batch_at, 'array': BioArchitect.repair_array_at,
+        'cohort': BioArchitect.repair_cohorts_at},
+}
+
+
+def split_blocks(groups: Sequence[Group], size: Optional[int] = None) -> List[List[Group]]:
+    """Cut ``(effectiveness, count)`` groups, in order, into blocks of ``size`` organisms.
+
+    Only the last block may be shorter. A caste with no members is one empty block.
+    """
+    if size is None:
+        size = BLOCK_SIZE
+    blocks: List[List[Group]] = [[]]
+    room = size
+    for effectiveness, count in groups:
+        while count:
+            if not room:
+                blocks.append([])
+                room = size
+            part = min(count, room)
+            blocks[-1].append((effectiveness, part))
+            room -= part
+            count -= part
+    return blocks
+
+
+def run_block(caste_type: CasteType, form: str, groups: List[Group], hive_state: HiveState,
+              rng: Any) -> Dict[str, Any]:
+    """One caste's batched action over one block. Executed in pool workers when sharded.
+
+    ``form`` is the store kind. The cohort form takes the groups as they
+    are; the others evaluate each organism on its own, the array form with
+    ``rng`` a numpy generator.
+    """
+    action = CASTE_PHASES[caste_type][form]
+    if form == 'cohort':
+        return action(groups, hive_state, rng)
+    if form == 'array':
+        return action(np.repeat([e for e, _ in groups], [count for _, count in groups]), hive_state, rng)
+    return action(list(chain.from_iterable(repeat(e, count) for e, count in groups)), hive_state, rng)
+
+
+def sum_results(results: List[Dict[str, Any]], hive_state: HiveState) -> Dict[str, Any]:
+    """Add up per-block totals; a threat level reduces to the highest one reported."""
+    total: Dict[str, Any] = {}
+    for result in results:
+        for key, value in result.items():
+            if key not in total:
+                total[key] = value
+            elif isinstance(value, ThreatLevel):
+                if value.value > total[key].value:
+                    total[key] = value
+            else:
+                total[key] += value
+    return total
+
+
+def sum_repairs(results: List[Dict[str, Any]], hive_state: HiveState) -> Dict[str, Any]:
+    # Each block caps its own repair at 100; the cap applies once to the whole caste
+    repair = sum(result['repair_applied'] for result in results)
+    return {'repair_applied': min(repair, max(0, 100 - hive_state.structural_integrity))}
+
+
+REDUCERS: Dict[CasteType, Callable[[List[Dict[str, Any]], HiveState], Dict[str, Any]]] = {
+    CasteType.WORKER: sum_results,
+    CasteType.SOLDIER: sum_results,
+    CasteType.CLEANER: sum_results,
+    CasteType.BIO_ARCHITECT: sum_repairs,
+}
+
+
+def run_caste(simulation: 'HiveSimulation', caste_type: CasteType, name: str,
+              executor: Optional[Executor] = None) -> Tuple[Dict[str, Any], int]:
+    """Run one caste's batched action block by block; return its results and how many organisms acted.
+
+    Block 0 draws from the phase's own stream, ``name`` (the store's numpy
+    generator for store='array'); every later block from a stream derived
+    from the cycle, ``name`` and the block number. The block results are
+    reduced in block order, so the outcome depends only on the seed and
+    ``BLOCK_SIZE``. With an ``executor``, blocks after the first run there;
+    block 0 advances a persistent stream and always runs here.
+    """
+    groups = simulation._caste_groups(caste_type)
+    form = simulation.store_kind
+    acting = sum(count for _, count in groups)
+    hive_state = simulation.hive_state
+    # The cohort form costs per group, not per organism, so a counted caste is always one block
+    if form == 'cohort' or acting <= BLOCK_SIZE:
+        rng = simulation.store.rng if form == 'array' else simulation.rng.stream(name)
+        return run_block(caste_type, form, groups, hive_state, rng), acting
+
+    blocks = split_blocks(groups)
+    streams = simulation.rng
+    later = range(1, len(blocks))
+    if form == 'array':
+        rngs = [simulation.store.rng] + [np.random.default_rng(streams.derive_seed(simulation.cycle_count, name, block))
+                                         for block in later]
+    else:
+        rngs = [streams.stream(name)] + [streams.spawn(simulation.cycle_count, name, block) for block in later]
+
+    if executor is None:
+        results = [run_block(caste_type, form, block, hive_state, rng) for block, rng in zip(blocks, rngs)]
+    else:
+        # Phases only read hive state while their blocks run, so every block sees the same values
+        futures = [executor.submit(run_block, caste_type, form, block, hive_state, rng)
+                   for block, rng in zip(blocks[1:], rngs[1:])]
+        results = [run_block(caste_type, form, blocks[0], hive_state, rngs[0])]
+        results.extend(future.result() for future in futures)
+    return REDUCERS[caste_type](results, hive_state), acting
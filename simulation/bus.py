@@ -0,0 +1,155 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from constants.enums import CasteType, Priority, ThreatLevel
+
+
+@dataclass(frozen=True)
+class SimulationStarted:
+    cycle: int
+
+
+@dataclass(frozen=True)
+class SimulationEnded:
+    cycle: int
+    cycles_run: int
+    cycles_per_second: float
+    collapsed: bool
+
+
+@dataclass(frozen=True)
+class CycleStarted:
+    cycle: int
+
+
+@dataclass(frozen=True)
+class CycleEnded:
+    """Published after ``cycle`` has fully completed and the cycle counter has advanced."""
+    cycle: int
+
+
+@dataclass(frozen=True)
+class Deaths:
+    cycle: int
+    counts: Dict[CasteType, int]
+
+
+@dataclass(frozen=True)
+class QueenDeath:
+    cycle: int
+    organism_id: int
+    age: int
+
+
+@dataclass(frozen=True)
+class QueenlessHive:
+    cycle: int
+
+
+@dataclass(frozen=True)
+class QueenAlert:
+    """A condition flagged by a queen while processing stimuli.
+
+    ``kind`` is the priority that raised it: ``INCREASE_QUEENS``,
+    ``EMERGENCY_WORKERS``, ``EMERGENCY_ALL`` or ``EMERGENCY_SOLDIERS``.
+    """
+    cycle: int
+    queen_id: int
+    queen_age: int
+    queen_lifespan: int
+    living_queens: int
+    kind: Priority
+
+
+@dataclass(frozen=True)
+class QueenSpawnBlocked:
+    cycle: int
+    living_queens: int
+
+
+@dataclass(frozen=True)
+class Birth:
+    """One spawn batch. ``source`` is ``queen``, ``natural`` or ``emergency``.
+
+    ``counts`` holds births kept only as counts (store='cohort'), which have no ids.
+    """
+    cycle: int
+    source: str
+    organisms: Tuple[Tuple[CasteType, int], ...]
+    counts: Dict[CasteType, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class EmergencySpawn:
+    """A spawn (or spawn order) forced by the engine rather than a breeder.
+
+    ``reason`` is ``queen``, ``cerebral``, ``worker_extinction`` or
+    ``auto_emergency``; the last one only raises the worker spawn order.
+    """
+    cycle: int
+    caste: CasteType
+    reason: str
+
+
+@dataclass(frozen=True)
+class ThreatChanged:
+    """Threat level transition. ``cause`` is ``random``, ``worker`` or ``soldiers``."""
+    cycle: int
+    old: ThreatLevel
+    new: ThreatLevel
+    cause: str
+
+
+@dataclass(frozen=True)
+class CerebralStrategy:
+    cycle: int
+    organism_id: int
+    strategies: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class HiveCollapse:
+    cycle: int
+
+
+@dataclass(frozen=True)
+class CycleSummary:
+    cycle: int
+    food_level: int
+    waste_level: int
+    structural_integrity: int
+    threat_level: ThreatLevel
+    population: Dict[CasteType, int]
+    total_births: int
+    total_deaths: int
+    queen_id: Optional[int]
+    queen_age: Optional[int]
+
+
+class EventBus:
+    """Synchronous publish/subscribe dispatch keyed on event type.
+
+    Publishers should guard event construction with ``wants()`` so that an
+    event nobody listens to costs a single dict lookup.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[type, List[Callable[[Any], None]]] = {}
+
+    def subscribe(self, event_type: type, handler: Callable[[Any], None]) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type: type, handler: Callable[[Any], None]) -> None:
+        handlers = self._handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self._handlers[event_type]
+
+    def wants(self, event_type: type) -> bool:
+        return event_type in self._handlers
+
+    def publish(self, event: Any) -> None:
+        handlers = self._handlers.get(type(event))
+        if handlers:
+            for handler in handlers:
+                handler(event)
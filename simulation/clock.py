@@ -0,0 +1,59 @@
+import time
+
+
+class Clock:
+    """Paces the cycle loop. The base clock never waits (unthrottled)."""
+
+    def start(self) -> None:
+        self.started_at = time.perf_counter()
+
+    def tick(self) -> None:
+        delay = self.next_delay()
+        if delay > 0:
+            time.sleep(delay)
+
+    def next_delay(self) -> float:
+        """Seconds to wait before the next cycle; async drivers sleep on this instead of tick()."""
+        return 0.0
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+
+class UnthrottledClock(Clock):
+    """Runs cycles back to back, as fast as the engine allows."""
+
+
+class FixedRateClock(Clock):
+    """Targets a fixed number of cycles per second.
+
+    Deadlines are scheduled from the start time rather than from the end of
+    the previous cycle, so slow cycles do not accumulate drift.
+    """
+
+    def __init__(self, cycles_per_second: float):
+        if cycles_per_second <= 0:
+            raise ValueError("cycles_per_second must be positive")
+        self.interval = 1.0 / cycles_per_second
+
+    def start(self) -> None:
+        super().start()
+        self._next_deadline = self.started_at + self.interval
+
+    def next_delay(self) -> float:
+        delay = self._next_deadline - time.perf_counter()
+        if delay > 0:
+            self._next_deadline += self.interval
+            return delay
+        # Running behind; resynchronise instead of bursting to catch up
+        self._next_deadline = time.perf_counter() + self.interval
+        return 0.0
+
+
+class RealTimeClock(FixedRateClock):
+    """One cycle every ``seconds_per_cycle`` of wall time (interactive pace)."""
+
+    def __init__(self, seconds_per_cycle: float = 0.5):
+        if seconds_per_cycle <= 0:
+            raise ValueError("seconds_per_cycle must be positive")
+        super().__init__(1.0 / seconds_per_cycle)
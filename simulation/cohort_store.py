@@ -0,0 +1,127 @@
+import random
+from typing import Dict, Iterable, List, Optional, Tuple
+from constants.enums import CasteType
+from entities import Breeder
+from entities.registry import storable_castes
+from entities.demographics import caste_curves
+from entities.sampling import binomial, uniform_counts
+
+
+def cohort_castes() -> Tuple[CasteType, ...]:
+    # Organisms that differ only by age, plus breeders, which are also kept per cooldown
+    return storable_castes() + (CasteType.BREEDER,)
+
+
+# Breeder cooldowns run 0 (ready) to 3 (Breeder.spawn_organisms draws randint(1, 3))
+MAX_COOLDOWN = 3
+
+
+class CohortPopulation:
+    """Organism store holding a count per (caste, cooldown, age) instead of organisms.
+
+    Aging shifts every count list by one, the last age dying of old age, and
+    draws each age's stochastic deaths as one binomial. Cycle cost depends on
+    the number of castes and their lifespans, never on how many organisms
+    there are. Only breeders have a cooldown; every other caste is kept at 0.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+        self.counts: Dict[Tuple[CasteType, int], List[int]] = {}
+        for caste_type in cohort_castes():
+            cooldowns = MAX_COOLDOWN + 1 if caste_type == CasteType.BREEDER else 1
+            for cooldown in range(cooldowns):
+                # Index is age; ages run 0..lifespan - 1 since reaching the lifespan is death
+                self.counts[(caste_type, cooldown)] = [0] * caste_curves(caste_type).lifespan
+
+    def add(self, caste_type: CasteType, ids: Iterable[int], ages: Iterable[int]):
+        # Same signature as ArrayPopulation.add; ids are not kept
+        counts = self.counts[(caste_type, 0)]
+        for age in ages:
+            counts[age] += 1
+
+    def add_counts(self, caste_type: CasteType, count: int, age: int = 0, cooldown: int = 0):
+        self.counts[(caste_type, cooldown)][age] += count
+
+    def age_all(self) -> Dict[CasteType, int]:
+        """Age every cohort by one cycle and return the death count per caste."""
+        rng = self.rng
+        deaths: Dict[CasteType, int] = {}
+        for (caste_type, _), counts in self.counts.items():
+            death_chance = caste_curves(caste_type).death_chance
+            died = counts.pop()
+            counts.insert(0, 0)
+            for age in range(1, len(counts)):
+                count = counts[age]
+                if count:
+                    dead = binomial(rng, count, death_chance[age])
+                    counts[age] = count - dead
+                    died += dead
+            if died:
+                deaths[caste_type] = deaths.get(caste_type, 0) + died
+        return deaths
+
+    def count(self, caste_type: CasteType) -> int:
+        return sum(sum(counts) for (caste, _), counts in self.counts.items() if caste == caste_type)
+
+    def effectiveness_groups(self, caste_type: CasteType) -> List[Tuple[float, int]]:
+        """``(effectiveness, count)`` pairs for a caste, merging ages that share a value."""
+        effectiveness = caste_curves(caste_type).effectiveness
+        groups: Dict[float, int] = {}
+        for (caste, _), counts in self.counts.items():
+            if caste != caste_type:
+                continue
+            for age, count in enumerate(counts):
+                if count:
+                    value = effectiveness[age]
+                    groups[value] = groups.get(value, 0) + count
+        return list(groups.items())
+
+    def breed(self, genetic_instructions: Dict[CasteType, int], living_queens_count: int,
+              rng: random.Random = random) -> Dict[CasteType, int]:
+        """Run ``Breeder.breed`` for every stored breeder and return the offspring counts."""
+        ready, *cooling = (self.counts[(CasteType.BREEDER, cooldown)] for cooldown in range(MAX_COOLDOWN + 1))
+        effectiveness = caste_curves(CasteType.BREEDER).effectiveness
+        # Cooling breeders count down a step; the ones that were ready may start a new cooldown below
+        was_ready = ready[:]
+        ready[:] = [r + c for r, c in zip(ready, cooling[0])]
+        for cooldown in range(1, MAX_COOLDOWN):
+            cooling[cooldown - 1][:] = cooling[cooldown]
+        cooling[-1][:] = [0] * len(ready)
+
+        offspring: Dict[CasteType, int] = {}
+        for age, count in enumerate(was_ready):
+            if not count:
+                continue
+            per_breeder = Breeder.offspring_at(effectiveness[age], genetic_instructions, living_queens_count)
+            if not per_breeder:
+                continue
+            for caste_type, n in per_breeder.items():
+                offspring[caste_type] = offspring.get(caste_type, 0) + n * count
+            ready[age] -= count
+            for cooldown, drawn in enumerate(uniform_counts(rng, count, 1, MAX_COOLDOWN)):
+                cooling[cooldown][age] += drawn
+        return offspring
+
+    def breed_one(self, genetic_instructions: Dict[CasteType, int], living_queens_count: int,
+                  rng: random.Random = random) -> Dict[CasteType, int]:
+        """``Breeder.breed`` for a single breeder, the oldest and least cooled-down one."""
+        counts = [self.counts[(CasteType.BREEDER, cooldown)] for cooldown in range(MAX_COOLDOWN + 1)]
+        for age in reversed(range(len(counts[0]))):
+            for cooldown, by_age in enumerate(counts):
+                if by_age[age]:
+                    break
+            else:
+                continue
+            break
+        else:
+            return {}
+
+        by_age[age] -= 1
+        if cooldown > 0:
+            counts[cooldown - 1][age] += 1
+            return {}
+        effectiveness = caste_curves(CasteType.BREEDER).effectiveness[age]
+        offspring = Breeder.offspring_at(effectiveness, genetic_instructions, living_queens_count)
+        counts[rng.randint(1, MAX_COOLDOWN) if offspring else 0][age] += 1
+        return offspring
@@ -0,0 +1,136 @@
+from typing import Callable, Dict
+from constants.enums import Priority
+from .bus import (
+    EventBus, SimulationStarted, SimulationEnded, CycleStarted, Deaths, QueenDeath,
+    QueenlessHive, QueenAlert, QueenSpawnBlocked, Birth, EmergencySpawn, ThreatChanged,
+    CerebralStrategy, HiveCollapse, CycleSummary
+)
+
+
+class ConsoleSink:
+    """Formats engine events as the classic console log.
+
+    All string building for console output happens here, so a hive without
+    a console sink attached does no formatting at all.
+    """
+
+    def __init__(self, write: Callable[[str], None] = print):
+        self.write = write
+        self._handlers: Dict[type, Callable] = {
+            SimulationStarted: self.on_simulation_started,
+            SimulationEnded: self.on_simulation_ended,
+            CycleStarted: self.on_cycle_started,
+            Deaths: self.on_deaths,
+            QueenDeath: self.on_queen_death,
+            QueenlessHive: self.on_queenless_hive,
+            QueenAlert: self.on_queen_alert,
+            QueenSpawnBlocked: self.on_queen_spawn_blocked,
+            Birth: self.on_birth,
+            EmergencySpawn: self.on_emergency_spawn,
+            ThreatChanged: self.on_threat_changed,
+            CerebralStrategy: self.on_cerebral_strategy,
+            HiveCollapse: self.on_hive_collapse,
+            CycleSummary: self.on_cycle_summary,
+        }
+
+    def attach(self, bus: EventBus) -> None:
+        for event_type, handler in self._handlers.items():
+            bus.subscribe(event_type, handler)
+
+    def detach(self, bus: EventBus) -> None:
+        for event_type, handler in self._handlers.items():
+            bus.unsubscribe(event_type, handler)
+
+    def on_simulation_started(self, event: SimulationStarted):
+        self.write("=== HIVE SIMULATION STARTED ===")
+
+    def on_simulation_ended(self, event: SimulationEnded):
+        if event.collapsed:
+            self.write("=== HIVE COLLAPSED ===")
+        self.write(f"=== SIMULATION ENDED ({event.cycles_run} cycles, "
+                   f"{event.cycles_per_second:.1f} cycles/sec) ===")
+
+    def on_cycle_started(self, event: CycleStarted):
+        self.write(f"\n=== CYCLE {event.cycle} ===")
+
+    def on_deaths(self, event: Deaths):
+        death_report = ", ".join([f"{count} {caste.value}" for caste, count in event.counts.items()])
+        self.write(f"💀 Deaths: {death_report}")
+
+    def on_queen_death(self, event: QueenDeath):
+        self.write(f"👑💀 QUEEN DEATH: Queen {event.organism_id} has died at age {event.age}")
+
+    def on_queenless_hive(self, event: QueenlessHive):
+        self.write("🚨 QUEENLESS HIVE: Immediate succession required!")
+
+    def on_queen_alert(self, event: QueenAlert):
+        if event.kind == Priority.INCREASE_QUEENS:
+            if event.living_queens == 0:
+                self.write("👑 SUCCESSION TRIGGERED: No living queens, spawning successor!")
+            else:
+                self.write(f"👑 SUCCESSION PREPARATION: Queen {event.queen_id} preparing successor "
+                           f"(age {event.queen_age}/{event.queen_lifespan})")
+        elif event.kind == Priority.EMERGENCY_WORKERS:
+            self.write("🚨 EMERGENCY: Critical worker shortage detected!")
+        elif event.kind == Priority.EMERGENCY_ALL:
+            self.write("🚨 EMERGENCY: Population collapse imminent!")
+        elif event.kind == Priority.EMERGENCY_SOLDIERS:
+            self.write("🚨 EMERGENCY: No soldiers during threat!")
+
+    def on_queen_spawn_blocked(self, event: QueenSpawnBlocked):
+        self.write(f"👑 BLOCKED: Cannot spawn new queen while {event.living_queens} queen(s) still alive")
+
+    def on_birth(self, event: Birth):
+        if event.source == 'emergency':
+            # Already announced by on_emergency_spawn
+            return
+        births = [f"{caste.value}-{organism_id}" for caste, organism_id in event.organisms]
+        births.extend(f"{count} x {caste.value}" for caste, count in event.counts.items())
+        if event.source == 'natural':
+            self.write(f"🌱 Natural births: {births}")
+        else:
+            self.write(f"🐣 Queen-ordered births: {', '.join(births)}")
+
+    def on_emergency_spawn(self, event: EmergencySpawn):
+        if event.reason == 'queen':
+            self.write("🚨 EMERGENCY QUEEN SPAWN: Creating new queen to save the hive!")
+        elif event.reason == 'cerebral':
+            self.write("🧠 EMERGENCY: Spawning Cerebral Caste for existential threat!")
+        elif event.reason == 'auto_emergency':
+            self.write("⚡ AUTO-EMERGENCY: Force-spawning workers")
+        elif event.reason == 'worker_extinction':
+            self.write("💥 CRITICAL FAILURE: No workers left - spawning emergency batch")
+
+    def on_threat_changed(self, event: ThreatChanged):
+        if event.cause == 'worker':
+            self.write(f"⚠️ Worker detected new threat: {event.new.name}")
+        elif event.cause == 'soldiers':
+            self.write(f"🛡️ Soldiers reduced threat to {event.new.name}")
+        elif event.new.value > event.old.value:
+            self.write(f"🚨 Threat level increased to {event.new.name}")
+        else:
+            self.write(f"✅ Threat level reduced to {event.new.name}")
+
+    def on_cerebral_strategy(self, event: CerebralStrategy):
+        self.write(f"🧠 Cerebral strategies: {event.strategies}")
+
+    def on_hive_collapse(self, event: HiveCollapse):
+        self.write("👑💀 HIVE COLLAPSE: No living queens and emergency spawn failed!")
+
+    def on_cycle_summary(self, event: CycleSummary):
+        total_population = sum(event.population.values())
+        if event.queen_id is not None:
+            queen_info = f" (Queen: {event.queen_id}, age {event.queen_age})"
+        else:
+            queen_info = " (NO QUEEN!)"
+
+        self.write(f"Food: {event.food_level} | "
+                   f"Waste: {event.waste_level} | "
+                   f"Structure: {event.structural_integrity}% | "
+                   f"Threat: {event.threat_level.name}")
+
+        castes = "".join(f"{caste_type.value}: {count} | "
+                         for caste_type, count in event.population.items() if count > 0)
+        self.write(f"Population ({total_population} total){queen_info}: {castes}")
+
+        self.write(f"Total Births: {event.total_births} | Total Deaths: {event.total_deaths}")
@@ -1,322 +1,447 @@
-import random
-import time
-from typing import Dict, List
-from entities import HiveState, Organism, Queen, Worker, Soldier, Cleaner, Breeder, BioArchitect, CerebralCaste
+import math
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from entities import HiveState, Organism, CASTE_REGISTRY
+from entities.registry import storable_castes
+from entities.policy import DecisionCache
+from entities.base import AgeClock
+from entities.demographics import curves_for, effectiveness_at
+from entities.sampling import uniform_counts
 from constants.enums import CasteType, ThreatLevel
 from constants.settings import INITIAL_POPULATION, INITIAL_HIVE_STATE
+from .clock import Clock, RealTimeClock, UnthrottledClock
+from .bus import (
+    EventBus, SimulationStarted, SimulationEnded, CycleStarted, CycleEnded, QueenDeath,
+    QueenlessHive, Birth, EmergencySpawn, ThreatChanged, HiveCollapse, CycleSummary
+)
+from .console import ConsoleSink
+from .array_store import ArrayPopulation
+from .cohort_store import CohortPopulation, cohort_castes
+from .rng import RandomStreams
+from .statistics import read_only, statistics_snapshot
+from .profiler import PhaseProfiler
+from .allocation import IdAllocator, OrganismPool
+from .phases import CycleContext, Phase, Pipeline
+from .blocks import run_caste
+
+STORES = ('object', 'array', 'cohort')
 
 
 class HiveSimulation:
-    def __init__(self):
+    def __init__(self, verbose: bool = True, store: str = 'object', seed: Optional[int] = None,
+                 population: Optional[Dict[CasteType, int]] = None, profile: bool = False,
+                 decisions: Optional[DecisionCache] = None, phases: Optional[Iterable[Phase]] = None):
+        if store not in STORES:
+            raise ValueError(f"Unknown organism store {store!r}; expected one of {STORES}")
+        # Every random draw goes through a per-phase stream of this hive's generator
+        self.rng = RandomStreams(seed)
         self.hive_state = HiveState()
+        if population is not None:
+            # Replaces INITIAL_POPULATION; castes left out start empty
+            self.hive_state.population = {caste: population.get(caste, 0) for caste in CasteType}
         self.organisms = {}
+        # Live organisms per caste, kept in step with self.organisms on every birth and death
+        self._caste_index: Dict[CasteType, Dict[int, Organism]] = {caste: {} for caste in CasteType}
+        # Object-stored organisms age together on this clock. Per caste they are grouped into cohorts
+        # keyed by (clock cycle at age 0, lifespan); every member of a cohort has the same age
+        self.age_clock = AgeClock(owner=self)
+        self._cohorts: Dict[CasteType, Dict[Tuple[int, int], Dict[int, Organism]]] = {caste: {} for caste in CasteType}
+        # Timing wheel: clock cycle -> cohorts that reach their lifespan on that cycle
+        self._expiry: Dict[int, List[Tuple[CasteType, Tuple[int, int]]]] = {}
+        self.store_kind = store
+        if store == 'array':
+            self.store = ArrayPopulation(seed=self.rng.derive_seed('array'))
+            # Castes with no per-organism state beyond age are kept as rows rather than objects
+            self._stored_castes = storable_castes()
+        elif store == 'cohort':
+            # Counts per age instead of organisms, for hives too large to hold one object each
+            self.store = CohortPopulation(seed=self.rng.derive_seed('cohort'))
+            self._stored_castes = cohort_castes()
+        else:
+            self.store = None
+            self._stored_castes = ()
         self.cycle_count = 0
         self.running = False
-        self.next_organism_id = 1000
+        self.ids = IdAllocator()
+        # Dead organisms are recycled into new births instead of being left to the garbage collector
+        self.pool = OrganismPool()
+        self.cycles_per_second = 0.0
+        # Births and deaths per caste during the most recent cycle
+        self.cycle_births: Dict[CasteType, int] = {}
+        self.cycle_deaths: Dict[CasteType, int] = {}
+        # Set by HiveWorld: extra chance per cycle that threat rises, and a shared pool workers forage from
+        self.threat_pressure = 0.0
+        # Queen decisions are memoized per hive regime; hives in one process may share a cache
+        self.decisions = decisions if decisions is not None else DecisionCache()
+        self.food_pool = None
+        # The steps of a cycle, in order; scenarios may disable, replace or reorder them
+        self.pipeline = Pipeline(phases)
+        self.profiler = PhaseProfiler() if profile else None
+        self.verbose = verbose
+        self.events = EventBus()
+        self.console = ConsoleSink()
+        if verbose:
+            self.console.attach(self.events)
         self._initialize_organisms()
+        self._publish_statistics()
         
     def _initialize_organisms(self):
-        organism_id = 1
-        
-        for _ in range(self.hive_state.population[CasteType.QUEEN]):
-            self.organisms[organism_id] = Queen(organism_id, age=random.randint(20, 40))
-            organism_id += 1
-            
-        for _ in range(self.hive_state.population[CasteType.WORKER]):
-            self.organisms[organism_id] = Worker(organism_id, age=random.randint(0, 15))
-            organism_id += 1
-            
-        for _ in range(self.hive_state.population[CasteType.SOLDIER]):
-            self.organisms[organism_id] = Soldier(organism_id, age=random.randint(0, 12))
-            organism_id += 1
-            
-        for _ in range(self.hive_state.population[CasteType.CLEANER]):
-            self.organisms[organism_id] = Cleaner(organism_id, age=random.randint(0, 18))
-            organism_id += 1
-            
-        for _ in range(self.hive_state.population[CasteType.BREEDER]):
-            self.organisms[organism_id] = Breeder(organism_id, age=random.randint(5, 20))
-            organism_id += 1
-            
-        for _ in range(self.hive_state.population[CasteType.BIO_ARCHITECT]):
-            self.organisms[organism_id] = BioArchitect(organism_id, age=random.randint(0, 25))
-            organism_id += 1
-        
-        self.next_organism_id = organism_id
+        rng = self.rng.stream('setup')
+        
+        for caste_type, spec in CASTE_REGISTRY.items():
+            if spec.initial_ages is None:
+                continue
+            youngest, oldest = spec.initial_ages
+            count = self.hive_state.population[caste_type]
+            if self.store_kind == 'cohort' and caste_type in self._stored_castes:
+                # One draw per age rather than per organism, so any hive size sets up at the same cost
+                for age, drawn in enumerate(uniform_counts(rng, count, youngest, oldest), youngest):
+                    self.store.add_counts(caste_type, drawn, age)
+            else:
+                for _ in range(count):
+                    self._add_organism(self._spawn(caste_type, age=rng.randint(youngest, oldest)))
+    
+    @property
+    def next_organism_id(self) -> int:
+        return self.ids.next_id
+    
+    @next_organism_id.setter
+    def next_organism_id(self, next_id: int):
+        self.ids.next_id = next_id
+    
+    def _spawn(self, caste_type: CasteType, birth_cycle: Optional[int] = None, age: int = 0) -> Organism:
+        organism = self.pool.acquire(caste_type, self.ids.allocate(), age)
+        organism.birth_cycle = birth_cycle
+        return organism
+    
+    def spawn(self, caste_type: CasteType, count: int, birth_cycle: Optional[int] = None, age: int = 0) -> range:
+        """Create ``count`` organisms of one caste and add them to the hive as births.
+
+        Population, birth counters and indexes are updated once for the whole
+        batch. Returns the new ids; organisms the cohort store keeps only as
+        counts have none, so the range is empty for those.
+        """
+        if count <= 0:
+            return range(0)
+        self.hive_state.population[caste_type] += count
+        self._count_birth(caste_type, count)
+        if caste_type in self._stored_castes:
+            if self.store_kind == 'cohort':
+                self.store.add_counts(caste_type, count, age)
+                return range(0)
+            ids = self.ids.allocate_block(count)
+            self.store.add(caste_type, ids, [age] * count)
+            return ids
+        
+        ids = self.ids.allocate_block(count)
+        acquire = self.pool.acquire
+        organisms = {organism_id: acquire(caste_type, organism_id, age) for organism_id in ids}
+        clock = self.age_clock
+        for organism in organisms.values():
+            organism.birth_cycle = birth_cycle
+            organism.bind_clock(clock)
+        self._add_cohort(caste_type, organisms)
+        return ids
+    
+    def _add_cohort(self, caste_type: CasteType, organisms: Dict[int, Organism]):
+        """Add object-stored organisms that share a caste, age and lifespan, and are bound to ``age_clock``."""
+        clock = self.age_clock
+        self.organisms.update(organisms)
+        self._caste_index[caste_type].update(organisms)
+        first = next(iter(organisms.values()))
+        key = (first._born, first.max_lifespan)
+        cohorts = self._cohorts[caste_type]
+        cohort = cohorts.get(key)
+        if cohort is None:
+            cohort = cohorts[key] = {}
+            self._expiry.setdefault(max(key[0] + key[1], clock.cycle + 1), []).append((caste_type, key))
+        cohort.update(organisms)
+    
+    def _add_organism(self, organism: Organism):
+        if organism.caste_type in self._stored_castes:
+            self.store.add(organism.caste_type, (organism.id,), (organism.age,))
+            # The store keeps only the row, so the object can serve the next birth
+            self.pool.release(organism)
+            return
+        self.organisms[organism.id] = organism
+        self._caste_index[organism.caste_type][organism.id] = organism
+        
+        organism.bind_clock(self.age_clock)
+        self._join_cohort(organism)
+        
+    def _remove_organism(self, organism: Organism):
+        del self.organisms[organism.id]
+        del self._caste_index[organism.caste_type][organism.id]
+        self._leave_cohort(organism)
+    
+    def _join_cohort(self, organism: Organism):
+        key = (organism._born, organism.max_lifespan)
+        cohorts = self._cohorts[organism.caste_type]
+        cohort = cohorts.get(key)
+        if cohort is None:
+            cohort = cohorts[key] = {}
+            # Organisms added at or past their lifespan die on the next tick
+            expires = max(key[0] + key[1], self.age_clock.cycle + 1)
+            self._expiry.setdefault(expires, []).append((organism.caste_type, key))
+        cohort[organism.id] = organism
+    
+    def _leave_cohort(self, organism: Organism):
+        # An emptied cohort keeps its expiry entry; aging skips cohorts that no longer exist
+        cohorts = self._cohorts[organism.caste_type]
+        key = (organism._born, organism.max_lifespan)
+        cohort = cohorts[key]
+        del cohort[organism.id]
+        if not cohort:
+            del cohorts[key]
     
+    def _rebase_organism(self, organism: Organism, born: int, curves):
+        """Give a hive member a new age or lifespan, moving it to the matching cohort."""
+        self._leave_cohort(organism)
+        organism._born = born
+        organism._curves = curves
+        self._join_cohort(organism)
+        
     def _get_organisms_by_caste(self, caste_type: CasteType) -> List[Organism]:
-        return [org for org in self.organisms.values() 
-                if org.caste_type == caste_type and org.active]
+        # Store-held castes have no objects; use _caste_groups for those
+        return list(self._caste_index[caste_type].values())
+    
+    def _caste_groups(self, caste_type: CasteType) -> List[Tuple[float, int]]:
+        """``(effectiveness, count)`` pairs for a caste, in an order that depends only on the hive's state."""
+        if caste_type in self._stored_castes:
+            return self.store.effectiveness_groups(caste_type)
+        now = self.age_clock.cycle
+        cohorts = self._cohorts[caste_type]
+        groups = []
+        for key in sorted(cohorts):
+            born, lifespan = key
+            age = now - born
+            if age <= lifespan:
+                effectiveness = curves_for(lifespan).effectiveness[age]
+            else:
+                effectiveness = effectiveness_at(age / lifespan)
+            groups.append((effectiveness, len(cohorts[key])))
+        return groups
+    
+    def _caste_phase(self, caste_type: CasteType, stream: str) -> Tuple[Dict[str, Any], int]:
+        """Run one caste's batched action and return its results and how many organisms acted."""
+        return run_caste(self, caste_type, stream)
+    
+    def _set_threat_level(self, new_level: ThreatLevel, cause: str):
+        old_level = self.hive_state.threat_level
+        self.hive_state.threat_level = new_level
+        if self.events.wants(ThreatChanged):
+            self.events.publish(ThreatChanged(self.cycle_count, old_level, new_level, cause))
     
-    def _age_all_organisms(self) -> Dict[str, int]:
+    def _age_all_organisms(self) -> Dict[CasteType, int]:
         deaths = {}
         dead_organisms = []
         queen_died = False
-        
-        for org_id, organism in self.organisms.items():
-            if organism.active:
-                still_alive = organism.age_organism()
-                if not still_alive:
-                    dead_organisms.append(org_id)
-                    caste_name = organism.caste_type.value
-                    deaths[caste_name] = deaths.get(caste_name, 0) + 1
-                    self.hive_state.population[organism.caste_type] -= 1
-                    self.hive_state.total_deaths += 1
-                    
-                    if organism.caste_type == CasteType.QUEEN:
-                        queen_died = True
-                        print(f"👑💀 QUEEN DEATH: Queen {organism.id} has died at age {organism.age}")
-        
-        for org_id in dead_organisms:
-            del self.organisms[org_id]
+        rng = self.rng.stream('aging')
+        
+        # One tick ages every object-stored organism
+        self.age_clock.cycle += 1
+        now = self.age_clock.cycle
+        
+        # A cohort that emptied and was re-created is listed twice; dict.fromkeys drops the repeat
+        for caste_type, key in dict.fromkeys(self._expiry.pop(now, ())):
+            cohort = self._cohorts[caste_type].get(key)
+            if cohort:
+                dead_organisms.extend(cohort.values())
+        
+        # Early deaths per cohort: the gaps between victims are geometric, so one draw is made
+        # per death rather than one per organism. Sorted keys keep the draws independent of
+        # cohort creation order, which a restored checkpoint cannot reproduce
+        for cohorts in self._cohorts.values():
+            for key in sorted(cohorts):
+                born, lifespan = key
+                if born + lifespan <= now:
+                    continue
+                log_survival = math.log(1.0 - curves_for(lifespan).death_chance[now - born])
+                cohort = cohorts[key]
+                members = None
+                i = int(math.log(1.0 - rng.random()) / log_survival)
+                while i < len(cohort):
+                    if members is None:
+                        members = list(cohort.values())
+                    dead_organisms.append(members[i])
+                    i += 1 + int(math.log(1.0 - rng.random()) / log_survival)
+        
+        for organism in dead_organisms:
+            deaths[organism.caste_type] = deaths.get(organism.caste_type, 0) + 1
+            self.hive_state.population[organism.caste_type] -= 1
+            self.hive_state.total_deaths += 1
+            
+            if organism.caste_type == CasteType.QUEEN:
+                queen_died = True
+                if self.events.wants(QueenDeath):
+                    self.events.publish(QueenDeath(self.cycle_count, organism.id, organism.age))
+            
+            self._remove_organism(organism)
+            organism.retire()
+            self.pool.release(organism)
+            
+        if self.store is not None:
+            for caste_type, count in self.store.age_all().items():
+                deaths[caste_type] = deaths.get(caste_type, 0) + count
+                self.hive_state.population[caste_type] -= count
+                self.hive_state.total_deaths += count
         
         if queen_died:
-            living_queens = self._get_organisms_by_caste(CasteType.QUEEN)
-            if not living_queens:
-                print("🚨 QUEENLESS HIVE: Immediate succession required!")
+            if not self._caste_index[CasteType.QUEEN] and self.events.wants(QueenlessHive):
+                self.events.publish(QueenlessHive(self.cycle_count))
         
         return deaths
     
     def _random_threat_event(self):
-        if random.random() < 0.05:
+        rng = self.rng.stream('threat')
+        if rng.random() < 0.05 + self.threat_pressure:
             current_level = self.hive_state.threat_level.value
             if current_level < 4:
                 new_level = min(4, current_level + 1)
-                self.hive_state.threat_level = ThreatLevel(new_level)
-                print(f"🚨 Threat level increased to {self.hive_state.threat_level.name}")
+                self._set_threat_level(ThreatLevel(new_level), 'random')
                 
-        elif random.random() < 0.1:
+        elif rng.random() < 0.1:
             current_level = self.hive_state.threat_level.value
             if current_level > 0:
                 new_level = max(0, current_level - 1)
-                self.hive_state.threat_level = ThreatLevel(new_level)
-                print(f"✅ Threat level reduced to {self.hive_state.threat_level.name}")
+                self._set_threat_level(ThreatLevel(new_level), 'random')
+    
+    def _count_birth(self, caste_type: CasteType, count: int = 1):
+        self.hive_state.total_births += count
+        self.cycle_births[caste_type] = self.cycle_births.get(caste_type, 0) + count
+    
+    def _register_offspring(self, offspring: Dict[CasteType, int], source: str, age: int = 0):
+        """Spawn one breeding turn's offspring, given as a count per caste, and announce them."""
+        births = []
+        counts = {}
+        for caste_type, count in offspring.items():
+            ids = self.spawn(caste_type, count, self.cycle_count, age)
+            if ids:
+                births.extend((caste_type, organism_id) for organism_id in ids)
+            else:
+                counts[caste_type] = count
+        if (births or counts) and self.events.wants(Birth):
+            self.events.publish(Birth(self.cycle_count, source, tuple(births), counts))
     
     def _add_natural_births(self, living_queens_count: int):
-        if random.random() < 0.1:
-            breeders = self._get_organisms_by_caste(CasteType.BREEDER)
-            if breeders:
+        rng = self.rng.stream('births')
+        if rng.random() < 0.1:
+            if self.hive_state.population[CasteType.BREEDER] > 0:
                 natural_orders = {CasteType.WORKER: 1}
-                if random.random() < 0.3:
+                if rng.random() < 0.3:
                     caste_options = [CasteType.CLEANER, CasteType.SOLDIER]
-                    natural_orders[random.choice(caste_options)] = 1
+                    natural_orders[rng.choice(caste_options)] = 1
                 
-                for breeder in breeders[:1]:
-                    new_organisms = breeder.spawn_organisms(natural_orders, self.cycle_count, living_queens_count)
-                    if new_organisms:
-                        for org in new_organisms:
-                            self.organisms[self.next_organism_id] = org
-                            org.id = self.next_organism_id
-                            self.hive_state.population[org.caste_type] += 1
-                            self.hive_state.total_births += 1
-                            self.next_organism_id += 1
-                        print(f"🌱 Natural births: {[f'{org.caste_type.value}-{org.id}' for org in new_organisms]}")
-                        break
+                if self.store_kind == 'cohort':
+                    offspring = self.store.breed_one(natural_orders, living_queens_count, rng)
+                else:
+                    # Only the longest-standing breeder handles natural births
+                    breeder = next(iter(self._caste_index[CasteType.BREEDER].values()))
+                    offspring = breeder.breed(natural_orders, living_queens_count, rng)
+                self._register_offspring(offspring, 'natural')
     
     def _emergency_queen_spawn(self):
-        living_queens = self._get_organisms_by_caste(CasteType.QUEEN)
-        if not living_queens:
-            print("🚨 EMERGENCY QUEEN SPAWN: Creating new queen to save the hive!")
-            emergency_queen = Queen(self.next_organism_id, age=random.randint(15, 25))
-            emergency_queen.birth_cycle = self.cycle_count
-            self.organisms[self.next_organism_id] = emergency_queen
-            self.hive_state.population[CasteType.QUEEN] = 1
-            self.hive_state.total_births += 1
-            self.next_organism_id += 1
+        if not self._caste_index[CasteType.QUEEN]:
+            if self.events.wants(EmergencySpawn):
+                self.events.publish(EmergencySpawn(self.cycle_count, CasteType.QUEEN, 'queen'))
+            age = self.rng.stream('succession').randint(15, 25)
+            self._register_offspring({CasteType.QUEEN: 1}, 'emergency', age)
             return True
         return False
     
     def simulate_cycle(self):
-        print(f"\n=== CYCLE {self.cycle_count} ===")
-        
-        deaths = self._age_all_organisms()
-        if deaths:
-            death_report = ", ".join([f"{count} {caste}" for caste, count in deaths.items()])
-            print(f"💀 Deaths: {death_report}")
-        
-        living_queens = self._get_organisms_by_caste(CasteType.QUEEN)
-        living_queens_count = len(living_queens)
-        
-        if living_queens_count == 0:
-            queen_spawned = self._emergency_queen_spawn()
-            if queen_spawned:
-                living_queens = self._get_organisms_by_caste(CasteType.QUEEN)
-                living_queens_count = len(living_queens)
-        
-        if living_queens_count == 0:
-            print("👑💀 HIVE COLLAPSE: No living queens and emergency spawn failed!")
-            return False
-        
-        self._random_threat_event()
-        
-        all_priorities = {}
-        genetic_instructions = {}
-        
-        for queen in living_queens:
-            priorities = queen.process_stimuli(self.hive_state, living_queens_count)
-            all_priorities.update(priorities)
-            instructions = queen.generate_genetic_instructions(priorities)
-            genetic_instructions.update(instructions)
-        
-        if self.hive_state.threat_level == ThreatLevel.EXISTENTIAL:
-            cerebrals = self._get_organisms_by_caste(CasteType.CEREBRAL)
-            if not cerebrals:
-                print("🧠 EMERGENCY: Spawning Cerebral Caste for existential threat!")
-                cerebral = CerebralCaste(self.next_organism_id)
-                cerebral.birth_cycle = self.cycle_count
-                self.organisms[self.next_organism_id] = cerebral
-                self.hive_state.population[CasteType.CEREBRAL] = 1
-                self.hive_state.total_births += 1
-                self.next_organism_id += 1
-            
-            for cerebral in self._get_organisms_by_caste(CasteType.CEREBRAL):
-                strategies = cerebral.analyze_existential_threat(self.hive_state)
-                if 'emergency_spawn' in strategies:
-                    genetic_instructions.update(strategies['emergency_spawn'])
-                print(f"🧠 Cerebral strategies: {strategies}")
-        
-        workers = self._get_organisms_by_caste(CasteType.WORKER)
-        total_food_gathered = 0
-        total_waste_generated = 0
-        
-        for worker in workers:
-            if worker.active:
-                results = worker.execute_tasks(self.hive_state)
-                total_food_gathered += results.get('food_gathered', 0)
-                total_waste_generated += results.get('waste_generated', 0)
-                
-                if 'threat_detected' in results:
-                    detected_threat = results['threat_detected']
-                    if detected_threat.value > self.hive_state.threat_level.value:
-                        self.hive_state.threat_level = detected_threat
-                        print(f"⚠️ Worker detected new threat: {detected_threat.name}")
-        
-        self.hive_state.food_level += total_food_gathered
-        self.hive_state.waste_level += total_waste_generated
-        
-        soldiers = self._get_organisms_by_caste(CasteType.SOLDIER)
-        total_defense = 0
-        for soldier in soldiers:
-            if soldier.active:
-                defense = soldier.defend_hive(self.hive_state.threat_level)
-                total_defense += defense
-        
-        if total_defense > 0:
-            threat_reduction = min(self.hive_state.threat_level.value, total_defense // 20)
-            if threat_reduction > 0:
-                new_threat_level = max(0, self.hive_state.threat_level.value - threat_reduction)
-                self.hive_state.threat_level = ThreatLevel(new_threat_level)
-                print(f"🛡️ Soldiers reduced threat to {self.hive_state.threat_level.name}")
-        
-        cleaners = self._get_organisms_by_caste(CasteType.CLEANER)
-        total_waste_processed = 0
-        total_biomass_recycled = 0
-        
-        for cleaner in cleaners:
-            if cleaner.active:
-                results = cleaner.process_waste(self.hive_state.waste_level)
-                total_waste_processed += results['waste_processed']
-                total_biomass_recycled += results['biomass_recycled']
-        
-        self.hive_state.waste_level = max(0, self.hive_state.waste_level - total_waste_processed)
-        self.hive_state.food_level += total_biomass_recycled
-        
-        bio_architects = self._get_organisms_by_caste(CasteType.BIO_ARCHITECT)
-        for architect in bio_architects:
-            if architect.active:
-                self.hive_state.structural_integrity = architect.maintain_structure(
-                    self.hive_state.structural_integrity
-                )
-        
-        births_this_cycle = []
-        if genetic_instructions:
-            breeders = self._get_organisms_by_caste(CasteType.BREEDER)
-            for breeder in breeders:
-                if breeder.active:
-                    new_organisms = breeder.spawn_organisms(genetic_instructions, self.cycle_count, living_queens_count)
-                    for org in new_organisms:
-                        org.id = self.next_organism_id
-                        self.organisms[self.next_organism_id] = org
-                        self.hive_state.population[org.caste_type] += 1
-                        self.hive_state.total_births += 1
-                        births_this_cycle.append(org)
-                        self.next_organism_id += 1
-                    
-                    if new_organisms:
-                        birth_report = ", ".join([f"{org.caste_type.value}-{org.id}" for org in new_organisms])
-                        print(f"🐣 Queen-ordered births: {birth_report}")
-
-        # Emergency worker replenishment system
-        if (self.hive_state.population[CasteType.WORKER] < 3 and 
-            self.cycle_count > 10):  # Don't trigger in early game
-            # Override breeding orders if necessary
-            if not any('emergency' in p for p in all_priorities):
-                print("⚡ AUTO-EMERGENCY: Force-spawning workers")
-                genetic_instructions[CasteType.WORKER] = max(
-                    genetic_instructions.get(CasteType.WORKER, 0),
-                    3  # Minimum 3 workers
-                )
-        
-        # Prevent total worker extinction
-        if self.hive_state.population[CasteType.WORKER] == 0:
-            print("💥 CRITICAL FAILURE: No workers left - spawning emergency batch")
-            emergency_worker = Worker(self.next_organism_id, age=0)
-            emergency_worker.birth_cycle = self.cycle_count
-            self.organisms[self.next_organism_id] = emergency_worker
-            self.hive_state.population[CasteType.WORKER] += 1
-            self.hive_state.total_births += 1
-            self.next_organism_id += 1
-        
-        self._add_natural_births(living_queens_count)
-        
-        total_population = sum(self.hive_state.population.values())
-        self.hive_state.food_level = max(0, self.hive_state.food_level - total_population // 2)
-        self.hive_state.structural_integrity = max(0, self.hive_state.structural_integrity - random.randint(1, 3))
-        
-        self.print_status()
+        events = self.events
+        profiler = self.profiler
+        if events.wants(CycleStarted):
+            events.publish(CycleStarted(self.cycle_count))
+        if profiler is not None:
+            profiler.start()
+        
+        self.cycle_births = {}
+        self.cycle_deaths = {}
+        cycle = CycleContext()
+        for phase in self.pipeline:
+            if not phase.enabled:
+                continue
+            handled = phase.run(self, cycle)
+            if cycle.collapsed:
+                self._publish_statistics()
+                if events.wants(HiveCollapse):
+                    events.publish(HiveCollapse(self.cycle_count))
+                return False
+            if profiler is not None:
+                # Laps run from mark to mark, so every phase is marked to keep its time its own
+                profiler.mark(phase.name, handled or 0)
+        
+        if events.wants(CycleSummary):
+            events.publish(self._cycle_summary())
         self.cycle_count += 1
+        self._publish_statistics()
+        if events.wants(CycleEnded):
+            events.publish(CycleEnded(self.cycle_count - 1))
         return True
 
+    def _cycle_summary(self) -> CycleSummary:
+        queen = next(iter(self._caste_index[CasteType.QUEEN].values()), None)
+        return CycleSummary(
+            cycle=self.cycle_count,
+            food_level=self.hive_state.food_level,
+            waste_level=self.hive_state.waste_level,
+            structural_integrity=self.hive_state.structural_integrity,
+            threat_level=self.hive_state.threat_level,
+            population=dict(self.hive_state.population),
+            total_births=self.hive_state.total_births,
+            total_deaths=self.hive_state.total_deaths,
+            queen_id=queen.id if queen else None,
+            queen_age=queen.age if queen else None
+        )
+    
     def print_status(self):
-        total_population = sum(self.hive_state.population.values())
-        living_queens = self._get_organisms_by_caste(CasteType.QUEEN)
-        queen_info = f" (Queen: {living_queens[0].id}, age {living_queens[0].age})" if living_queens else " (NO QUEEN!)"
-        
-        print(f"Food: {self.hive_state.food_level} | "
-              f"Waste: {self.hive_state.waste_level} | "
-              f"Structure: {self.hive_state.structural_integrity}% | "
-              f"Threat: {self.hive_state.threat_level.name}")
-        
-        print(f"Population ({total_population} total){queen_info}:", end=" ")
-        for caste_type, count in self.hive_state.population.items():
-            if count > 0:
-                print(f"{caste_type.value}: {count}", end=" | ")
-        print()
-        
-        print(f"Total Births: {self.hive_state.total_births} | Total Deaths: {self.hive_state.total_deaths}")
+        self.console.on_cycle_summary(self._cycle_summary())
         
-    def run_simulation(self, max_cycles: int = 100):
-        self.running = True
-        print("=== HIVE SIMULATION STARTED ===")
+    def run_simulation(self, max_cycles: int = 100, clock: Clock = None, headless: bool = False) -> float:
+        if clock is None:
+            clock = UnthrottledClock() if headless else RealTimeClock()
         
+        # Headless runs detach the console for their duration; other sinks keep receiving events
+        if headless:
+            self.console.detach(self.events)
+            
+        self.start_run()
+        collapsed = False
+        start_cycle = self.cycle_count
+        clock.start()
         for _ in range(max_cycles):
+            # The console thread clears running to stop the run between cycles
+            if not self.running:
+                break
             if not self.simulate_cycle():
-                print("=== HIVE COLLAPSED ===")
+                collapsed = True
                 break
-            time.sleep(0.5)
+            clock.tick()
             
-        self.running = False
-        print("=== SIMULATION ENDED ===")
+        self.end_run(self.cycle_count - start_cycle, clock.elapsed(), collapsed)
         
-    def get_statistics(self) -> Dict[str, any]:
-        return {
-            'total_cycles': self.cycle_count,
-            'total_population': sum(self.hive_state.population.values()),
-            'total_births': self.hive_state.total_births,
-            'total_deaths': self.hive_state.total_deaths,
-            'current_food': self.hive_state.food_level,
-            'current_waste': self.hive_state.waste_level,
-            'current_threat': self.hive_state.threat_level.name,
-            'current_structure': self.hive_state.structural_integrity,
-            'population_by_caste': {caste.value: count for caste, count in self.hive_state.population.items()}
-        }
\ No newline at end of file
+        if headless and self.verbose:
+            self.console.attach(self.events)
+        return self.cycles_per_second
+        
+    def start_run(self):
+        self.running = True
+        if self.events.wants(SimulationStarted):
+            self.events.publish(SimulationStarted(self.cycle_count))
+            
+    def end_run(self, cycles_run: int, elapsed: float, collapsed: bool):
+        self.cycles_per_second = cycles_run / elapsed if elapsed > 0 else float('inf')
+        self.running = False
+        if self.events.wants(SimulationEnded):
+            self.events.publish(SimulationEnded(self.cycle_count, cycles_run, self.cycles_per_second, collapsed))
+        
+    def _publish_statistics(self):
+        # Built only by the simulation thread and swapped in as one reference assignment,
+        # so readers on other threads always see a whole cycle and never block it
+        phases = self.profiler.last_cycle if self.profiler is not None else None
+        self._statistics = statistics_snapshot(self.hive_state, self.cycle_count, phases)
+        
+    def get_statistics(self) -> Mapping[str, Any]:
+        """Statistics as of the last completed cycle (a read-only mapping)"""
+        return read_only(self._statistics)
\ No newline at end of file
@@ -0,0 +1,86 @@
+import asyncio
+import time
+from typing import Any, Mapping, Optional
+from .clock import Clock, FixedRateClock, RealTimeClock, UnthrottledClock
+from .core import HiveSimulation
+
+
+class AsyncDriver:
+    """Runs a hive on an asyncio event loop, yielding to the loop after every cycle.
+
+    Any number of drivers (and their consoles) can share one loop. Control
+    methods are plain calls made from other coroutines on the same loop:
+    pause/resume, single steps while paused, speed changes and stop.
+    """
+
+    def __init__(self, simulation: HiveSimulation, clock: Optional[Clock] = None):
+        self.simulation = simulation
+        self.clock = clock if clock is not None else RealTimeClock()
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        self._paused_at: Optional[float] = None
+        self._paused_for = 0.0
+
+    @property
+    def paused(self) -> bool:
+        return not self._resumed.is_set()
+
+    def pause(self) -> None:
+        if not self.paused:
+            self._paused_at = time.perf_counter()
+            self._resumed.clear()
+
+    def resume(self) -> None:
+        if self.paused:
+            self._paused_for += time.perf_counter() - self._paused_at
+            self._paused_at = None
+            # Restart pacing so the cycles missed while paused are not run in a burst
+            self.clock.start()
+            self._resumed.set()
+
+    def stop(self) -> None:
+        self.simulation.running = False
+        self._resumed.set()
+
+    def set_speed(self, cycles_per_second: Optional[float]) -> None:
+        """Change the pace; ``None`` runs unthrottled."""
+        self.clock = FixedRateClock(cycles_per_second) if cycles_per_second else UnthrottledClock()
+        self.clock.start()
+
+    def statistics(self) -> Mapping[str, Any]:
+        return self.simulation.get_statistics()
+
+    async def step(self, cycles: int = 1) -> bool:
+        """Run ``cycles`` cycles immediately (typically while paused); False once the hive collapses."""
+        for _ in range(cycles):
+            if not self.simulation.simulate_cycle():
+                return False
+            await asyncio.sleep(0)
+        return True
+
+    async def run_simulation(self, max_cycles: Optional[int] = None) -> float:
+        """Run until collapse, stop() or ``max_cycles``; returns cycles per second excluding pauses."""
+        simulation = self.simulation
+        simulation.start_run()
+        collapsed = False
+        start_cycle = simulation.cycle_count
+        started_at = time.perf_counter()
+        self._paused_for = 0.0
+        self.clock.start()
+        while simulation.running:
+            if max_cycles is not None and simulation.cycle_count - start_cycle >= max_cycles:
+                break
+            if self.paused:
+                await self._resumed.wait()
+                continue
+            if not simulation.simulate_cycle():
+                collapsed = True
+                break
+            await asyncio.sleep(self.clock.next_delay())
+
+        paused_for = self._paused_for
+        if self._paused_at is not None:
+            paused_for += time.perf_counter() - self._paused_at
+        elapsed = time.perf_counter() - started_at - paused_for
+        simulation.end_run(simulation.cycle_count - start_cycle, elapsed, collapsed)
+        return simulation.cycles_per_second
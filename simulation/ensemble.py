@@ -0,0 +1,168 @@
+import argparse
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from constants.enums import CasteType
+from entities.policy import DecisionCache
+from .core import HiveSimulation, STORES
+
+
+@dataclass
+class RunResult:
+    seed: int
+    cycles: int
+    collapsed: bool
+    final_population: Dict[CasteType, int]
+    # Queen decision cache lookups made during this run
+    decision_hits: int = 0
+    decision_misses: int = 0
+    decision_evictions: int = 0
+
+
+@dataclass
+class Estimate:
+    """Sample mean with a 95% confidence interval."""
+    mean: float
+    low: float
+    high: float
+    samples: int
+
+
+@dataclass
+class EnsembleSummary:
+    runs: int
+    collapse_probability: Estimate
+    time_to_collapse: Optional[Estimate]
+    final_population: Dict[CasteType, Estimate]
+
+
+# One cache per pool worker, shared by every hive that worker runs
+_decisions = DecisionCache()
+
+
+def run_hive(seed: int, max_cycles: int, store: str = 'object') -> RunResult:
+    """Run one headless hive to collapse or ``max_cycles``. Executed in pool workers."""
+    hits, misses, evictions = _decisions.hits, _decisions.misses, _decisions.evictions
+    simulation = HiveSimulation(verbose=False, store=store, seed=seed, decisions=_decisions)
+    collapsed = False
+    for _ in range(max_cycles):
+        if not simulation.simulate_cycle():
+            collapsed = True
+            break
+    return RunResult(seed, simulation.cycle_count, collapsed, dict(simulation.hive_state.population),
+                     _decisions.hits - hits, _decisions.misses - misses, _decisions.evictions - evictions)
+
+
+def iter_ensemble(runs: int, max_cycles: int, base_seed: int = 0, workers: Optional[int] = None,
+                  store: str = 'object') -> Iterator[RunResult]:
+    """Run ``runs`` hives with seeds ``base_seed .. base_seed + runs - 1`` in a process pool.
+
+    Results are yielded in completion order, not seed order.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_hive, base_seed + i, max_cycles, store) for i in range(runs)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+# Two-sided 95% Student t quantiles for 1..30 degrees of freedom
+T_95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+        2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+        2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+
+def t_quantile(df: int) -> float:
+    if df <= len(T_95):
+        return T_95[df - 1]
+    # Cornish-Fisher expansion around the normal quantile; within 0.001 of the table past 30
+    z = 1.96
+    return z + (z ** 3 + z) / (4 * df) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df * df)
+
+
+def mean_estimate(values: Iterable[float], lower: Optional[float] = None) -> Optional[Estimate]:
+    """Mean with a Student t interval, which stays honest for the small ensembles this is run with.
+
+    ``lower`` clamps the interval for quantities that cannot go below it, such as counts.
+    """
+    values = list(values)
+    n = len(values)
+    if n == 0:
+        return None
+    mean = sum(values) / n
+    if n == 1:
+        return Estimate(mean, mean, mean, 1)
+    variance = sum((v - mean) ** 2 for v in values) / (n - 1)
+    margin = t_quantile(n - 1) * math.sqrt(variance / n)
+    low = mean - margin if lower is None else max(lower, mean - margin)
+    return Estimate(mean, low, mean + margin, n)
+
+
+def proportion_estimate(successes: int, n: int) -> Estimate:
+    """Wilson score interval, which stays inside [0, 1] for rare or certain outcomes."""
+    if n == 0:
+        return Estimate(0.0, 0.0, 1.0, 0)
+    z = 1.96
+    p = successes / n
+    denominator = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return Estimate(p, max(0.0, centre - margin), min(1.0, centre + margin), n)
+
+
+def summarize(results: Iterable[RunResult]) -> EnsembleSummary:
+    results = list(results)
+    collapse_cycles = [r.cycles for r in results if r.collapsed]
+    return EnsembleSummary(
+        runs=len(results),
+        collapse_probability=proportion_estimate(len(collapse_cycles), len(results)),
+        time_to_collapse=mean_estimate(collapse_cycles, lower=0),
+        final_population={
+            caste: mean_estimate((r.final_population.get(caste, 0) for r in results), lower=0)
+            for caste in CasteType
+        } if results else {}
+    )
+
+
+def run_ensemble(runs: int, max_cycles: int, base_seed: int = 0, workers: Optional[int] = None,
+                 store: str = 'object') -> EnsembleSummary:
+    return summarize(iter_ensemble(runs, max_cycles, base_seed, workers, store))
+
+
+def _format(estimate: Estimate) -> str:
+    return f"{estimate.mean:.2f} [{estimate.low:.2f}, {estimate.high:.2f}]"
+
+
+def main(argv: Optional[Tuple[str, ...]] = None):
+    parser = argparse.ArgumentParser(description="Run a Monte Carlo ensemble of independent hives.")
+    parser.add_argument('--runs', type=int, default=32, help="number of hives")
+    parser.add_argument('--cycles', type=int, default=500, help="maximum cycles per hive")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first hive")
+    parser.add_argument('--workers', type=int, default=None, help="pool size (default: CPU count)")
+    parser.add_argument('--store', choices=STORES, default='object')
+    args = parser.parse_args(argv)
+
+    results = []
+    for result in iter_ensemble(args.runs, args.cycles, args.seed, args.workers, args.store):
+        results.append(result)
+        outcome = f"collapsed at cycle {result.cycles}" if result.collapsed else f"alive after {result.cycles} cycles"
+        print(f"[{len(results)}/{args.runs}] seed {result.seed}: {outcome}, "
+              f"population {sum(result.final_population.values())}")
+
+    summary = summarize(results)
+    print(f"\n=== ENSEMBLE SUMMARY ({summary.runs} runs, 95% CI) ===")
+    print(f"Collapse probability: {_format(summary.collapse_probability)}")
+    if summary.time_to_collapse is not None:
+        print(f"Time to collapse: {_format(summary.time_to_collapse)} cycles")
+    print("Final population:")
+    for caste, estimate in summary.final_population.items():
+        print(f"  {caste.value}: {_format(estimate)}")
+    hits = sum(r.decision_hits for r in results)
+    lookups = hits + sum(r.decision_misses for r in results)
+    if lookups:
+        print(f"Queen decision cache: {hits / lookups:.1%} hit rate over {lookups} lookups, "
+              f"{sum(r.decision_evictions for r in results)} evictions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, Iterator, List, Optional
+from constants.enums import CasteType, Priority, ThreatLevel
+from entities import Organism
+from entities.policy import ALERT_PRIORITIES, EMERGENCY_PRIORITIES
+from .bus import Deaths, QueenAlert, QueenSpawnBlocked, EmergencySpawn, CerebralStrategy
+
+if TYPE_CHECKING:
+    from .core import HiveSimulation
+
+
+class CycleContext:
+    """Data one phase hands to later phases of the same cycle."""
+    __slots__ = ('deaths', 'queens', 'priorities', 'instructions', 'collapsed')
+
+    def __init__(self):
+        self.deaths: Dict[CasteType, int] = {}
+        self.queens: List[Organism] = []
+        self.priorities: Dict[Priority, int] = {}
+        self.instructions: Dict[CasteType, int] = {}
+        self.collapsed = False
+
+
+class Phase(ABC):
+    """One step of a hive cycle.
+
+    ``reads`` and ``writes`` name the ``HiveState`` fields and ``CycleContext``
+    slots the phase uses, plus the shared parts of the simulation it touches:
+    ``organisms`` (organism objects, stores, id allocator and pool),
+    ``events`` (publishing order is observable), ``food_pool`` and
+    ``decisions`` (both possibly shared with other hives). Two phases that do
+    not write anything the other reads or writes are independent and may run
+    in either order or together. ``run`` returns how many organisms the
+    phase handled, for the profiler, or None if it had nothing to do this
+    cycle; the phase is timed either way.
+    """
+    name = ''
+    reads: FrozenSet[str] = frozenset()
+    writes: FrozenSet[str] = frozenset()
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+
+    @abstractmethod
+    def run(self, simulation: 'HiveSimulation', cycle: CycleContext) -> Optional[int]:
+        ...
+
+    def conflicts_with(self, other: 'Phase') -> bool:
+        return bool(self.writes & (other.reads | other.writes) or other.writes & self.reads)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r}{'' if self.enabled else ', disabled'})"
+
+
+class AgingPhase(Phase):
+    name = 'aging'
+    reads = frozenset({'population', 'organisms'})
+    writes = frozenset({'population', 'total_deaths', 'deaths', 'organisms', 'events'})
+
+    def run(self, simulation, cycle):
+        aged = sum(simulation.hive_state.population.values())
+        simulation.cycle_deaths = cycle.deaths = simulation._age_all_organisms()
+        if cycle.deaths and simulation.events.wants(Deaths):
+            simulation.events.publish(Deaths(simulation.cycle_count, cycle.deaths))
+        return aged
+
+
+class SuccessionPhase(Phase):
+    """Crown an emergency queen in a queenless hive; with no queen at all the hive collapses."""
+    name = 'succession'
+    reads = frozenset({'population', 'organisms'})
+    writes = frozenset({'population', 'total_births', 'queens', 'organisms', 'events'})
+
+    def run(self, simulation, cycle):
+        if not simulation._caste_index[CasteType.QUEEN]:
+            simulation._emergency_queen_spawn()
+        cycle.queens = simulation._get_organisms_by_caste(CasteType.QUEEN)
+        if not cycle.queens:
+            cycle.collapsed = True
+        return len(cycle.queens)
+
+
+class ThreatPhase(Phase):
+    name = 'threat'
+    reads = frozenset({'threat_level'})
+    writes = frozenset({'threat_level', 'events'})
+
+    def run(self, simulation, cycle):
+        simulation._random_threat_event()
+        return 0
+
+
+class QueenPhase(Phase):
+    name = 'queens'
+    reads = frozenset({'food_level', 'waste_level', 'threat_level', 'structural_integrity', 'population', 'queens'})
+    writes = frozenset({'priorities', 'instructions', 'decisions', 'events'})
+
+    def run(self, simulation, cycle):
+        events = simulation.events
+        queens_count = len(cycle.queens)
+        for queen in cycle.queens:
+            priorities, instructions = queen.decide(simulation.hive_state, queens_count, simulation.decisions)
+            if events.wants(QueenAlert):
+                for kind in ALERT_PRIORITIES:
+                    if kind in priorities:
+                        events.publish(QueenAlert(simulation.cycle_count, queen.id, queen.age,
+                                                  queen.max_lifespan, queens_count, kind))
+            cycle.priorities.update(priorities)
+            cycle.instructions.update(instructions)
+        return queens_count
+
+
+class CerebralPhase(Phase):
+    """Under existential threat, a cerebral organism is spawned and adds its own spawn orders."""
+    name = 'cerebral'
+    reads = frozenset({'threat_level', 'population', 'food_level', 'structural_integrity', 'organisms'})
+    writes = frozenset({'population', 'total_births', 'instructions', 'organisms', 'events'})
+
+    def run(self, simulation, cycle):
+        if simulation.hive_state.threat_level != ThreatLevel.EXISTENTIAL:
+            return None
+        events = simulation.events
+        if not simulation._caste_index[CasteType.CEREBRAL]:
+            if events.wants(EmergencySpawn):
+                events.publish(EmergencySpawn(simulation.cycle_count, CasteType.CEREBRAL, 'cerebral'))
+            simulation._register_offspring({CasteType.CEREBRAL: 1}, 'emergency')
+
+        cerebrals = simulation._get_organisms_by_caste(CasteType.CEREBRAL)
+        for cerebral in cerebrals:
+            strategies = cerebral.analyze_existential_threat(simulation.hive_state)
+            if 'emergency_spawn' in strategies:
+                cycle.instructions.update(strategies['emergency_spawn'])
+            if events.wants(CerebralStrategy):
+                events.publish(CerebralStrategy(simulation.cycle_count, cerebral.id, strategies))
+        return len(cerebrals)
+
+
+class CastePhase(Phase):
+    """A caste acting through one batched call that returns totals for the whole caste.
+
+    ``name`` also names the random streams the caste draws from (one per
+    block, see ``simulation.blocks``), so every caste phase is reproducible
+    on its own whatever runs beside it.
+    """
+    caste_type: CasteType = None
+
+    def run(self, simulation, cycle):
+        results, acting = simulation._caste_phase(self.caste_type, self.name)
+        self.apply(simulation, results)
+        return acting
+
+    @abstractmethod
+    def apply(self, simulation: 'HiveSimulation', results: Dict[str, Any]) -> None:
+        ...
+
+
+class WorkerPhase(CastePhase):
+    name = 'workers'
+    caste_type = CasteType.WORKER
+    reads = frozenset({'threat_level', 'population', 'organisms'})
+    writes = frozenset({'threat_level', 'food_level', 'waste_level', 'food_pool', 'events'})
+
+    def apply(self, simulation, results):
+        hive_state = simulation.hive_state
+        if 'threat_detected' in results:
+            detected_threat = results['threat_detected']
+            if detected_threat.value > hive_state.threat_level.value:
+                simulation._set_threat_level(detected_threat, 'worker')
+
+        food_gathered = results['food_gathered']
+        if simulation.food_pool is not None:
+            food_gathered = simulation.food_pool.take(food_gathered)
+        hive_state.food_level += food_gathered
+        hive_state.waste_level += results['waste_generated']
+
+
+class SoldierPhase(CastePhase):
+    name = 'soldiers'
+    caste_type = CasteType.SOLDIER
+    reads = frozenset({'threat_level', 'population', 'organisms'})
+    writes = frozenset({'threat_level', 'events'})
+
+    def apply(self, simulation, results):
+        total_defense = results['defense_power']
+        if total_defense > 0:
+            threat = simulation.hive_state.threat_level.value
+            threat_reduction = min(threat, total_defense // 20)
+            if threat_reduction > 0:
+                simulation._set_threat_level(ThreatLevel(max(0, threat - threat_reduction)), 'soldiers')
+
+
+class CleanerPhase(CastePhase):
+    name = 'cleaners'
+    caste_type = CasteType.CLEANER
+    reads = frozenset({'waste_level', 'population', 'organisms'})
+    writes = frozenset({'waste_level', 'food_level'})
+
+    def apply(self, simulation, results):
+        hive_state = simulation.hive_state
+        hive_state.waste_level = max(0, hive_state.waste_level - results['waste_processed'])
+        hive_state.food_level += results['biomass_recycled']
+
+
+class ArchitectPhase(CastePhase):
+    name = 'architects'
+    caste_type = CasteType.BIO_ARCHITECT
+    reads = frozenset({'structural_integrity', 'population', 'organisms'})
+    writes = frozenset({'structural_integrity'})
+
+    def apply(self, simulation, results):
+        simulation.hive_state.structural_integrity += results['repair_applied']
+
+
+class BreedingPhase(Phase):
+    """Breeders carry out the spawn orders gathered from queens and cerebral organisms."""
+    name = 'breeding'
+    reads = frozenset({'population', 'queens', 'instructions', 'organisms'})
+    writes = frozenset({'population', 'total_births', 'organisms', 'events'})
+
+    def run(self, simulation, cycle):
+        instructions = cycle.instructions
+        if not instructions:
+            return None
+        events = simulation.events
+        queens_count = len(cycle.queens)
+        if CasteType.QUEEN in instructions and queens_count > 0 and events.wants(QueenSpawnBlocked):
+            events.publish(QueenSpawnBlocked(simulation.cycle_count, queens_count))
+
+        rng = simulation.rng.stream('breeding')
+        breeding = simulation.hive_state.population[CasteType.BREEDER]
+        if simulation.store_kind == 'cohort':
+            simulation._register_offspring(simulation.store.breed(instructions, queens_count, rng), 'queen')
+        else:
+            for breeder in simulation._get_organisms_by_caste(CasteType.BREEDER):
+                if breeder.active:
+                    simulation._register_offspring(breeder.breed(instructions, queens_count, rng), 'queen')
+        return breeding
+
+
+class EmergencyPhase(Phase):
+    """Worker replenishment: raise the worker order when workers run low, spawn one if none are left."""
+    name = 'emergency'
+    reads = frozenset({'population', 'priorities', 'instructions', 'organisms'})
+    writes = frozenset({'population', 'total_births', 'instructions', 'organisms', 'events'})
+
+    def run(self, simulation, cycle):
+        events = simulation.events
+        population = simulation.hive_state.population
+        # Not in the early game, and not when a queen already raised an emergency
+        if population[CasteType.WORKER] < 3 and simulation.cycle_count > 10:
+            if cycle.priorities.keys().isdisjoint(EMERGENCY_PRIORITIES):
+                if events.wants(EmergencySpawn):
+                    events.publish(EmergencySpawn(simulation.cycle_count, CasteType.WORKER, 'auto_emergency'))
+                cycle.instructions[CasteType.WORKER] = max(cycle.instructions.get(CasteType.WORKER, 0), 3)
+
+        # Prevent total worker extinction
+        if population[CasteType.WORKER] == 0:
+            if events.wants(EmergencySpawn):
+                events.publish(EmergencySpawn(simulation.cycle_count, CasteType.WORKER, 'worker_extinction'))
+            simulation._register_offspring({CasteType.WORKER: 1}, 'emergency')
+        return population[CasteType.WORKER]
+
+
+class NaturalBirthsPhase(Phase):
+    name = 'natural_births'
+    reads = frozenset({'population', 'queens', 'organisms'})
+    writes = frozenset({'population', 'total_births', 'organisms', 'events'})
+
+    def run(self, simulation, cycle):
+        simulation._add_natural_births(len(cycle.queens))
+        return simulation.hive_state.population[CasteType.BREEDER]
+
+
+class UpkeepPhase(Phase):
+    """The population eats and the structure wears down."""
+    name = 'upkeep'
+    reads = frozenset({'population', 'food_level', 'structural_integrity'})
+    writes = frozenset({'food_level', 'structural_integrity'})
+
+    def run(self, simulation, cycle):
+        hive_state = simulation.hive_state
+        total_population = sum(hive_state.population.values())
+        hive_state.food_level = max(0, hive_state.food_level - total_population // 2)
+        wear = simulation.rng.stream('upkeep').randint(1, 3)
+        hive_state.structural_integrity = max(0, hive_state.structural_integrity - wear)
+        return total_population
+
+
+def default_phases() -> List[Phase]:
+    return [
+        AgingPhase(), SuccessionPhase(), ThreatPhase(), QueenPhase(), CerebralPhase(),
+        WorkerPhase(), SoldierPhase(), CleanerPhase(), ArchitectPhase(),
+        BreedingPhase(), EmergencyPhase(), NaturalBirthsPhase(), UpkeepPhase(),
+    ]
+
+
+class Pipeline:
+    """The ordered phases ``simulate_cycle`` runs, editable per hive by phase name."""
+
+    def __init__(self, phases: Optional[Iterable[Phase]] = None):
+        self.phases: List[Phase] = list(phases) if phases is not None else default_phases()
+
+    def __iter__(self) -> Iterator[Phase]:
+        return iter(self.phases)
+
+    def __len__(self) -> int:
+        return len(self.phases)
+
+    def __getitem__(self, name: str) -> Phase:
+        return self.phases[self.index(name)]
+
+    def names(self) -> List[str]:
+        return [phase.name for phase in self.phases]
+
+    def index(self, name: str) -> int:
+        for i, phase in enumerate(self.phases):
+            if phase.name == name:
+                return i
+        raise KeyError(f"No phase named {name!r}")
+
+    def replace(self, name: str, phase: Phase) -> Phase:
+        """Swap in ``phase`` at the position of ``name`` and return the old phase."""
+        i = self.index(name)
+        old, self.phases[i] = self.phases[i], phase
+        return old
+
+    def insert(self, phase: Phase, before: Optional[str] = None) -> None:
+        """Insert ``phase`` before the phase named ``before``, or at the end."""
+        self.phases.insert(self.index(before) if before is not None else len(self.phases), phase)
+
+    def remove(self, name: str) -> Phase:
+        return self.phases.pop(self.index(name))
+
+    def enable(self, name: str) -> None:
+        self[name].enabled = True
+
+    def disable(self, name: str) -> None:
+        self[name].enabled = False
+
+    def batches(self) -> List[List[Phase]]:
+        """Enabled phases grouped into runs of consecutive, mutually independent phases.
+
+        By their declared reads and writes, no phase in a batch writes
+        anything another one in it uses, so a batch could be scheduled
+        concurrently without changing the result; batches themselves must
+        run in order. This holds only as far as those declarations do.
+        """
+        batches: List[List[Phase]] = []
+        for phase in self.phases:
+            if not phase.enabled:
+                continue
+            if batches and not any(phase.conflicts_with(other) for other in batches[-1]):
+                batches[-1].append(phase)
+            else:
+                batches.append([phase])
+        return batches
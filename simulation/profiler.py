@@ -0,0 +1,84 @@
+import math
+import time
+from typing import Dict, Mapping, Tuple
+
+# Log-spaced buckets: each is 5% wider than the last, starting at 100 ns
+BUCKET_GROWTH = 1.05
+BUCKET_MIN = 1e-7
+BUCKET_COUNT = 600
+_LOG_GROWTH = math.log(BUCKET_GROWTH)
+
+
+class Histogram:
+    """Cumulative duration histogram with fixed memory; percentiles are accurate to about 5%."""
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        if seconds > BUCKET_MIN:
+            bucket = min(int(math.log(seconds / BUCKET_MIN) / _LOG_GROWTH) + 1, BUCKET_COUNT - 1)
+        else:
+            bucket = 0
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Upper edge of the bucket holding the ``q``-th percentile (``q`` in 0..100)."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(BUCKET_MIN * BUCKET_GROWTH ** bucket, self.max)
+        return self.max
+
+
+class PhaseProfiler:
+    """Lap timer for the phases of simulate_cycle.
+
+    The engine calls ``start()`` when a cycle begins and ``mark(phase, organisms)``
+    as each phase finishes; a lap is the wall time since the previous mark.
+    With no profiler attached the engine skips these calls entirely.
+    """
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+        self.last_cycle: Dict[str, Tuple[float, int]] = {}
+        self._lap_start = 0.0
+
+    def start(self) -> None:
+        # A fresh dict each cycle, so statistics snapshots can keep the previous one
+        self.last_cycle = {}
+        self._lap_start = time.perf_counter()
+
+    def mark(self, phase: str, organisms: int) -> None:
+        now = time.perf_counter()
+        seconds = now - self._lap_start
+        self._lap_start = now
+        self.last_cycle[phase] = (seconds, organisms)
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            histogram = self.histograms[phase] = Histogram()
+        histogram.record(seconds)
+
+    def percentiles(self) -> Dict[str, Mapping[str, float]]:
+        return {
+            phase: {
+                'count': histogram.count,
+                'mean': histogram.total / histogram.count,
+                'p50': histogram.percentile(50),
+                'p95': histogram.percentile(95),
+                'p99': histogram.percentile(99),
+                'max': histogram.max,
+            }
+            for phase, histogram in self.histograms.items()
+        }
@@ -0,0 +1,105 @@
+import csv
+from array import array
+from typing import Dict, List
+from constants.enums import CasteType
+from .bus import CycleEnded
+from .core import HiveSimulation
+
+CASTES = list(CasteType)
+STATE_COLUMNS = ('cycle', 'food_level', 'waste_level', 'structural_integrity', 'threat_level')
+CASTE_GROUPS = ('population', 'births', 'deaths')
+
+
+class MetricsRecorder:
+    """Per-cycle hive metrics in preallocated, typed columns.
+
+    Every completed cycle becomes one row: the hive state, then population,
+    births and deaths for each caste. By default the columns grow (doubling)
+    once ``capacity`` rows are used; with ``ring=True`` memory stays fixed
+    and only the most recent ``capacity`` cycles are kept.
+    """
+
+    def __init__(self, simulation: HiveSimulation, capacity: int = 4096, ring: bool = False):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.simulation = simulation
+        self.capacity = capacity
+        self.ring = ring
+        self.recorded = 0
+        self.names: List[str] = list(STATE_COLUMNS) + [
+            f"{group}_{caste.name.lower()}" for group in CASTE_GROUPS for caste in CASTES
+        ]
+        self._columns = [array('q', bytes(8 * capacity)) for _ in self.names]
+        state_columns = self._columns[:len(STATE_COLUMNS)]
+        (self._cycle, self._food, self._waste, self._integrity, self._threat) = state_columns
+        caste_columns = self._columns[len(STATE_COLUMNS):]
+        self._population = list(zip(CASTES, caste_columns[:len(CASTES)]))
+        self._births = list(zip(CASTES, caste_columns[len(CASTES):2 * len(CASTES)]))
+        self._deaths = list(zip(CASTES, caste_columns[2 * len(CASTES):]))
+
+    def attach(self) -> None:
+        self.simulation.events.subscribe(CycleEnded, self.on_cycle_ended)
+
+    def detach(self) -> None:
+        self.simulation.events.unsubscribe(CycleEnded, self.on_cycle_ended)
+
+    def __len__(self) -> int:
+        return min(self.recorded, self.capacity) if self.ring else self.recorded
+
+    def on_cycle_ended(self, event: CycleEnded) -> None:
+        self.record(event.cycle)
+
+    def record(self, cycle: int) -> None:
+        i = self.recorded
+        if self.ring:
+            i %= self.capacity
+        elif i == self.capacity:
+            self._grow()
+        self.recorded += 1
+
+        simulation = self.simulation
+        state = simulation.hive_state
+        self._cycle[i] = cycle
+        self._food[i] = state.food_level
+        self._waste[i] = state.waste_level
+        self._integrity[i] = state.structural_integrity
+        self._threat[i] = state.threat_level.value
+        population = state.population
+        for caste, column in self._population:
+            column[i] = population[caste]
+        births = simulation.cycle_births
+        for caste, column in self._births:
+            column[i] = births.get(caste, 0)
+        deaths = simulation.cycle_deaths
+        for caste, column in self._deaths:
+            column[i] = deaths.get(caste, 0)
+
+    def _grow(self) -> None:
+        padding = array('q', bytes(8 * self.capacity))
+        for column in self._columns:
+            column.extend(padding)
+        self.capacity *= 2
+
+    def column(self, name: str) -> array:
+        """One metric in recording order (oldest first for a wrapped ring)."""
+        values = self._columns[self.names.index(name)]
+        n = len(self)
+        if self.ring and self.recorded > self.capacity:
+            start = self.recorded % self.capacity
+            return values[start:] + values[:start]
+        return values[:n]
+
+    def columns(self) -> Dict[str, array]:
+        return {name: self.column(name) for name in self.names}
+
+    def to_csv(self, path: str) -> None:
+        columns = [self.column(name) for name in self.names]
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.names)
+            writer.writerows(zip(*columns))
+
+    def to_npz(self, path: str) -> None:
+        import numpy as np
+        np.savez_compressed(path, **{name: np.frombuffer(values, dtype=np.int64)
+                                     for name, values in self.columns().items()})
@@ -0,0 +1,103 @@
+import asyncio
+import time
+from typing import Callable, Dict, List, Optional
+from .bus import QueenDeath, EmergencySpawn, ThreatChanged, HiveCollapse
+from .core import HiveSimulation
+
+
+class StatusRenderer:
+    """A status line drawn at a fixed refresh rate, however fast the hive runs.
+
+    Each frame samples the last published statistics. Births and deaths are
+    the change in the totals since the previous frame. The rare events seen
+    in between (threat changes, queen deaths, emergency spawns, collapse)
+    are counted rather than printed one by one. Per-cycle work on the
+    simulation side is one counter bump for each of those events.
+    """
+
+    def __init__(self, simulation: HiveSimulation, refresh_hz: float = 1.0,
+                 write: Callable[[str], None] = print):
+        if refresh_hz <= 0:
+            raise ValueError("refresh_hz must be positive")
+        self.simulation = simulation
+        self.interval = 1.0 / refresh_hz
+        self.write = write
+        self._handlers = {
+            ThreatChanged: self.on_threat_changed,
+            QueenDeath: self.on_queen_death,
+            EmergencySpawn: self.on_emergency_spawn,
+            HiveCollapse: self.on_hive_collapse,
+        }
+        self._threat_changes = 0
+        self._queen_deaths = 0
+        self._emergency_spawns = 0
+        self._collapsed = False
+        self._mark()
+
+    def attach(self) -> None:
+        for event_type, handler in self._handlers.items():
+            self.simulation.events.subscribe(event_type, handler)
+
+    def detach(self) -> None:
+        for event_type, handler in self._handlers.items():
+            self.simulation.events.unsubscribe(event_type, handler)
+
+    def on_threat_changed(self, event: ThreatChanged):
+        self._threat_changes += 1
+
+    def on_queen_death(self, event: QueenDeath):
+        self._queen_deaths += 1
+
+    def on_emergency_spawn(self, event: EmergencySpawn):
+        self._emergency_spawns += 1
+
+    def on_hive_collapse(self, event: HiveCollapse):
+        self._collapsed = True
+
+    def _mark(self, stats=None):
+        stats = stats if stats is not None else self.simulation.get_statistics()
+        self._last_cycle = stats['total_cycles']
+        self._last_births = stats['total_births']
+        self._last_deaths = stats['total_deaths']
+        self._last_time = time.perf_counter()
+
+    def frame(self) -> str:
+        """Render one frame and start counting the next one."""
+        stats = self.simulation.get_statistics()
+        now = time.perf_counter()
+        cycles = stats['total_cycles'] - self._last_cycle
+        rate = cycles / (now - self._last_time) if now > self._last_time else 0.0
+        births = stats['total_births'] - self._last_births
+        deaths = stats['total_deaths'] - self._last_deaths
+
+        parts: List[str] = [
+            f"[C{stats['total_cycles']}] pop {stats['total_population']}",
+            f"food {stats['current_food']}",
+            f"waste {stats['current_waste']}",
+            f"structure {stats['current_structure']}%",
+            f"threat {stats['current_threat']}",
+            f"+{births} births, -{deaths} deaths since last frame ({cycles} cycles, {rate:.1f}/s)",
+        ]
+        notes: Dict[str, int] = {
+            'threat change': self._threat_changes,
+            'queen death': self._queen_deaths,
+            'emergency spawn': self._emergency_spawns,
+        }
+        counted = [f"{count} {name}{'s' if count != 1 else ''}" for name, count in notes.items() if count]
+        if counted:
+            parts.append(", ".join(counted))
+        if self._collapsed:
+            parts.append("HIVE COLLAPSED")
+
+        self._threat_changes = self._queen_deaths = self._emergency_spawns = 0
+        self._mark(stats)
+        return " | ".join(parts)
+
+    async def run(self, until: Optional[asyncio.Future] = None) -> None:
+        """Write a frame every refresh interval until ``until`` completes, then a final one."""
+        while until is None or not until.done():
+            if until is None:
+                await asyncio.sleep(self.interval)
+            else:
+                await asyncio.wait({until}, timeout=self.interval)
+            self.write(self.frame())
@@ -0,0 +1,36 @@
+from concurrent.futures import Executor
+from typing import Optional
+from .blocks import run_caste
+from .phases import CastePhase, Phase, Pipeline
+
+
+class ShardedCastePhase(Phase):
+    """A caste phase whose blocks are spread over an executor.
+
+    Every caste phase already splits its caste into fixed-size blocks, each
+    drawing from its own stream (see ``simulation.blocks``). Sharding only
+    changes where those blocks run: the first in the simulation's thread,
+    the rest in ``executor``. Results match the phase it wraps exactly, for
+    any executor and any number of workers; size the executor to choose how
+    many cores are used.
+    """
+
+    def __init__(self, phase: CastePhase, executor: Optional[Executor] = None):
+        super().__init__(phase.enabled)
+        self.phase = phase
+        self.name = phase.name
+        self.reads = phase.reads
+        self.writes = phase.writes
+        self.executor = executor
+
+    def run(self, simulation, cycle):
+        results, acting = run_caste(simulation, self.phase.caste_type, self.name, self.executor)
+        self.phase.apply(simulation, results)
+        return acting
+
+
+def shard_caste_phases(pipeline: Pipeline, executor: Optional[Executor] = None) -> None:
+    """Replace every caste phase in ``pipeline`` with a ``ShardedCastePhase`` running in ``executor``."""
+    for phase in list(pipeline):
+        if isinstance(phase, CastePhase):
+            pipeline.replace(phase.name, ShardedCastePhase(phase, executor))
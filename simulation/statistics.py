@@ -1,7 +1,6 @@
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from entities.hive_state import HiveState
-from constants.enums import CasteType
-from entities.base import Organism
 
 def get_simulation_statistics(hive_state: HiveState, cycle_count: int) -> Dict[str, Any]:
     """Generate simulation statistics"""
@@ -17,22 +16,16 @@ def get_simulation_statistics(hive_state: HiveState, cycle_count: int) -> Dict[s
         'population_by_caste': {caste.value: count for caste, count in hive_state.population.items()}
     }
 
-def print_status(hive_state: HiveState, organisms: Dict[int, 'Organism']):
-    """Print current hive status"""
-    total_population = sum(hive_state.population.values())
-    living_queens = [org for org in organisms.values() 
-                     if org.caste_type == CasteType.QUEEN and org.active]
-    queen_info = f" (Queen: {living_queens[0].id}, age {living_queens[0].age})" if living_queens else " (NO QUEEN!)"
-    
-    print(f"Food: {hive_state.food_level} | "
-          f"Waste: {hive_state.waste_level} | "
-          f"Structure: {hive_state.structural_integrity}% | "
-          f"Threat: {hive_state.threat_level.name}")
-    
-    print(f"Population ({total_population} total){queen_info}:", end=" ")
-    for caste_type, count in hive_state.population.items():
-        if count > 0:
-            print(f"{caste_type.value}: {count}", end=" | ")
-    print()
-    
-    print(f"Total Births: {hive_state.total_births} | Total Deaths: {hive_state.total_deaths}")
\ No newline at end of file
+def statistics_snapshot(hive_state: HiveState, cycle_count: int,
+                        phases: Optional[Dict[str, Tuple[float, int]]] = None) -> Dict[str, Any]:
+    """Statistics that later cycles cannot change underneath a reader"""
+    stats = get_simulation_statistics(hive_state, cycle_count)
+    if phases is not None:
+        # (seconds, organisms) per phase of the last cycle; the profiler starts a new dict every cycle
+        stats['phase_timings'] = phases
+    return stats
+
+def read_only(stats: Dict[str, Any]) -> Mapping[str, Any]:
+    """A read-only view of a statistics snapshot, nested mappings included"""
+    return MappingProxyType({key: MappingProxyType(value) if isinstance(value, dict) else value
+                             for key, value in stats.items()})
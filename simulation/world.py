@@ -0,0 +1,104 @@
+from typing import Any, Dict, List, Optional
+from constants.enums import ThreatLevel
+from entities.policy import DecisionCache
+from .core import HiveSimulation
+from .rng import RandomStreams
+
+
+class FoodPool:
+    """Food shared by every hive in a world; foragers can only take what is left."""
+
+    def __init__(self, food: int, regrowth: int = 0, capacity: Optional[int] = None):
+        self.food = food
+        self.regrowth = regrowth
+        self.capacity = capacity
+
+    def take(self, amount: int) -> int:
+        taken = min(amount, self.food)
+        self.food -= taken
+        return taken
+
+    def regrow(self) -> None:
+        self.food += self.regrowth
+        if self.capacity is not None:
+            self.food = min(self.food, self.capacity)
+
+
+class HiveWorld:
+    """Many hives advanced together in world cycles.
+
+    Every world cycle runs one cycle of each living hive. The order rotates
+    by one hive per world cycle, so no hive always gets first pick of a
+    shared food pool. Hives sit on a ring; each hive at HIGH threat or above
+    adds ``threat_spread`` to the chance that its neighbours' threat rises
+    during their own random threat roll.
+
+    Hives are stepped one after another and nothing is batched across them,
+    so a world cycle costs the sum of its hives' cycles: about 140-160 us
+    for a hive of the default size, or under one world cycle per second for
+    10,000 hives. Worlds that large are for batch runs, not live viewing.
+    """
+
+    def __init__(self, hive_count: int, seed: Optional[int] = None, store: str = 'object',
+                 radius: int = 1, threat_spread: float = 0.02, food_pool: Optional[FoodPool] = None):
+        if hive_count <= 0:
+            raise ValueError("hive_count must be positive")
+        self.rng = RandomStreams(seed)
+        # Hives in one world pass through the same few regimes, so they share queen decisions
+        self.decisions = DecisionCache()
+        self.hives: List[HiveSimulation] = [
+            HiveSimulation(verbose=False, store=store, seed=self.rng.derive_seed('hive', i), decisions=self.decisions)
+            for i in range(hive_count)
+        ]
+        self.neighbours: List[List[int]] = [
+            sorted({(i + offset) % hive_count for offset in range(-radius, radius + 1)} - {i})
+            for i in range(hive_count)
+        ]
+        self.threat_spread = threat_spread
+        self.food_pool = food_pool
+        for hive in self.hives:
+            hive.food_pool = food_pool
+        self.alive = [True] * hive_count
+        self.cycle_count = 0
+
+    def _spread_threats(self) -> None:
+        hives, alive = self.hives, self.alive
+        alarmed = [alive[i] and hive.hive_state.threat_level.value >= ThreatLevel.HIGH.value
+                   for i, hive in enumerate(hives)]
+        spread = self.threat_spread
+        for hive, neighbours in zip(hives, self.neighbours):
+            hive.threat_pressure = spread * sum(alarmed[j] for j in neighbours)
+
+    def step(self) -> int:
+        """Advance one world cycle; returns the number of hives still alive."""
+        if self.threat_spread:
+            self._spread_threats()
+        if self.food_pool is not None:
+            self.food_pool.regrow()
+
+        hives, alive = self.hives, self.alive
+        n = len(hives)
+        start = self.cycle_count % n
+        for i in list(range(start, n)) + list(range(start)):
+            if alive[i] and not hives[i].simulate_cycle():
+                alive[i] = False
+        self.cycle_count += 1
+        return sum(alive)
+
+    def run(self, world_cycles: int) -> int:
+        living = sum(self.alive)
+        for _ in range(world_cycles):
+            if not living:
+                break
+            living = self.step()
+        return living
+
+    def get_statistics(self) -> Dict[str, Any]:
+        living = [hive for hive, alive in zip(self.hives, self.alive) if alive]
+        return {
+            'world_cycles': self.cycle_count,
+            'hives': len(self.hives),
+            'living_hives': len(living),
+            'total_population': sum(sum(hive.hive_state.population.values()) for hive in living),
+            'shared_food': self.food_pool.food if self.food_pool is not None else None,
+        }
@@ -0,0 +1,61 @@
+from constants.enums import CasteType
+from simulation import HiveSimulation
+from simulation.allocation import IdAllocator, OrganismPool
+
+
+def test_ids_and_blocks_never_overlap():
+    ids = IdAllocator(next_id=10)
+    first = ids.allocate()
+    block = ids.allocate_block(5)
+    last = ids.allocate()
+    assert first == 10
+    assert list(block) == [11, 12, 13, 14, 15]
+    assert last == 16
+    assert ids.allocate_block(0) == range(17, 17)
+    assert ids.next_id == 17
+
+
+def test_released_organism_comes_back_reinitialized():
+    pool = OrganismPool()
+    worker = pool.acquire(CasteType.WORKER, 1, age=30)
+    worker.active = False
+    worker.birth_cycle = 4
+    pool.release(worker)
+
+    reused = pool.acquire(CasteType.WORKER, 2)
+    assert reused is worker
+    assert (reused.id, reused.age, reused.active, reused.birth_cycle) == (2, 0, True, None)
+    assert (pool.created, pool.reused) == (1, 1)
+    # Free lists are per caste
+    assert pool.acquire(CasteType.SOLDIER, 3).caste_type is CasteType.SOLDIER
+    assert pool.created == 2
+
+
+def test_free_lists_are_capped():
+    pool = OrganismPool(max_free=2)
+    for organism_id in range(5):
+        pool.release(pool.acquire(CasteType.CLEANER, organism_id))
+    assert (pool.created, pool.reused) == (1, 4)
+
+    dead = [pool.acquire(CasteType.CLEANER, organism_id) for organism_id in range(10, 15)]
+    for organism in dead:
+        pool.release(organism)
+    survivors = {id(pool.acquire(CasteType.CLEANER, organism_id)) for organism_id in range(20, 23)}
+    assert len(survivors & {id(organism) for organism in dead}) == 2
+
+
+def test_recycled_organisms_get_fresh_unique_ids():
+    simulation = HiveSimulation(verbose=False, seed=5)
+    seen = set(simulation.organisms)
+    for _ in range(80):
+        next_id = simulation.ids.next_id
+        if not simulation.simulate_cycle():
+            break
+        current = set(simulation.organisms)
+        born = current - seen
+        # New organisms take ids past every one handed out before, even when the object is recycled
+        assert all(organism_id >= next_id for organism_id in born)
+        seen |= current
+    assert simulation.pool.reused > 0
+    assert all(organism.id == organism_id for organism_id, organism in simulation.organisms.items())
+    assert max(simulation.organisms) < simulation.ids.next_id
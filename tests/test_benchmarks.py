@@ -0,0 +1,33 @@
+import json
+import pytest
+from constants.enums import CasteType
+from benchmarks.suite import SCENARIOS, main, run_case, scaled_population
+
+
+@pytest.mark.parametrize('organisms', [2, 100, 12345])
+def test_scaled_population_has_one_queen_and_the_right_total(organisms):
+    population = scaled_population(organisms)
+    assert population[CasteType.QUEEN] == 1
+    assert sum(population.values()) == organisms
+
+
+@pytest.mark.parametrize('scenario', list(SCENARIOS))
+def test_run_case_reports_a_reproducible_run(scenario):
+    first = run_case(200, scenario, 'object', cycles=4, seed=3, profile=True)
+    second = run_case(200, scenario, 'object', cycles=4, seed=3)
+    assert first['cycles'] <= 4
+    assert first['final_population'] == second['final_population']
+    assert first['bytes_per_organism'] > 0
+    assert 'workers' in first['phases']
+
+
+def test_main_writes_and_compares_results(tmp_path, capsys):
+    output = str(tmp_path / 'results.json')
+    argv = ['--sizes', '100', '--scenarios', 'steady', '--cycles', '3', '--output', output]
+    main(argv)
+    with open(output) as f:
+        results = json.load(f)['results']
+    assert [(r['organisms'], r['scenario'], r['store']) for r in results] == [(100, 'steady', 'object')]
+
+    main(argv + ['--compare', output])
+    assert "Speedup versus" in capsys.readouterr().out
@@ -0,0 +1,63 @@
+import pytest
+from constants.enums import CasteType
+from simulation import ConsoleSink, EventBus, HiveSimulation
+from simulation.bus import Birth, EmergencySpawn
+
+POPULATION = {CasteType.QUEEN: 0, CasteType.WORKER: 10, CasteType.SOLDIER: 5, CasteType.CLEANER: 3,
+              CasteType.BREEDER: 2, CasteType.BIO_ARCHITECT: 2}
+
+
+@pytest.mark.parametrize('store', ['object', 'cohort'])
+def test_every_birth_is_announced(store):
+    simulation = HiveSimulation(verbose=False, store=store, seed=2, population=POPULATION)
+    births = []
+    emergencies = []
+    simulation.events.subscribe(Birth, births.append)
+    simulation.events.subscribe(EmergencySpawn, emergencies.append)
+    start = simulation.hive_state.total_births
+    for _ in range(60):
+        if not simulation.simulate_cycle():
+            break
+
+    # The hive starts without a queen, so the first cycle spawns one as an emergency
+    assert emergencies[0].reason == 'queen'
+    assert births[0].source == 'emergency'
+    assert births[0].organisms[0][0] == CasteType.QUEEN
+    announced = sum(len(event.organisms) + sum(event.counts.values()) for event in births)
+    assert announced == simulation.hive_state.total_births - start
+
+
+def test_wants_follows_subscriptions():
+    bus = EventBus()
+    seen = []
+    assert not bus.wants(Birth)
+    bus.subscribe(Birth, seen.append)
+    bus.subscribe(Birth, seen.append)
+    assert bus.wants(Birth) and not bus.wants(EmergencySpawn)
+
+    event = Birth(0, 'queen', ())
+    bus.publish(event)
+    assert seen == [event, event]
+    bus.unsubscribe(Birth, seen.append)
+    assert bus.wants(Birth)
+    bus.unsubscribe(Birth, seen.append)
+    assert not bus.wants(Birth)
+    # Unknown handlers and event types are ignored
+    bus.unsubscribe(Birth, seen.append)
+    bus.publish(event)
+    assert len(seen) == 2
+
+
+def test_console_sink_writes_through_its_callback():
+    simulation = HiveSimulation(verbose=False, seed=3)
+    lines = []
+    console = ConsoleSink(lines.append)
+    console.attach(simulation.events)
+    simulation.simulate_cycle()
+    assert lines[0] == "\n=== CYCLE 0 ==="
+    assert any(line.startswith("Food: ") for line in lines)
+
+    console.detach(simulation.events)
+    written = len(lines)
+    simulation.simulate_cycle()
+    assert len(lines) == written
@@ -0,0 +1,21 @@
+from constants.enums import CasteType
+from simulation import HiveSimulation
+
+
+def test_index_matches_a_full_scan():
+    simulation = HiveSimulation(verbose=False, seed=6)
+    for _ in range(60):
+        if not simulation.simulate_cycle():
+            break
+        for caste in CasteType:
+            scanned = [o for o in simulation.organisms.values() if o.caste_type == caste]
+            assert simulation._get_organisms_by_caste(caste) == scanned
+            assert len(scanned) == simulation.hive_state.population[caste]
+
+
+def test_index_follows_removal():
+    simulation = HiveSimulation(verbose=False, seed=6)
+    worker = simulation._get_organisms_by_caste(CasteType.WORKER)[0]
+    simulation._remove_organism(worker)
+    assert worker not in simulation._get_organisms_by_caste(CasteType.WORKER)
+    assert worker.id not in simulation.organisms
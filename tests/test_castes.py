@@ -0,0 +1,78 @@
+import random
+import pytest
+from constants.enums import CasteType, ThreatLevel
+from entities import BioArchitect, Cleaner, HiveState, Soldier, Worker
+from simulation.blocks import CASTE_PHASES
+
+ORGANISMS = 40_000
+EFFECTIVENESS = [0.4, 0.7, 1.0, 1.2]
+
+
+@pytest.mark.parametrize('caste_type', list(CASTE_PHASES))
+def test_array_form_matches_object_form(caste_type):
+    np = pytest.importorskip('numpy')
+    # Low integrity keeps the architects' cap out of the way; waste below the cleaners' rolls exercises the min
+    hive_state = HiveState(waste_level=10, threat_level=ThreatLevel.HIGH, structural_integrity=-10 ** 9)
+    values = [EFFECTIVENESS[i % len(EFFECTIVENESS)] for i in range(ORGANISMS)]
+    forms = CASTE_PHASES[caste_type]
+    expected = forms['object'](values, hive_state, random.Random(1))
+    actual = forms['array'](np.array(values), hive_state, np.random.default_rng(1))
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, ThreatLevel):
+            assert actual[key] == value
+        else:
+            assert type(actual[key]) is int
+            assert actual[key] == pytest.approx(value, rel=0.02)
+
+
+def test_array_forms_handle_edge_states():
+    np = pytest.importorskip('numpy')
+    forms = {caste: CASTE_PHASES[caste]['array'] for caste in CASTE_PHASES}
+    values = np.ones(100)
+    rng = np.random.default_rng(0)
+    assert forms[CasteType.SOLDIER](values, HiveState(threat_level=ThreatLevel.NONE), rng) == {'defense_power': 0}
+    assert forms[CasteType.CLEANER](values, HiveState(waste_level=0), rng) == {'waste_processed': 0,
+                                                                                'biomass_recycled': 0}
+    assert forms[CasteType.BIO_ARCHITECT](values, HiveState(structural_integrity=97), rng) == {'repair_applied': 3}
+    assert forms[CasteType.BIO_ARCHITECT](values, HiveState(structural_integrity=120), rng) == {'repair_applied': 0}
+    empty = forms[CasteType.WORKER](np.ones(0), HiveState(), rng)
+    assert empty == {'food_gathered': 0, 'waste_generated': 0}
+
+
+def _members(cls, count):
+    members = [cls(i, age=i % 12) for i in range(count)]
+    members[0].retire()
+    return members
+
+
+def test_batches_match_per_organism_calls():
+    hive_state = HiveState(waste_level=12, threat_level=ThreatLevel.MEDIUM, structural_integrity=40)
+
+    workers = _members(Worker, 200)
+    rng = random.Random(3)
+    singles = [w.execute_tasks(hive_state, rng) for w in workers]
+    batch = Worker.execute_tasks_batch(workers, hive_state, random.Random(3))
+    assert batch['food_gathered'] == sum(r.get('food_gathered', 0) for r in singles)
+    assert batch['waste_generated'] == sum(r.get('waste_generated', 0) for r in singles)
+    detected = [r['threat_detected'] for r in singles if 'threat_detected' in r]
+    assert batch.get('threat_detected') == max(detected, key=lambda level: level.value, default=None)
+
+    soldiers = _members(Soldier, 50)
+    rng = random.Random(4)
+    defense = sum(s.defend_hive(hive_state.threat_level, rng) for s in soldiers)
+    assert Soldier.defend_hive_batch(soldiers, hive_state, random.Random(4)) == {'defense_power': defense}
+
+    cleaners = _members(Cleaner, 50)
+    rng = random.Random(5)
+    singles = [c.process_waste(hive_state.waste_level, rng) for c in cleaners]
+    assert Cleaner.process_waste_batch(cleaners, hive_state, random.Random(5)) == {
+        key: sum(r[key] for r in singles) for key in ('waste_processed', 'biomass_recycled')}
+
+    architects = _members(BioArchitect, 5)
+    rng = random.Random(6)
+    integrity = hive_state.structural_integrity
+    for architect in architects:
+        integrity = architect.maintain_structure(integrity, rng)
+    repaired = BioArchitect.maintain_structure_batch(architects, hive_state, random.Random(6))
+    assert repaired == {'repair_applied': integrity - hive_state.structural_integrity}
@@ -0,0 +1,75 @@
+import pytest
+from constants.enums import CasteType
+from simulation import HiveSimulation
+from simulation import CheckpointWriter
+from simulation.checkpoint import dumps, encode, loads, snapshot
+
+POPULATION = {CasteType.QUEEN: 1, CasteType.WORKER: 300, CasteType.SOLDIER: 60, CasteType.CLEANER: 60,
+              CasteType.BREEDER: 20, CasteType.BIO_ARCHITECT: 30}
+
+
+def _hive(store: str) -> HiveSimulation:
+    if store == 'array':
+        pytest.importorskip('numpy')
+    return HiveSimulation(verbose=False, store=store, seed=11, population=POPULATION)
+
+
+def _advance(simulation: HiveSimulation, cycles: int):
+    for _ in range(cycles):
+        if not simulation.simulate_cycle():
+            break
+    return dict(simulation.get_statistics())
+
+
+@pytest.mark.parametrize('store', ['object', 'array', 'cohort'])
+def test_restore_continues_bit_identically(store):
+    original = _hive(store)
+    _advance(original, 25)
+    data = dumps(original)
+    restored = loads(data)
+    assert dumps(restored) == data
+    assert _advance(restored, 40) == _advance(original, 40)
+    assert dumps(restored) == dumps(original)
+
+
+def test_restore_keeps_changed_ages_and_lifespans():
+    original = _hive('object')
+    _advance(original, 5)
+    workers = list(original._caste_index[CasteType.WORKER].values())
+    workers[0].age = 2
+    workers[1].max_lifespan = 7
+    restored = loads(dumps(original))
+    assert restored.organisms[workers[0].id].age == 2
+    assert restored.organisms[workers[1].id].max_lifespan == 7
+    assert _advance(restored, 30) == _advance(original, 30)
+
+
+def test_writer_encodes_the_hive_as_it_was(tmp_path):
+    simulation = _hive('object')
+    path = str(tmp_path / 'hive.ckpt')
+    writer = CheckpointWriter(simulation, path, every=5)
+    writer.attach()
+    _advance(simulation, 5)
+    expected = dumps(simulation)
+    pending = snapshot(simulation)
+    # Cohorts change and organisms are recycled before the snapshot is encoded
+    _advance(simulation, 3)
+    assert encode(pending) == expected
+    writer.flush()
+    with open(path, 'rb') as f:
+        assert f.read() == expected
+
+
+def test_restored_organisms_have_every_attribute():
+    original = _hive('object')
+    _advance(original, 5)
+    restored = loads(dumps(original))
+    for organism_id, organism in original.organisms.items():
+        twin = restored.organisms[organism_id]
+        assert type(twin) is type(organism)
+        for name in ('caste_type', 'active', 'birth_cycle', 'age', 'max_lifespan'):
+            assert getattr(twin, name) == getattr(organism, name)
+    queen = next(iter(restored._caste_index[CasteType.QUEEN].values()))
+    assert queen.genetic_blueprints == {}
+    for breeder in original._caste_index[CasteType.BREEDER].values():
+        assert restored.organisms[breeder.id].breeding_cooldown == breeder.breeding_cooldown
@@ -0,0 +1,43 @@
+import time
+import pytest
+from simulation import FixedRateClock, HiveSimulation, RealTimeClock, UnthrottledClock
+from simulation.bus import SimulationEnded
+
+
+def test_fixed_rate_clock_paces_from_the_start_time():
+    clock = FixedRateClock(100)
+    clock.start()
+    for _ in range(5):
+        clock.tick()
+    assert clock.elapsed() >= 0.049
+
+
+def test_fixed_rate_clock_resynchronises_instead_of_bursting():
+    clock = FixedRateClock(100)
+    clock.start()
+    time.sleep(0.05)
+    # Several deadlines were missed; only one cycle runs late, then pacing resumes
+    assert clock.next_delay() == 0.0
+    assert clock.next_delay() > 0.005
+
+
+def test_clocks_reject_non_positive_rates():
+    with pytest.raises(ValueError):
+        FixedRateClock(0)
+    with pytest.raises(ValueError):
+        RealTimeClock(-1)
+    assert UnthrottledClock().next_delay() == 0.0
+
+
+def test_headless_run_is_silent_and_restores_the_console(capsys):
+    simulation = HiveSimulation(verbose=True, seed=1)
+    capsys.readouterr()
+    ended = []
+    simulation.events.subscribe(SimulationEnded, ended.append)
+    cycles_per_second = simulation.run_simulation(max_cycles=20, headless=True)
+    assert capsys.readouterr().out == ''
+    assert ended[0].cycles_run == simulation.cycle_count
+    assert cycles_per_second == ended[0].cycles_per_second > 0
+
+    simulation.simulate_cycle()
+    assert capsys.readouterr().out != ''
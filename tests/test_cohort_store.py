@@ -0,0 +1,62 @@
+import pytest
+from constants.enums import CasteType
+from entities import Worker
+from entities.demographics import caste_curves
+from simulation import HiveSimulation
+from simulation.cohort_store import CohortPopulation, cohort_castes
+
+LARGE_HIVE = {
+    CasteType.QUEEN: 1, CasteType.WORKER: 20000, CasteType.SOLDIER: 5000, CasteType.CLEANER: 3000,
+    CasteType.BREEDER: 2, CasteType.BIO_ARCHITECT: 2000, CasteType.CEREBRAL: 0,
+}
+
+
+def test_aging_shifts_cohorts_and_retires_the_oldest():
+    store = CohortPopulation(seed=1)
+    lifespan = caste_curves(CasteType.WORKER).lifespan
+    store.add_counts(CasteType.WORKER, 5, age=3)
+    store.add_counts(CasteType.WORKER, 7, age=lifespan - 1)
+
+    deaths = store.age_all()
+    counts = store.counts[(CasteType.WORKER, 0)]
+    assert len(counts) == lifespan
+    assert deaths[CasteType.WORKER] >= 7
+    assert counts[4] + deaths[CasteType.WORKER] == 12
+    assert store.count(CasteType.WORKER) == counts[4]
+
+
+def test_effectiveness_groups_follow_the_organism_curve():
+    store = CohortPopulation(seed=1)
+    store.add_counts(CasteType.WORKER, 4, age=2)
+    store.add_counts(CasteType.WORKER, 6, age=20)
+    expected = {Worker(0, age=2).get_effectiveness(): 4, Worker(0, age=20).get_effectiveness(): 6}
+    assert dict(store.effectiveness_groups(CasteType.WORKER)) == expected
+
+
+def test_population_matches_the_stored_counts():
+    simulation = HiveSimulation(verbose=False, seed=3, store='cohort')
+    for _ in range(40):
+        if not simulation.simulate_cycle():
+            break
+        population = simulation.hive_state.population
+        for caste_type in cohort_castes():
+            assert population[caste_type] == simulation.store.count(caste_type)
+        stats = simulation.get_statistics()
+        assert stats['total_population'] == sum(stats['population_by_caste'].values())
+
+
+def test_statistics_agree_with_the_object_store():
+    results = {}
+    for store in ('object', 'cohort'):
+        simulation = HiveSimulation(verbose=False, seed=1, store=store, population=LARGE_HIVE)
+        for _ in range(5):
+            simulation.simulate_cycle()
+        results[store] = simulation.get_statistics()
+    objects, cohorts = results['object'], results['cohort']
+
+    assert set(cohorts) == set(objects)
+    assert cohorts['current_food'] == pytest.approx(objects['current_food'], rel=0.01)
+    assert cohorts['current_waste'] == pytest.approx(objects['current_waste'], rel=0.1)
+    assert cohorts['total_deaths'] == pytest.approx(objects['total_deaths'], rel=0.15)
+    for caste, count in objects['population_by_caste'].items():
+        assert cohorts['population_by_caste'][caste] == pytest.approx(count, rel=0.01)
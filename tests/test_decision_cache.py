@@ -0,0 +1,28 @@
+import copy
+import pickle
+from entities.policy import DecisionCache, QueenPolicy
+from .test_policy import _states
+
+
+def test_cache_matches_policy():
+    policy = QueenPolicy()
+    # Small enough to evict, so misses after eviction are checked too
+    cache = DecisionCache(policy, maxsize=64)
+    for args in _states(5000):
+        priorities, instructions = cache.decide(*args)
+        expected_priorities, expected_instructions = policy.decide(*args)
+        assert list(priorities.items()) == list(expected_priorities.items())
+        assert dict(instructions) == dict(expected_instructions)
+    assert cache.hits and cache.evictions
+
+
+def test_cache_survives_pickle_and_deepcopy():
+    cache = DecisionCache()
+    states = _states(500)
+    for args in states:
+        cache.decide(*args)
+    for copied in (pickle.loads(pickle.dumps(cache)), copy.deepcopy(cache)):
+        assert copied.stats() == cache.stats()
+        for args in states:
+            assert copied.decide(*args) == cache.decide(*args)
+        assert copied.misses == cache.misses
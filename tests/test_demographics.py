@@ -0,0 +1,39 @@
+from constants.enums import CasteType
+from constants.settings import LIFESPANS
+from entities import Worker
+from entities.demographics import (caste_curves, curves_for, death_chance_at, effectiveness_at, energy_at,
+                                   rebuild_tables)
+
+
+def test_tables_match_the_curves():
+    curves = curves_for(40)
+    assert len(curves.effectiveness) == len(curves.energy) == len(curves.death_chance) == 41
+    for age in range(41):
+        assert curves.effectiveness[age] == effectiveness_at(age / 40)
+        assert curves.energy[age] == energy_at(age / 40)
+        assert curves.death_chance[age] == death_chance_at(age, 40)
+    assert curves.death_chance[40] == 1.0
+    assert curves_for(40) is curves
+
+
+def test_organisms_read_the_tables_and_the_curves_past_them():
+    worker = Worker(1, age=10)
+    curves = caste_curves(CasteType.WORKER)
+    assert worker.get_effectiveness() == curves.effectiveness[10]
+    assert worker.energy == curves.energy[10]
+    lifespan = worker.max_lifespan
+    worker.age = lifespan + 5
+    assert worker.get_effectiveness() == effectiveness_at((lifespan + 5) / lifespan)
+    assert worker.energy == energy_at((lifespan + 5) / lifespan)
+
+
+def test_rebuild_follows_edited_lifespans(monkeypatch):
+    monkeypatch.setitem(LIFESPANS, CasteType.WORKER, 77)
+    try:
+        rebuild_tables()
+        assert caste_curves(CasteType.WORKER).lifespan == 77
+        assert Worker(1).max_lifespan == 77
+    finally:
+        monkeypatch.undo()
+        rebuild_tables()
+    assert caste_curves(CasteType.WORKER).lifespan == LIFESPANS[CasteType.WORKER]
@@ -0,0 +1,70 @@
+import asyncio
+from simulation import AsyncDriver, HiveSimulation, UnthrottledClock
+from simulation.bus import CycleEnded
+
+
+def _driver(seed=2):
+    return AsyncDriver(HiveSimulation(verbose=False, seed=seed), UnthrottledClock())
+
+
+def test_pause_step_resume_and_stop():
+    async def scenario():
+        driver = _driver()
+        simulation = driver.simulation
+        driver.pause()
+        run = asyncio.create_task(driver.run_simulation())
+        await asyncio.sleep(0.01)
+        assert driver.paused and simulation.cycle_count == 0
+
+        assert await driver.step(3)
+        assert simulation.cycle_count == 3
+        driver.resume()
+        while simulation.cycle_count < 10 and not run.done():
+            await asyncio.sleep(0)
+        driver.stop()
+        await run
+        return simulation
+
+    simulation = asyncio.run(scenario())
+    assert not simulation.running
+    assert simulation.cycle_count >= 10
+
+
+def test_stop_ends_a_paused_run():
+    async def scenario():
+        driver = _driver()
+        driver.pause()
+        run = asyncio.create_task(driver.run_simulation())
+        await asyncio.sleep(0.01)
+        driver.stop()
+        await asyncio.wait_for(run, 1)
+        return driver.simulation
+
+    assert asyncio.run(scenario()).cycle_count == 0
+
+
+def test_drivers_share_one_loop():
+    async def scenario():
+        drivers = [_driver(seed) for seed in (2, 3)]
+        order = []
+        for i, driver in enumerate(drivers):
+            driver.simulation.events.subscribe(CycleEnded, lambda event, i=i: order.append(i))
+        await asyncio.gather(*(driver.run_simulation(max_cycles=5) for driver in drivers))
+        return drivers, order
+
+    drivers, order = asyncio.run(scenario())
+    assert [driver.simulation.cycle_count for driver in drivers] == [5, 5]
+    # Each driver yields after every cycle, so the hives take turns
+    assert order[:4] == [0, 1, 0, 1]
+
+
+def test_statistics_and_speed_changes():
+    async def scenario():
+        driver = _driver()
+        driver.set_speed(1000)
+        await driver.run_simulation(max_cycles=3)
+        return driver
+
+    driver = asyncio.run(scenario())
+    assert driver.statistics()['total_cycles'] == 3
+    assert driver.simulation.cycles_per_second < 1500
@@ -0,0 +1,54 @@
+import pytest
+from constants.enums import CasteType
+from simulation.ensemble import (RunResult, iter_ensemble, mean_estimate, proportion_estimate, run_hive, summarize,
+                                 t_quantile)
+
+
+def test_mean_estimate_uses_the_t_interval():
+    estimate = mean_estimate([1.0, 2.0, 3.0, 4.0])
+    # Sample standard deviation 1.291, so the margin is t(3) * 1.291 / 2
+    assert estimate.mean == 2.5
+    assert estimate.high - estimate.mean == pytest.approx(3.182 * 1.2910 / 2, abs=1e-3)
+    assert estimate.low == pytest.approx(2 * estimate.mean - estimate.high)
+    assert mean_estimate([]) is None
+    single = mean_estimate([7.0])
+    assert (single.low, single.high, single.samples) == (7.0, 7.0, 1)
+
+
+def test_mean_estimate_clamps_at_the_lower_bound():
+    estimate = mean_estimate([0, 0, 0, 9], lower=0)
+    assert estimate.low == 0
+    assert estimate.high > estimate.mean
+
+
+def test_t_quantile_joins_the_table_smoothly():
+    assert t_quantile(1) == 12.706
+    assert t_quantile(31) == pytest.approx(2.040, abs=0.001)
+    assert t_quantile(1000) == pytest.approx(1.962, abs=0.001)
+
+
+def test_proportion_estimate_stays_in_bounds():
+    none = proportion_estimate(0, 10)
+    assert none.mean == 0.0 and none.low == 0.0 and 0 < none.high < 0.35
+    every = proportion_estimate(10, 10)
+    assert every.high == 1.0 and 0.65 < every.low < 1.0
+
+
+def test_summary_counts_collapses():
+    population = {caste: 0 for caste in CasteType}
+    results = [RunResult(0, 12, True, population), RunResult(1, 20, True, population),
+               RunResult(2, 50, False, {**population, CasteType.WORKER: 8})]
+    summary = summarize(results)
+    assert summary.runs == 3
+    assert summary.collapse_probability.mean == pytest.approx(2 / 3)
+    assert summary.time_to_collapse.mean == 16
+    assert summary.final_population[CasteType.WORKER].mean == pytest.approx(8 / 3)
+
+
+def test_ensemble_runs_are_the_seeded_hives():
+    results = sorted(iter_ensemble(3, 30, base_seed=5, workers=2), key=lambda r: r.seed)
+    assert [r.seed for r in results] == [5, 6, 7]
+    for result in results:
+        expected = run_hive(result.seed, 30)
+        assert (result.cycles, result.collapsed, result.final_population) == (
+            expected.cycles, expected.collapsed, expected.final_population)
@@ -0,0 +1,46 @@
+import pytest
+from constants.enums import CasteType
+from entities import Worker
+from simulation import HiveSimulation
+
+
+def _run(simulation: HiveSimulation, cycles: int):
+    for _ in range(cycles):
+        simulation.simulate_cycle()
+
+
+def test_setting_age_moves_member_to_matching_cohort():
+    simulation = HiveSimulation(verbose=False, seed=3)
+    worker = next(iter(simulation._caste_index[CasteType.WORKER].values()))
+    worker_id = worker.id
+    worker.age = 2
+    assert worker in simulation._cohorts[CasteType.WORKER][(worker._born, worker.max_lifespan)].values()
+    # Used to raise KeyError once the worker died or was removed; dead organisms are pooled and reused
+    _run(simulation, 60)
+    assert worker_id not in simulation.organisms
+
+
+def test_lifespan_change_takes_effect_in_hive():
+    simulation = HiveSimulation(verbose=False, seed=3)
+    queen = next(iter(simulation._caste_index[CasteType.QUEEN].values()))
+    queen_id = queen.id
+    queen.max_lifespan = queen.age
+    _run(simulation, 1)
+    assert queen_id not in simulation.organisms
+
+
+def test_age_organism_refuses_hive_members():
+    simulation = HiveSimulation(verbose=False, seed=3)
+    queen = next(iter(simulation._caste_index[CasteType.QUEEN].values()))
+    with pytest.raises(RuntimeError):
+        queen.age_organism()
+
+
+def test_standalone_organism_ages_on_its_own():
+    worker = Worker(1, age=3)
+    worker.age = 5
+    assert worker.age == 5
+    worker.age_organism()
+    assert worker.age == 6
+    with pytest.raises(AttributeError):
+        worker.energy = 1.0
@@ -0,0 +1,87 @@
+import pytest
+from constants.enums import CasteType
+from simulation import HiveSimulation, MetricsRecorder, Phase
+from simulation.phases import CastePhase, default_phases, Pipeline
+
+
+class CountingPhase(Phase):
+    name = 'counting'
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def run(self, simulation, cycle):
+        self.calls += 1
+        return None
+
+
+def test_default_batches_respect_shared_resources():
+    batches = [[phase.name for phase in batch] for batch in Pipeline().batches()]
+    assert ['soldiers', 'cleaners', 'architects'] in batches
+    # Both publish events, so they must not share a batch
+    assert ['succession'] in batches and ['threat'] in batches
+    for batch in Pipeline().batches():
+        for i, phase in enumerate(batch):
+            assert not any(phase.conflicts_with(other) for other in batch[i + 1:])
+
+
+def test_edit_pipeline_by_name():
+    pipeline = Pipeline()
+    pipeline.disable('threat')
+    assert pipeline['threat'] not in [phase for batch in pipeline.batches() for phase in batch]
+    counting = CountingPhase()
+    pipeline.insert(counting, before='upkeep')
+    assert pipeline.names()[-2:] == ['counting', 'upkeep']
+    old = pipeline.replace('counting', CountingPhase())
+    assert old is counting
+    with pytest.raises(KeyError):
+        pipeline.index('missing')
+
+
+def test_every_enabled_phase_is_timed():
+    phases = default_phases()
+    phases.insert(1, CountingPhase())
+    simulation = HiveSimulation(verbose=False, seed=2, profile=True, phases=phases)
+    simulation.pipeline.disable('threat')
+    simulation.simulate_cycle()
+    timed = list(simulation.profiler.last_cycle)
+    assert timed == [phase.name for phase in simulation.pipeline if phase.enabled]
+    assert simulation.pipeline['counting'].calls == 1
+    # cerebral had nothing to do but is still timed on its own
+    assert simulation.profiler.last_cycle['cerebral'][1] == 0
+
+
+def test_default_pipeline_is_deterministic():
+    def run():
+        simulation = HiveSimulation(verbose=False, seed=5)
+        for _ in range(50):
+            simulation.simulate_cycle()
+        return dict(simulation.get_statistics())
+    assert run() == run()
+
+
+def test_cycle_deaths_reset_when_aging_is_disabled():
+    simulation = HiveSimulation(verbose=False, seed=2)
+    simulation.simulate_cycle()
+    simulation.cycle_deaths = {CasteType.SOLDIER: 1}
+    simulation.pipeline.disable('aging')
+    recorder = MetricsRecorder(simulation)
+    recorder.attach()
+    for _ in range(5):
+        simulation.simulate_cycle()
+    assert simulation.cycle_deaths == {}
+    assert list(recorder.column('deaths_soldier')) == [0] * 5
+
+
+def test_incomplete_phases_fail_at_construction():
+    class NoRun(Phase):
+        name = 'no_run'
+
+    class NoApply(CastePhase):
+        name = 'no_apply'
+
+    with pytest.raises(TypeError):
+        NoRun()
+    with pytest.raises(TypeError):
+        NoApply()
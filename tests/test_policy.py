@@ -0,0 +1,39 @@
+import random
+import pytest
+from constants.enums import CasteType, Priority, ThreatLevel
+from entities import HiveState
+from entities.policy import QueenPolicy
+
+
+def _states(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        state = HiveState(food_level=rng.randint(0, 400), waste_level=rng.randint(0, 200),
+                          threat_level=rng.choice(list(ThreatLevel)), structural_integrity=rng.randint(0, 120),
+                          population={caste: rng.randint(0, 40) for caste in CasteType})
+        yield state, rng.choice((0.0, 0.3, 0.7, 1.0)), rng.randint(0, 120), 100, rng.randint(0, 3)
+
+
+def test_batch_table_matches_policy():
+    np = pytest.importorskip('numpy')
+    policy = QueenPolicy()
+    cases = list(_states(2000, seed=1))
+    columns = list(zip(*(
+        (state.food_level, state.waste_level, state.threat_level.value, state.structural_integrity,
+         sum(state.population.values()), state.population[CasteType.WORKER], state.population[CasteType.SOLDIER],
+         effectiveness, age, lifespan, queens)
+        for state, effectiveness, age, lifespan, queens in cases)))
+    urgency, rank = policy.priorities_batch(*(np.asarray(column) for column in columns))
+    orders = QueenPolicy.instructions_batch(urgency, rank)
+
+    for i, args in enumerate(cases):
+        priorities, instructions = policy.decide(*args)
+        raised = sorted((int(rank[p][i]), p) for p in urgency if rank[p][i] >= 0)
+        assert [p for _, p in raised] == list(priorities)
+        assert {p: int(urgency[p][i]) for _, p in raised} == dict(priorities)
+        assert {c: int(v[i]) for c, v in orders.items() if v[i]} == dict(instructions)
+
+
+def test_instructions_follow_last_raised_priority():
+    orders = QueenPolicy.instructions({Priority.INCREASE_WORKERS: 1, Priority.EMERGENCY_WORKERS: 3})
+    assert orders[CasteType.WORKER] == 3
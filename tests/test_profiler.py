@@ -0,0 +1,48 @@
+import time
+import pytest
+from simulation import HiveSimulation, PhaseProfiler
+from simulation.profiler import Histogram
+
+
+def test_histogram_percentiles_are_within_a_bucket():
+    histogram = Histogram()
+    samples = [i * 1e-5 for i in range(1, 1001)]
+    for seconds in samples:
+        histogram.record(seconds)
+    assert histogram.count == 1000
+    assert histogram.max == samples[-1]
+    assert histogram.total == pytest.approx(sum(samples))
+    for q, exact in ((50, samples[499]), (95, samples[949]), (99, samples[989])):
+        assert exact * 0.999 <= histogram.percentile(q) <= exact * 1.06
+    assert histogram.percentile(100) == samples[-1]
+    assert Histogram().percentile(50) == 0.0
+
+
+def test_laps_run_from_mark_to_mark():
+    profiler = PhaseProfiler()
+    profiler.start()
+    time.sleep(0.01)
+    profiler.mark('slow', 3)
+    profiler.mark('fast', 0)
+    slow, fast = profiler.last_cycle['slow'], profiler.last_cycle['fast']
+    assert slow[0] >= 0.009 and slow[1] == 3
+    assert fast[0] < slow[0]
+    previous = profiler.last_cycle
+    profiler.start()
+    assert profiler.last_cycle == {} and previous['slow'] == slow
+
+
+def test_statistics_carry_phase_timings_only_when_profiling():
+    plain = HiveSimulation(verbose=False, seed=1)
+    plain.simulate_cycle()
+    assert 'phase_timings' not in plain.get_statistics()
+
+    profiled = HiveSimulation(verbose=False, seed=1, profile=True)
+    for _ in range(5):
+        profiled.simulate_cycle()
+    timings = profiled.get_statistics()['phase_timings']
+    assert list(timings) == [phase.name for phase in profiled.pipeline if phase.enabled]
+    assert all(seconds >= 0 and organisms >= 0 for seconds, organisms in timings.values())
+    percentiles = profiled.profiler.percentiles()
+    assert all(row['count'] == 5 for row in percentiles.values())
+    assert all(row['p50'] <= row['p99'] <= row['max'] * 1.0001 for row in percentiles.values())
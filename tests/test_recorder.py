@@ -0,0 +1,58 @@
+import csv
+import pytest
+from constants.enums import CasteType
+from simulation import HiveSimulation, MetricsRecorder
+
+
+def _recorded(capacity, ring, cycles=12):
+    simulation = HiveSimulation(verbose=False, seed=4)
+    recorder = MetricsRecorder(simulation, capacity=capacity, ring=ring)
+    recorder.attach()
+    for _ in range(cycles):
+        simulation.simulate_cycle()
+    return simulation, recorder
+
+
+def test_columns_grow_past_capacity():
+    simulation, recorder = _recorded(capacity=5, ring=False)
+    assert len(recorder) == 12
+    assert list(recorder.column('cycle')) == list(range(12))
+    assert recorder.column('food_level')[-1] == simulation.hive_state.food_level
+    assert recorder.column('population_worker')[-1] == simulation.hive_state.population[CasteType.WORKER]
+
+
+def test_ring_keeps_the_latest_cycles_in_order():
+    _, full = _recorded(capacity=64, ring=False)
+    _, ring = _recorded(capacity=5, ring=True)
+    assert len(ring) == 5
+    for name in ring.names:
+        assert list(ring.column(name)) == list(full.column(name))[-5:]
+
+
+def test_births_and_deaths_add_up():
+    simulation, recorder = _recorded(capacity=64, ring=False, cycles=40)
+    births = sum(sum(recorder.column(f"births_{caste.name.lower()}")) for caste in CasteType)
+    deaths = sum(sum(recorder.column(f"deaths_{caste.name.lower()}")) for caste in CasteType)
+    start = HiveSimulation(verbose=False, seed=4).hive_state
+    assert births == simulation.hive_state.total_births - start.total_births
+    assert deaths == simulation.hive_state.total_deaths - start.total_deaths
+
+
+def test_exports(tmp_path):
+    _, recorder = _recorded(capacity=5, ring=True)
+    path = tmp_path / 'metrics.csv'
+    recorder.to_csv(str(path))
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == recorder.names
+    assert [int(row[0]) for row in rows[1:]] == list(recorder.column('cycle'))
+
+    np = pytest.importorskip('numpy')
+    recorder.to_npz(str(tmp_path / 'metrics.npz'))
+    with np.load(tmp_path / 'metrics.npz') as data:
+        assert data['cycle'].tolist() == list(recorder.column('cycle'))
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        MetricsRecorder(HiveSimulation(verbose=False, seed=1), capacity=0)
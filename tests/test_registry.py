@@ -0,0 +1,63 @@
+import pytest
+from constants.enums import CasteType
+from constants.settings import LIFESPANS
+from entities import CASTE_REGISTRY, Soldier, CerebralCaste
+from entities.registry import register_caste, storable_castes
+from simulation import HiveSimulation
+
+
+def test_every_caste_is_registered():
+    assert set(CASTE_REGISTRY) == set(CasteType)
+    assert CasteType.QUEEN not in storable_castes()
+    assert CASTE_REGISTRY[CasteType.SOLDIER].create(7, age=3).caste_type is CasteType.SOLDIER
+
+
+def test_register_caste_needs_a_lifespan(monkeypatch):
+    monkeypatch.setitem(CASTE_REGISTRY, CasteType.CEREBRAL, CASTE_REGISTRY[CasteType.CEREBRAL])
+    monkeypatch.delitem(LIFESPANS, CasteType.CEREBRAL)
+    with pytest.raises(ValueError):
+        register_caste(CasteType.CEREBRAL, CerebralCaste)
+
+
+def test_spawn_uses_the_registered_factory(monkeypatch):
+    monkeypatch.setitem(CASTE_REGISTRY, CasteType.CEREBRAL, CASTE_REGISTRY[CasteType.CEREBRAL])
+    created = []
+
+    def factory(organism_id, age):
+        created.append(organism_id)
+        return CerebralCaste(organism_id, age)
+
+    register_caste(CasteType.CEREBRAL, CerebralCaste, factory=factory)
+    simulation = HiveSimulation(verbose=False, seed=1)
+    ids = simulation.spawn(CasteType.CEREBRAL, 3)
+    assert created == list(ids)
+
+
+def test_bulk_spawn_registers_organisms_in_one_call():
+    simulation = HiveSimulation(verbose=False, seed=1)
+    population = simulation.hive_state.population[CasteType.SOLDIER]
+    births = simulation.hive_state.total_births
+
+    ids = simulation.spawn(CasteType.SOLDIER, 45, birth_cycle=0)
+    assert len(ids) == 45 and ids.start < ids.stop == simulation.ids.next_id
+    assert simulation.hive_state.population[CasteType.SOLDIER] == population + 45
+    assert simulation.hive_state.total_births == births + 45
+    assert simulation.cycle_births[CasteType.SOLDIER] == 45
+    for organism_id in ids:
+        organism = simulation.organisms[organism_id]
+        assert isinstance(organism, Soldier) and organism.birth_cycle == 0 and organism.age == 0
+        assert simulation._caste_index[CasteType.SOLDIER][organism_id] is organism
+    assert simulation.spawn(CasteType.SOLDIER, 0) == range(0)
+
+
+@pytest.mark.parametrize('store', ['array', 'cohort'])
+def test_bulk_spawn_into_a_store(store):
+    if store == 'array':
+        pytest.importorskip('numpy')
+    simulation = HiveSimulation(verbose=False, seed=1, store=store)
+    before = simulation.store.count(CasteType.WORKER)
+    ids = simulation.spawn(CasteType.WORKER, 100)
+    # The cohort store keeps counts only, so its organisms have no ids
+    assert len(ids) == (100 if store == 'array' else 0)
+    assert simulation.store.count(CasteType.WORKER) == before + 100
+    assert simulation.hive_state.population[CasteType.WORKER] == before + 100
@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+from constants.enums import ThreatLevel
+from simulation import HiveSimulation, StatusRenderer
+from simulation.bus import QueenDeath, ThreatChanged, HiveCollapse
+
+
+def test_refresh_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        StatusRenderer(HiveSimulation(verbose=False, seed=1), refresh_hz=0)
+
+
+def test_frame_reports_changes_since_the_previous_frame():
+    simulation = HiveSimulation(verbose=False, seed=2)
+    renderer = StatusRenderer(simulation)
+    for _ in range(10):
+        simulation.simulate_cycle()
+    stats = simulation.get_statistics()
+
+    frame = renderer.frame()
+    assert frame.startswith(f"[C{stats['total_cycles']}] pop {stats['total_population']}")
+    assert f"+{stats['total_births']} births, -{stats['total_deaths']} deaths since last frame (10 cycles" in frame
+    assert "+0 births, -0 deaths since last frame (0 cycles" in renderer.frame()
+
+
+def test_rare_events_are_coalesced_into_counts():
+    simulation = HiveSimulation(verbose=False, seed=2)
+    renderer = StatusRenderer(simulation)
+    renderer.attach()
+    events = simulation.events
+    for cycle in range(3):
+        events.publish(ThreatChanged(cycle, ThreatLevel.NONE, ThreatLevel.LOW, 'random'))
+    events.publish(QueenDeath(3, 1, 40))
+
+    frame = renderer.frame()
+    assert "3 threat changes, 1 queen death" in frame
+    assert "HIVE COLLAPSED" not in frame
+    assert "threat change" not in renderer.frame()
+
+    renderer.detach()
+    events.publish(ThreatChanged(4, ThreatLevel.LOW, ThreatLevel.NONE, 'random'))
+    assert "threat change" not in renderer.frame()
+    renderer.on_hive_collapse(HiveCollapse(5))
+    assert renderer.frame().endswith("HIVE COLLAPSED")
+
+
+def test_run_writes_frames_until_the_future_completes():
+    frames = []
+
+    async def scenario():
+        simulation = HiveSimulation(verbose=False, seed=2)
+        renderer = StatusRenderer(simulation, refresh_hz=200, write=frames.append)
+        done = asyncio.get_running_loop().create_future()
+        task = asyncio.create_task(renderer.run(until=done))
+        for _ in range(5):
+            simulation.simulate_cycle()
+            await asyncio.sleep(0.01)
+        done.set_result(None)
+        await asyncio.wait_for(task, 1)
+        return simulation
+
+    simulation = asyncio.run(scenario())
+    assert len(frames) >= 2
+    assert frames[-1].startswith(f"[C{simulation.cycle_count}]")
@@ -0,0 +1,48 @@
+import random
+import pytest
+from simulation import HiveSimulation, RandomStreams
+
+
+def _run(seed, store='object'):
+    simulation = HiveSimulation(verbose=False, store=store, seed=seed)
+    for _ in range(60):
+        if not simulation.simulate_cycle():
+            break
+    return dict(simulation.get_statistics())
+
+
+@pytest.mark.parametrize('store', ['object', 'array', 'cohort'])
+def test_same_seed_same_hive(store):
+    if store == 'array':
+        pytest.importorskip('numpy')
+    assert _run(21, store) == _run(21, store)
+
+
+def test_different_seeds_differ():
+    assert len({repr(_run(seed)) for seed in range(4)}) > 1
+
+
+def test_hives_leave_the_global_random_module_alone():
+    random.seed(99)
+    expected = random.getstate()
+    _run(3)
+    assert random.getstate() == expected
+
+
+def test_streams_are_independent_of_each_other():
+    a = RandomStreams(5)
+    b = RandomStreams(5)
+    b.stream('threat').random()
+    assert a.stream('births').random() == b.stream('births').random()
+    assert a.derive_seed('hive', 1) == b.derive_seed('hive', 1) != a.derive_seed('hive', 2)
+    assert a.spawn(3, 'workers').random() == b.spawn(3, 'workers').random()
+
+
+def test_stream_state_round_trips():
+    streams = RandomStreams(8)
+    streams.stream('aging').random()
+    state = streams.getstate()
+    expected = [streams.stream('aging').random() for _ in range(3)]
+    restored = RandomStreams(8)
+    restored.setstate(state)
+    assert [restored.stream('aging').random() for _ in range(3)] == expected
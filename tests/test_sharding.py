@@ -0,0 +1,52 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+from constants.enums import CasteType, ThreatLevel
+from entities import HiveState
+from simulation import HiveSimulation, blocks, shard_caste_phases
+from simulation.blocks import split_blocks, sum_repairs, sum_results
+
+POPULATION = {CasteType.QUEEN: 1, CasteType.WORKER: 4000, CasteType.SOLDIER: 1200, CasteType.CLEANER: 1200,
+              CasteType.BREEDER: 20, CasteType.BIO_ARCHITECT: 800}
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    # Every acting caste spans several blocks
+    monkeypatch.setattr(blocks, 'BLOCK_SIZE', 300)
+
+
+def _run(store: str, executor=None, sharded: bool = True) -> dict:
+    simulation = HiveSimulation(verbose=False, store=store, seed=7, population=POPULATION)
+    if sharded:
+        shard_caste_phases(simulation.pipeline, executor)
+    for _ in range(8):
+        simulation.simulate_cycle()
+    return dict(simulation.get_statistics())
+
+
+@pytest.mark.parametrize('store', ['object', 'array', 'cohort'])
+def test_sharded_matches_default_pipeline(store):
+    if store == 'array':
+        pytest.importorskip('numpy')
+    serial = _run(store, sharded=False)
+    assert _run(store) == serial
+    with ThreadPoolExecutor(max_workers=3) as threads:
+        assert _run(store, threads) == serial
+    with ProcessPoolExecutor(max_workers=2) as processes:
+        assert _run(store, processes) == serial
+
+
+def test_split_blocks_keeps_counts_and_order():
+    groups = [(1.0, 5), (0.5, 2), (0.25, 7)]
+    split = split_blocks(groups, 4)
+    assert split == [[(1.0, 4)], [(1.0, 1), (0.5, 2), (0.25, 1)], [(0.25, 4)], [(0.25, 2)]]
+    assert split_blocks([], 4) == [[]]
+    assert split_blocks(groups, 100) == [groups]
+
+
+def test_reducers():
+    state = HiveState(structural_integrity=90)
+    assert sum_repairs([{'repair_applied': 6}, {'repair_applied': 8}], state) == {'repair_applied': 10}
+    total = sum_results([{'food_gathered': 3, 'threat_detected': ThreatLevel.MEDIUM},
+                         {'food_gathered': 4, 'threat_detected': ThreatLevel.LOW}], state)
+    assert total == {'food_gathered': 7, 'threat_detected': ThreatLevel.MEDIUM}
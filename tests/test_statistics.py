@@ -0,0 +1,62 @@
+import copy
+import pickle
+import threading
+from collections.abc import Mapping
+import pytest
+from simulation import HiveSimulation
+
+
+def _advance(simulation: HiveSimulation, cycles: int):
+    for _ in range(cycles):
+        if not simulation.simulate_cycle():
+            break
+    return simulation.get_statistics()
+
+
+def test_simulation_survives_pickle_and_deepcopy():
+    original = HiveSimulation(verbose=False, seed=5)
+    _advance(original, 10)
+    for copied in (pickle.loads(pickle.dumps(original)), copy.deepcopy(original)):
+        assert copied.get_statistics() == original.get_statistics()
+        assert _advance(copied, 20) == _advance(copy.deepcopy(original), 20)
+
+
+def test_statistics_are_read_only():
+    simulation = HiveSimulation(verbose=False, seed=5, profile=True)
+    simulation.simulate_cycle()
+    stats = simulation.get_statistics()
+    with pytest.raises(TypeError):
+        stats['current_food'] = 0
+    with pytest.raises(TypeError):
+        stats['population_by_caste']['Worker'] = 0
+    with pytest.raises(TypeError):
+        stats['phase_timings']['workers'] = (0.0, 0)
+
+
+def test_a_snapshot_never_changes_underneath_its_reader():
+    simulation = HiveSimulation(verbose=False, seed=5)
+    simulation.simulate_cycle()
+    stats = simulation.get_statistics()
+    before = {key: dict(value) if isinstance(value, Mapping) else value for key, value in stats.items()}
+    _advance(simulation, 10)
+    assert dict(stats) == before
+    assert simulation.get_statistics()['total_cycles'] == stats['total_cycles'] + 10
+
+
+def test_readers_on_other_threads_see_whole_cycles():
+    simulation = HiveSimulation(verbose=False, seed=5)
+    done = threading.Event()
+    torn = []
+
+    def read():
+        while not done.is_set():
+            stats = simulation.get_statistics()
+            if stats['total_population'] != sum(stats['population_by_caste'].values()):
+                torn.append(stats)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    _advance(simulation, 200)
+    done.set()
+    reader.join()
+    assert not torn
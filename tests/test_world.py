@@ -0,0 +1,9 @@
+from simulation import HiveWorld
+
+
+def test_world_is_reproducible_from_its_seed():
+    def run():
+        world = HiveWorld(12, seed=4)
+        world.run(30)
+        return world.get_statistics()
+    assert run() == run()